@@ -0,0 +1,47 @@
+"""迷宫生成与求解引擎
+
+引擎不依赖 tkinter，图形界面在 maze.gui 中，只有启动界面时才导入。
+包级名称按需从子模块加载，import maze 本身几乎不耗时：
+
+    from maze import Maze, GENERATORS, SOLVERS
+    maze = Maze(100, 100)
+    GENERATORS["Kruskal"](maze, seed=42)
+    SOLVERS["BFS"](maze)
+
+子模块：core（数据结构）、generators、solvers、index（路径索引）、
+render（绘制辅助）、jobs（后台任务）、io（.maze 文件）、analysis（结构
+指标）、batch（多进程批量生成）、cache、service（HTTP服务）、loadgen、
+benchmark、instrument、cli（python -m maze）、gui。
+"""
+import importlib
+
+# 包级名称 -> 定义它的子模块
+_EXPORTS = {
+    "WALL_TOP": "core", "WALL_RIGHT": "core", "WALL_BOTTOM": "core", "WALL_LEFT": "core",
+    "ALL_WALLS": "core", "PROGRESS_INTERVAL": "core", "SEED_LIMIT": "core",
+    "Maze": "core", "DisjointSet": "core", "CountingDisjointSet": "core",
+    "load_numpy": "core", "make_rng": "core", "sealed_walls": "core", "move_table": "core",
+    "trace_path": "core", "tree_depth": "core",
+    "MazeGenerator": "generators", "GENERATORS": "generators",
+    "STEP_GENERATORS": "generators", "MAX_RECURSIVE_DFS_CELLS": "generators",
+    "MazeSolver": "solvers", "SOLVERS": "solvers", "STEP_SOLVERS": "solvers",
+    "record_search": "solvers",
+    "MazeIndex": "index",
+    "wall_segments": "render", "overview_levels": "render",
+    "Job": "jobs", "JobCancelled": "jobs",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
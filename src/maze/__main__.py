@@ -0,0 +1,6 @@
+"""python -m maze：无界面的命令行工具，见 maze.cli"""
+import sys
+
+from .cli import run
+
+sys.exit(run())
@@ -0,0 +1,160 @@
+"""迷宫结构分析：距离场、死路、分支因子、直径和通道统计
+
+analyze 一次算出全部指标，只对墙体做两遍BFS（MazeSolver.bfs_tree）：
+
+- 度数（每格可通行方向数）用 bytes.translate 查表一次得到，死路、岔路、
+  通道格子的计数都是在度数字节串上的 count，不再逐格扫描；
+- 第一遍BFS从起点出发，得到距离场、最远格子和生成树；
+- 第二遍BFS从最远格子出发，其最远格子与它构成最长路径（双BFS求树的直径）；
+- 通道（连续的度数为 2 的格子）沿第一遍BFS的父指针归并，NumPy 可用时用
+  指针倍增向量化完成，否则退回一次线性扫描。
+
+完美迷宫（生成树）上各项指标都是精确的；带环的迷宫上直径为下界，
+通道按BFS生成树划分。只统计与起点连通的区域。
+
+place_on_diameter 用同样的双BFS把起终点放到最长路径两端，得到最难的起终点对。
+"""
+from array import array
+
+from .core import ALL_WALLS, load_numpy, sealed_walls
+from .solvers import MazeSolver
+
+# 起终点的放置方式：默认的对角，或最长路径（直径）的两端
+ENDPOINT_MODES = ("corners", "diameter")
+
+# 墙体位 -> 可通行方向数
+DEGREE = bytes(4 - bin(bits & ALL_WALLS).count("1") for bits in range(256))
+
+
+def degree_map(maze):
+    """每个格子的可通行方向数（外圈墙视为封闭），按格子编号排列的字节串"""
+    return sealed_walls(maze).translate(DEGREE)
+
+
+def distance_map(maze, origin=None):
+    """从 origin（默认起点）到每个格子的最短步数，不可达为 -1"""
+    return MazeSolver.bfs_tree(maze, origin)[1]
+
+
+def diameter(maze, origin=None):
+    """双BFS求最长路径，返回 (步数, 端点, 端点)，端点为 (y, x)
+
+    第一遍从 origin（默认起点）出发找到最远格子 a，第二遍从 a 出发找到最远格子 b，
+    树上 a、b 之间的路径即为直径。
+    """
+    order = MazeSolver.bfs_tree(maze, origin)[0]
+    return _diameter_from(maze, order[-1])
+
+
+def place_on_diameter(maze, origin=None):
+    """把起点和终点移到最长路径的两端，返回两端之间的步数
+
+    原来的出入口重新封闭；新端点位于外圈时打通朝外的一面墙，在内部则不开口。
+    (y, x) 较小的一端作为起点。已有的路径失效，会被清空。
+    """
+    length, first, second = diameter(maze, origin)
+    maze.close_entrances()
+    maze.start, maze.end = sorted((first, second))
+    maze.open_entrances()
+    maze.path = []
+    return length
+
+
+def _diameter_from(maze, farthest):
+    width = maze.width
+    order, distance, _ = MazeSolver.bfs_tree(maze, divmod(farthest, width))
+    return distance[order[-1]], divmod(farthest, width), divmod(order[-1], width)
+
+
+def corridor_lengths(degrees, order, parent):
+    """通道长度列表：每条通道是BFS树上一段连续的度数为 2 的格子
+
+    度数为 2 的格子在树上至多有一个子节点（根除外，根的两个子节点都指向它），
+    因此沿父指针追溯到通道最上端的格子即可为整条通道编号。
+    """
+    np = load_numpy()
+    if np is None:
+        top = {}
+        sizes = {}
+        for cell in order:
+            if degrees[cell] == 2:
+                above = parent[cell]
+                label = top[above] if above >= 0 and degrees[above] == 2 else cell
+                top[cell] = label
+                sizes[label] = sizes.get(label, 0) + 1
+        return sorted(sizes.values())
+
+    reached = np.frombuffer(array('i', order), dtype=np.intc)
+    corridor = np.zeros(len(degrees), dtype=np.bool_)
+    corridor[reached] = np.frombuffer(degrees, dtype=np.uint8)[reached] == 2
+    parent = np.frombuffer(parent, dtype=np.intc).astype(np.int64)
+    cells = np.arange(len(degrees), dtype=np.int64)
+    chained = corridor & (parent >= 0)
+    chained[chained] = corridor[parent[chained]]
+    # 指针倍增：每轮跳过的距离翻倍，轮数为最长通道长度的对数
+    top = np.where(chained, parent, cells)
+    while True:
+        jumped = top[top]
+        if np.array_equal(jumped, top):
+            break
+        top = jumped
+    sizes = np.bincount(top[corridor], minlength=len(degrees))
+    return np.sort(sizes[sizes > 0]).tolist()
+
+
+def analyze(maze, origin=None):
+    """计算迷宫的全部结构指标，返回字典
+
+    distances 为从 origin（默认起点）出发的距离场 array('i')，其余值均可直接
+    序列化为JSON：
+        reachable         与起点连通的格子数
+        dead_ends         死路（只有一个方向可走）数
+        junctions         岔路（三个及以上方向）数
+        degree_counts     度数为 0..4 的格子数
+        branching_factor  岔路处平均可选的前进方向数（不含来路）
+        solution_length   起点到终点的步数，不连通为 None
+        max_distance      距起点最远的步数，mean_distance 为平均步数
+        diameter          最长路径的步数，diameter_ends 为其两端
+        corridors         通道条数，corridor_mean / corridor_max 为平均/最长通道格子数，
+                          corridor_fraction 为通道格子占连通格子的比例
+    """
+    width = maze.width
+    degrees = degree_map(maze)
+    order, distances, parent = MazeSolver.bfs_tree(maze, origin)
+    reachable = len(order)
+    if reachable < len(degrees):
+        # 只统计连通区域
+        connected = bytearray(len(degrees))
+        for cell in order:
+            connected[cell] = 1
+        degrees = bytes(degree if keep else 0 for degree, keep in zip(degrees, connected))
+
+    degree_counts = [degrees.count(degree) for degree in range(5)]
+    degree_counts[0] -= len(degrees) - reachable
+    junctions = degree_counts[3] + degree_counts[4]
+    branching = 2 * degree_counts[3] + 3 * degree_counts[4]
+
+    end = maze.end[0] * width + maze.end[1]
+    length, first, second = _diameter_from(maze, order[-1])
+    corridors = corridor_lengths(degrees, order, parent)
+    corridor_cells = sum(corridors)
+    return {
+        "width": width,
+        "height": maze.height,
+        "reachable": reachable,
+        "dead_ends": degree_counts[1],
+        "junctions": junctions,
+        "degree_counts": degree_counts,
+        "branching_factor": branching / junctions if junctions else 0.0,
+        "solution_length": distances[end] if distances[end] >= 0 else None,
+        "max_distance": distances[order[-1]],
+        # 不可达格子的距离为 -1，加回后即为连通格子的距离之和
+        "mean_distance": (sum(distances) + len(degrees) - reachable) / reachable,
+        "diameter": length,
+        "diameter_ends": [list(first), list(second)],
+        "corridors": len(corridors),
+        "corridor_mean": corridor_cells / len(corridors) if corridors else 0.0,
+        "corridor_max": corridors[-1] if corridors else 0,
+        "corridor_fraction": corridor_cells / reachable,
+        "distances": distances,
+    }
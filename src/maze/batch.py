@@ -0,0 +1,101 @@
+"""多进程批量生成迷宫
+
+生成器是纯Python的CPU密集型代码，受GIL限制，线程无法并行。
+generate_batch 把 (尺寸, 算法, 种子) 任务分块分发到 ProcessPoolExecutor，
+结果以 maze_io.dumps 的紧凑字节串返回，可用 maze_io.loads 还原。
+"""
+import os
+import random
+
+from . import io as maze_io
+from .analysis import ENDPOINT_MODES, place_on_diameter
+from .core import Maze
+from .generators import GENERATORS
+
+# 64 位黄金比例常数，用于从基础种子派生互不相同的任务种子
+_SEED_STEP = 0x9E3779B97F4A7C15
+
+
+def derive_seed(base_seed, index):
+    """由基础种子和任务序号确定性地派生任务种子"""
+    return (base_seed + (index + 1) * _SEED_STEP) % 2 ** 64
+
+
+def normalize_specs(specs, base_seed):
+    """把 (宽, 高, 算法[, 种子]) 规范化为 (序号, 宽, 高, 算法, 种子)"""
+    tasks = []
+    for index, spec in enumerate(specs):
+        if len(spec) == 3:
+            width, height, algorithm = spec
+            seed = None
+        else:
+            width, height, algorithm, seed = spec
+        if algorithm not in GENERATORS:
+            raise ValueError(f"未知的生成算法: {algorithm}")
+        if seed is None:
+            seed = derive_seed(base_seed, index)
+        tasks.append((index, width, height, algorithm, seed))
+    return tasks
+
+
+def generate_one(width, height, algorithm, seed, endpoints="corners"):
+    """按 (尺寸, 算法, 种子) 生成迷宫，同一组参数总是得到逐位相同的结果
+
+    endpoints 为 "diameter" 时把起终点放到最长路径的两端（见 analysis.place_on_diameter）。
+    不修改全局随机状态，可在多个线程中并发调用。
+    """
+    if endpoints not in ENDPOINT_MODES:
+        raise ValueError(f"未知的起终点放置方式: {endpoints}")
+    maze = Maze(width, height)
+    maze.algorithm = algorithm     # 生成器可改写为实际使用的算法
+    GENERATORS[algorithm](maze, seed=seed)
+    if endpoints == "diameter":
+        place_on_diameter(maze)
+    return maze
+
+
+def _generate_chunk(tasks, endpoints="corners"):
+    return [(index, maze_io.dumps(generate_one(width, height, algorithm, seed, endpoints)))
+            for index, width, height, algorithm, seed in tasks]
+
+
+def generate_batch(specs, workers=None, ordered=True, chunksize=8, base_seed=None,
+                   endpoints="corners"):
+    """批量生成迷宫，逐个产出 (序号, 序列化字节串)
+
+    specs: 可迭代的 (宽, 高, 算法) 或 (宽, 高, 算法, 种子)；未给出种子的任务
+        由 base_seed 和序号派生，因此同一 base_seed 的结果完全可复现。
+    workers: 进程数，默认为CPU核数；0 表示在当前进程内顺序执行。
+    ordered: True 按输入顺序产出，False 按完成顺序产出。
+    chunksize: 每次分发给工作进程的任务数，用于摊薄进程间通信开销。
+    endpoints: 起终点的放置方式，见 generate_one。
+    """
+    if endpoints not in ENDPOINT_MODES:
+        raise ValueError(f"未知的起终点放置方式: {endpoints}")
+    if base_seed is None:
+        base_seed = random.SystemRandom().getrandbits(64)
+    tasks = normalize_specs(specs, base_seed)
+    chunks = [tasks[i:i + chunksize] for i in range(0, len(tasks), chunksize)]
+
+    if workers == 0:
+        for chunk in chunks:
+            yield from _generate_chunk(chunk, endpoints)
+        return
+
+    # 进程池模块导入较慢（约 30ms），只在真正需要多进程时才导入
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    from functools import partial
+
+    executor = ProcessPoolExecutor(max_workers=workers or os.cpu_count())
+    generate_chunk = partial(_generate_chunk, endpoints=endpoints)
+    try:
+        if ordered:
+            for results in executor.map(generate_chunk, chunks):
+                yield from results
+        else:
+            futures = [executor.submit(generate_chunk, chunk) for chunk in chunks]
+            for future in as_completed(futures):
+                yield from future.result()
+    finally:
+        # 调用方提前停止迭代时取消尚未开始的任务
+        executor.shutdown(wait=True, cancel_futures=True)
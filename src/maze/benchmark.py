@@ -0,0 +1,398 @@
+"""迷宫生成与求解的基准测试
+
+每个测试用例分三个阶段分别计时：分配（构造 Maze）、生成、求解，结构分析
+（analyze）为可选阶段。计时使用 time.perf_counter_ns，正式采样前先做预热，
+采样期间关闭垃圾回收；结果报告中位数、p95、均值和标准差。run_benchmark
+的结果可保存为JSON，再用 compare 与保存的基线对比以发现性能回退。
+
+命令行用法：
+    python -m maze.benchmark --max-size 500 --repeat 7 --output result.json
+    python -m maze.benchmark --baseline result.json   # 与基线对比，有回退时退出码为 1
+    python -m maze.benchmark --sizes 1000x1000,2000x2000 --phases analyze
+"""
+import gc
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+from .core import Maze, load_numpy
+from .generators import GENERATORS, MAX_RECURSIVE_DFS_CELLS
+from .solvers import SOLVERS
+
+# 默认的尺寸扫描序列
+SIZE_SWEEP = [(10, 10), (25, 25), (50, 50), (100, 100), (250, 250),
+              (500, 500), (1000, 1000), (2000, 2000)]
+
+PHASES = ("alloc", "generate", "solve")
+
+# 可选阶段：需要时用 --phases 显式指定
+OPTIONAL_PHASES = ("analyze",)
+
+# 随机游走类的均匀生成树算法在大尺寸上要数秒，默认不测，需要时用 --generators 点名
+SLOW_GENERATORS = ("Wilson", "Aldous-Broder")
+
+# 单个样本的最短时长，更快的操作会在一个样本内重复调用多次
+MIN_SAMPLE_NS = 2_000_000
+
+# 求解和分析阶段使用的迷宫统一由该算法生成
+SOLVE_MAZE_GENERATOR = "Kruskal"
+
+# 分析阶段的用例名：analysis.analyze 一次计算全部指标
+ANALYZE_CASE = "全部指标"
+
+# 导入耗时测试的模块：包本身、命令行入口和图形界面
+IMPORT_MODULES = ("maze", "maze.cli", "maze.gui")
+
+
+def sweep(max_size=None, min_size=None):
+    """返回边长在 [min_size, max_size] 内的扫描尺寸"""
+    return [(width, height) for width, height in SIZE_SWEEP
+            if (max_size is None or max(width, height) <= max_size)
+            and (min_size is None or min(width, height) >= min_size)]
+
+
+def summarize(samples):
+    """样本（纳秒）的统计量：中位数、p95（最近秩）、均值、标准差、最小、最大值"""
+    ordered = sorted(samples)
+    count = len(ordered)
+    return {
+        "n": count,
+        "median": statistics.median(ordered),
+        "p95": ordered[max(0, math.ceil(0.95 * count) - 1)],
+        "mean": statistics.fmean(ordered),
+        "stddev": statistics.stdev(ordered) if count > 1 else 0.0,
+        "min": ordered[0],
+        "max": ordered[-1],
+    }
+
+
+def measure(func, setup=None, repeat=5, warmup=1, number=None, before_sample=None):
+    """对 func(setup()) 采样 repeat 次，返回每次调用的平均耗时（纳秒）列表
+
+    每个样本连续调用 number 次取平均，number 为 None 时自动选择，使单个样本
+    不短于 MIN_SAMPLE_NS，避免计时器精度和冷缓存主导微秒级的操作。
+    setup 和 before_sample(样本序号) 的耗时不计入；前 warmup 个样本丢弃；
+    计时期间关闭垃圾回收。
+    """
+    if number is None:
+        number = calibrate(func, setup)
+    samples = []
+    gc_was_enabled = gc.isenabled()
+    try:
+        for i in range(warmup + repeat):
+            arguments = [setup() if setup is not None else None for _ in range(number)]
+            if before_sample is not None:
+                before_sample(i)
+            gc.collect()
+            gc.disable()
+            start = time.perf_counter_ns()
+            for argument in arguments:
+                func(argument)
+            elapsed = time.perf_counter_ns() - start
+            if gc_was_enabled:
+                gc.enable()
+            if i >= warmup:
+                samples.append(elapsed / number)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return samples
+
+
+def calibrate(func, setup=None, max_number=1000):
+    """估计使单个样本不短于 MIN_SAMPLE_NS 所需的调用次数"""
+    argument = setup() if setup is not None else None
+    start = time.perf_counter_ns()
+    func(argument)
+    elapsed = max(1, time.perf_counter_ns() - start)
+    return max(1, min(max_number, math.ceil(MIN_SAMPLE_NS / elapsed)))
+
+
+def measure_import(module, repeat=5):
+    """在全新的解释器中导入 module，返回 (每次导入耗时的纳秒列表, 导入后加载的模块名集合)
+
+    每次都启动新进程，测到的是冷启动的真实开销，不含解释器自身的启动时间。
+    """
+    code = ("import sys, time; start = time.perf_counter_ns(); "
+            f"import {module}; elapsed = time.perf_counter_ns() - start; "
+            "print(elapsed); print(' '.join(sorted(sys.modules)))")
+    package_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    samples = []
+    for _ in range(repeat):
+        result = subprocess.run([sys.executable, "-c", code], cwd=package_root,
+                                capture_output=True, text=True, check=True)
+        elapsed, modules = result.stdout.splitlines()
+        samples.append(int(elapsed))
+    return samples, set(modules.split())
+
+
+def plan_cases(sizes, generators=None, solvers=None, phases=PHASES):
+    """展开为 (阶段, 算法, 宽, 高) 列表；递归DFS跳过超出栈限制的尺寸
+
+    generators 默认为 SLOW_GENERATORS 以外的全部生成算法。
+    """
+    if generators is None:
+        generators = [name for name in GENERATORS if name not in SLOW_GENERATORS]
+    generators = list(generators)
+    solvers = list(SOLVERS) if solvers is None else list(solvers)
+    for name in generators:
+        if name not in GENERATORS:
+            raise ValueError(f"未知的生成算法: {name}")
+    for name in solvers:
+        if name not in SOLVERS:
+            raise ValueError(f"未知的求解算法: {name}")
+    for phase in phases:
+        if phase not in PHASES + OPTIONAL_PHASES:
+            raise ValueError(f"未知的阶段: {phase}")
+
+    cases = []
+    for width, height in sizes:
+        if "alloc" in phases:
+            cases.append(("alloc", "Maze", width, height))
+        if "generate" in phases:
+            for name in generators:
+                if name == "DFS" and width * height > MAX_RECURSIVE_DFS_CELLS:
+                    continue
+                cases.append(("generate", name, width, height))
+        if "solve" in phases:
+            for name in solvers:
+                cases.append(("solve", name, width, height))
+        if "analyze" in phases:
+            cases.append(("analyze", ANALYZE_CASE, width, height))
+    return cases
+
+
+def run_case(phase, algorithm, width, height, repeat=5, warmup=1, seed=0):
+    """运行单个用例，返回采样列表（纳秒）"""
+    if phase == "alloc":
+        return measure(lambda _: Maze(width, height), repeat=repeat, warmup=warmup)
+
+    if phase == "generate":
+        # 第 i 个样本使用种子 seed + i，同一种子下的样本完全可复现
+        generate = GENERATORS[algorithm]
+        sample_seed = seed
+        def before_sample(i):
+            nonlocal sample_seed
+            sample_seed = seed + i
+        return measure(lambda maze: generate(maze, seed=sample_seed),
+                       lambda: Maze(width, height), repeat=repeat, warmup=warmup,
+                       before_sample=before_sample)
+
+    if phase == "solve":
+        # 同一个迷宫反复求解，求解不修改墙体
+        maze = Maze(width, height)
+        GENERATORS[SOLVE_MAZE_GENERATOR](maze, seed=seed)
+        solve = SOLVERS[algorithm]
+        return measure(lambda _: solve(maze), repeat=repeat, warmup=warmup)
+
+    if phase == "analyze":
+        from .analysis import analyze
+        maze = Maze(width, height)
+        GENERATORS[SOLVE_MAZE_GENERATOR](maze, seed=seed)
+        return measure(lambda _: analyze(maze), repeat=repeat, warmup=warmup)
+
+    raise ValueError(f"未知的阶段: {phase}")
+
+
+def run_benchmark(sizes=None, generators=None, solvers=None, phases=PHASES,
+                  repeat=5, warmup=1, seed=0, progress=None):
+    """运行完整基准测试，返回可直接序列化为JSON的结果
+
+    sizes 默认为 sweep(500)；progress(已完成用例数, 用例总数) 在每个用例结束后调用。
+    """
+    if sizes is None:
+        sizes = sweep(500)
+    cases = plan_cases(sizes, generators, solvers, phases)
+    results = []
+    for done, (phase, algorithm, width, height) in enumerate(cases, 1):
+        samples = run_case(phase, algorithm, width, height, repeat, warmup, seed)
+        results.append({
+            "phase": phase,
+            "algorithm": algorithm,
+            "width": width,
+            "height": height,
+            "samples_ns": samples,
+            "stats": summarize(samples),
+        })
+        if progress is not None:
+            progress(done, len(cases))
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "numpy": load_numpy().__version__ if load_numpy() is not None else None,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "repeat": repeat,
+            "warmup": warmup,
+            "seed": seed,
+        },
+        "results": results,
+    }
+
+
+def case_key(result):
+    return (result["phase"], result["algorithm"], result["width"], result["height"])
+
+
+def compare(current, baseline, threshold=0.10):
+    """按中位数与基线对比
+
+    返回 [(用例键, 基线中位数, 当前中位数, 比值, 状态)]，状态为
+    "regression"（慢于基线超过 threshold）、"improvement"（快于基线超过
+    threshold）或 "ok"；基线中没有的用例不参与比较。
+    """
+    baseline_medians = {case_key(result): result["stats"]["median"]
+                        for result in baseline["results"]}
+    rows = []
+    for result in current["results"]:
+        key = case_key(result)
+        if key not in baseline_medians:
+            continue
+        old = baseline_medians[key]
+        new = result["stats"]["median"]
+        ratio = new / old if old else float("inf")
+        if ratio > 1 + threshold:
+            status = "regression"
+        elif ratio < 1 - threshold:
+            status = "improvement"
+        else:
+            status = "ok"
+        rows.append((key, old, new, ratio, status))
+    return rows
+
+
+def format_duration(ns):
+    if ns >= 1e9:
+        return f"{ns / 1e9:.3f}s"
+    if ns >= 1e6:
+        return f"{ns / 1e6:.2f}ms"
+    return f"{ns / 1e3:.1f}us"
+
+
+def format_report(result):
+    """按用例输出统计表"""
+    lines = [f"{'阶段':<10}{'算法':<15}{'尺寸':<12}{'中位数':>10}{'p95':>10}"
+             f"{'标准差':>10}{'格/秒':>14}"]
+    lines.append("-" * 80)
+    for row in result["results"]:
+        stats = row["stats"]
+        cells = row["width"] * row["height"]
+        rate = cells / (stats["median"] / 1e9) if stats["median"] else 0
+        lines.append(f"{row['phase']:<10}{row['algorithm']:<15}"
+                     f"{row['width']}x{row['height']:<8}"
+                     f"{format_duration(stats['median']):>10}"
+                     f"{format_duration(stats['p95']):>10}"
+                     f"{format_duration(stats['stddev']):>10}"
+                     f"{rate:>14,.0f}")
+    meta = result["meta"]
+    lines.append("-" * 80)
+    lines.append(f"Python {meta['python']} ({meta['implementation']}), "
+                 f"NumPy {meta['numpy'] or '未安装'}, "
+                 f"重复 {meta['repeat']} 次，预热 {meta['warmup']} 次")
+    return "\n".join(lines)
+
+
+def format_comparison(rows):
+    lines = [f"{'阶段':<10}{'算法':<15}{'尺寸':<12}{'基线':>10}{'当前':>10}{'比值':>8}  状态"]
+    lines.append("-" * 80)
+    for (phase, algorithm, width, height), old, new, ratio, status in rows:
+        lines.append(f"{phase:<10}{algorithm:<15}{width}x{height:<8}"
+                     f"{format_duration(old):>10}{format_duration(new):>10}"
+                     f"{ratio:>8.2f}  {status}")
+    return "\n".join(lines)
+
+
+def save_json(result, path):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(result, f, ensure_ascii=False, indent=1)
+
+
+def load_json(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def parse_sizes(text):
+    """解析 "50x50,100x200" 形式的尺寸列表"""
+    sizes = []
+    for item in text.split(","):
+        width, _, height = item.strip().lower().partition("x")
+        sizes.append((int(width), int(height or width)))
+    return sizes
+
+
+def main(argv=None):
+    import argparse
+    from .cli import parse_seed
+
+    parser = argparse.ArgumentParser(description="迷宫生成与求解基准测试")
+    parser.add_argument("--sizes", type=parse_sizes,
+                        help="尺寸列表，如 50x50,100x100；默认使用扫描序列")
+    parser.add_argument("--max-size", type=int, default=500, help="扫描序列的最大边长")
+    parser.add_argument("--generators",
+                        help=f"逗号分隔的生成算法，默认除 {'、'.join(SLOW_GENERATORS)} 外的全部")
+    parser.add_argument("--solvers", help="逗号分隔的求解算法，默认全部")
+    parser.add_argument("--phases", default=",".join(PHASES),
+                        help=f"要测试的阶段，可选 {','.join(PHASES + OPTIONAL_PHASES)}")
+    parser.add_argument("--repeat", type=int, default=5, help="每个用例的采样次数")
+    parser.add_argument("--warmup", type=int, default=1, help="每个用例的预热次数")
+    parser.add_argument("--seed", type=parse_seed, default=0, help="随机种子")
+    parser.add_argument("--output", help="把结果保存为JSON")
+    parser.add_argument("--baseline", help="与保存的JSON基线对比")
+    parser.add_argument("--imports", action="store_true",
+                        help="只测试各入口模块的冷启动导入耗时")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="中位数变慢超过该比例视为回退")
+    args = parser.parse_args(argv)
+    if args.repeat < 1:
+        parser.error("--repeat 必须为正整数")
+    if args.warmup < 0:
+        parser.error("--warmup 不能为负数")
+    phases = tuple(args.phases.split(","))
+    unknown = [phase for phase in phases if phase not in PHASES + OPTIONAL_PHASES]
+    if unknown:
+        parser.error(f"未知的阶段: {', '.join(unknown)}"
+                     f"（可选 {', '.join(PHASES + OPTIONAL_PHASES)}）")
+
+    if args.imports:
+        for module in IMPORT_MODULES:
+            samples, modules = measure_import(module, args.repeat)
+            heavy = sorted({"tkinter", "numpy"} & modules)
+            print(f"{module:<12}{format_duration(statistics.median(samples)):>10}"
+                  f"  {'加载了 ' + ', '.join(heavy) if heavy else ''}")
+        return 0
+
+    result = run_benchmark(
+        sizes=args.sizes or sweep(args.max_size),
+        generators=args.generators.split(",") if args.generators else None,
+        solvers=args.solvers.split(",") if args.solvers else None,
+        phases=phases,
+        repeat=args.repeat, warmup=args.warmup, seed=args.seed,
+        progress=lambda done, total: print(f"\r{done}/{total}", end="", file=sys.stderr))
+    print(file=sys.stderr)
+    print(format_report(result))
+
+    if args.output:
+        save_json(result, args.output)
+        print(f"结果已保存到: {args.output}")
+
+    if args.baseline:
+        rows = compare(result, load_json(args.baseline), args.threshold)
+        print()
+        print(format_comparison(rows))
+        regressions = [row for row in rows if row[4] == "regression"]
+        if regressions:
+            print(f"\n发现 {len(regressions)} 个性能回退")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,210 @@
+"""按生成参数寻址的迷宫与解缓存
+
+同一组 (宽, 高, 算法, 种子) 总是生成逐位相同的迷宫，因此可以用它作为键
+缓存生成结果，重复请求时不再调用生成器；每个迷宫还可按 (求解算法, 起点,
+终点) 缓存一条路径。内存层按字节数做LRU淘汰，可选的磁盘层把迷宫以 .maze
+文件保存在目录中，进程重启后仍然有效；即使两层都已淘汰，也总能按参数重新
+生成。起终点放在直径两端的迷宫另外缓存两端的位置，重复请求不再做两遍BFS。
+
+    cache = MazeCache(max_bytes=64 * 1024 * 1024, directory="maze-cache")
+    maze = cache.get_maze(1000, 1000, "Kruskal", seed=42)
+    maze = cache.solve(1000, 1000, "Kruskal", 42, solver="BFS")
+    print(cache.stats())
+"""
+import hashlib
+import os
+import threading
+from array import array
+from collections import OrderedDict
+
+from . import batch, io as maze_io
+from .analysis import ENDPOINT_MODES, place_on_diameter
+from .core import Maze
+from .solvers import SOLVERS
+
+# 每个条目在墙体/路径数据之外的估计开销（字节），用于容量计算
+ENTRY_OVERHEAD = 128
+
+
+class MazeCache:
+    """迷宫与路径的LRU缓存，按占用字节数限制容量，可在多个线程中共享
+
+    返回的迷宫都是独立的副本，调用方可以随意修改而不影响缓存内容。
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024, directory=None):
+        self.max_bytes = max_bytes
+        self.directory = directory
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+        self._entries = OrderedDict()  # 键 -> (数据, 字节数)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.counters = dict.fromkeys(
+            ("maze_hits", "maze_misses", "disk_hits", "generated",
+             "solution_hits", "solution_misses", "evictions"), 0)
+
+    # ---- 内存层 ----
+
+    def _lookup(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def _store(self, key, value, size):
+        size += ENTRY_OVERHEAD
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            if size > self.max_bytes:
+                return  # 单个条目超过总容量时不进入内存层
+            self._entries[key] = (value, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+                self.counters["evictions"] += 1
+
+    def _count(self, name):
+        with self._lock:
+            self.counters[name] += 1
+
+    # ---- 磁盘层 ----
+
+    def _disk_path(self, key):
+        digest = hashlib.sha256(repr(key).encode("utf-8")).hexdigest()[:32]
+        return os.path.join(self.directory, digest + ".maze")
+
+    def _load_from_disk(self, key):
+        if self.directory is None:
+            return None
+        path = self._disk_path(key)
+        try:
+            maze = maze_io.load_maze(path, lazy=False)
+        except (OSError, ValueError):
+            return None
+        width, height, algorithm, seed = key[1:]
+        if (maze.width, maze.height, maze.algorithm, maze.seed) != (width, height, algorithm, seed):
+            return None  # 摘要冲突或文件被替换
+        return maze
+
+    def _save_to_disk(self, key, maze):
+        if self.directory is None:
+            return
+        path = self._disk_path(key)
+        # 先写临时文件再改名，并发读取时不会看到写了一半的文件
+        temporary = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        maze_io.save_maze(maze, temporary)
+        os.replace(temporary, path)
+
+    # ---- 对外接口 ----
+
+    def get_maze(self, width, height, algorithm, seed=None, endpoints="corners"):
+        """返回 (宽, 高, 算法, 种子) 对应的迷宫副本
+
+        seed 为 None 时随机选取种子，生成的迷宫以其记录的 maze.seed 入缓存。
+        endpoints 为 "diameter" 时起终点放在最长路径两端（见 batch.generate_one）。
+        """
+        if endpoints not in ENDPOINT_MODES:
+            raise ValueError(f"未知的起终点放置方式: {endpoints}")
+        maze = self._get_maze(width, height, algorithm, seed)
+        if endpoints == "diameter":
+            self._place_on_diameter(("maze", width, height, algorithm, maze.seed, "diameter"), maze)
+        return maze
+
+    def _place_on_diameter(self, key, maze):
+        ends = self._lookup(key)
+        if ends is None:
+            place_on_diameter(maze)
+            self._store(key, (maze.start, maze.end), 0)
+            return
+        maze.close_entrances()
+        maze.start, maze.end = ends
+        maze.open_entrances()
+
+    def _get_maze(self, width, height, algorithm, seed):
+        if seed is not None:
+            key = ("maze", width, height, algorithm, seed)
+            entry = self._lookup(key)
+            if entry is not None:
+                self._count("maze_hits")
+                return self._make_maze(width, height, seed, *entry)
+
+            self._count("maze_misses")
+            maze = self._load_from_disk(key)
+            if maze is not None:
+                self._count("disk_hits")
+                self._store(key, (bytes(maze.walls), maze.algorithm), len(maze.walls))
+                return maze
+        else:
+            self._count("maze_misses")
+
+        maze = batch.generate_one(width, height, algorithm, seed)
+        self._count("generated")
+        key = ("maze", width, height, algorithm, maze.seed)
+        self._store(key, (bytes(maze.walls), maze.algorithm), len(maze.walls))
+        self._save_to_disk(key, maze)
+        return maze
+
+    @staticmethod
+    def _make_maze(width, height, seed, walls, algorithm):
+        maze = Maze(width, height, bytearray(walls))
+        maze.algorithm = algorithm
+        maze.seed = seed
+        return maze
+
+    def solve(self, width, height, algorithm, seed, solver="BFS", start=None, end=None):
+        """返回已求解的迷宫副本，maze.path 为空表示无解
+
+        start、end 默认为迷宫的左上角和右下角；同一迷宫的每对起终点各缓存一条路径。
+        """
+        if solver not in SOLVERS:
+            raise ValueError(f"未知的求解算法: {solver}")
+        maze = self.get_maze(width, height, algorithm, seed)
+        if start is not None:
+            maze.start = tuple(start)
+        if end is not None:
+            maze.end = tuple(end)
+
+        key = ("path", width, height, algorithm, maze.seed, solver, maze.start, maze.end)
+        cached = self._lookup(key)
+        if cached is not None:
+            self._count("solution_hits")
+            cells, maze.nodes_expanded = cached
+            maze.path = [divmod(cell, width) for cell in cells]
+            return maze
+
+        self._count("solution_misses")
+        if SOLVERS[solver](maze):
+            cells = array('i', [y * width + x for y, x in maze.path])
+        else:
+            maze.path = []
+            cells = array('i')
+        self._store(key, (cells, maze.nodes_expanded), cells.itemsize * len(cells))
+        return maze
+
+    def clear(self):
+        """清空内存层（磁盘层保留）"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        """命中率统计"""
+        with self._lock:
+            result = dict(self.counters)
+            result["entries"] = len(self._entries)
+            result["bytes"] = self._bytes
+        maze_requests = result["maze_hits"] + result["maze_misses"]
+        solution_requests = result["solution_hits"] + result["solution_misses"]
+        result["maze_hit_rate"] = result["maze_hits"] / maze_requests if maze_requests else 0.0
+        result["solution_hit_rate"] = (result["solution_hits"] / solution_requests
+                                       if solution_requests else 0.0)
+        return result
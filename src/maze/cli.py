@@ -0,0 +1,294 @@
+"""无界面的命令行工具：批量生成、求解、分析迷宫和运行基准测试
+
+不导入 tkinter，NumPy 也只在用到向量化算法时才加载，可在无显示的服务器上运行：
+
+    python -m maze generate --size 200x100 --algorithm Kruskal --seed 42 -o maze.maze
+    python -m maze generate --size 50 --count 100 --seed 1 -o mazes/    # 目录：每个迷宫一个文件
+    python -m maze generate --size 500 --endpoints diameter -o hard.maze  # 起终点取最长路径两端
+    python -m maze generate --size 50 --count 100 --seed 1 | python -m maze solve - --format json
+    python -m maze solve maze.maze --solver A* --format text
+    python -m maze solve --size 100x100 --algorithm Prim --seed 7
+    python -m maze analyze maze.maze --format json
+    python -m maze bench --max-size 250 --repeat 3
+    python -m maze serve --port 8080 --workers 4
+
+generate 默认把二进制 .maze 记录写到标准输出，多条记录首尾相接，solve 可从
+标准输入（"-"）逐条读取；--format json 每行输出一个JSON对象，text 输出字符画。
+"""
+import argparse
+import json
+import os
+import sys
+
+from . import batch, io as maze_io
+from .analysis import ENDPOINT_MODES
+from .core import SEED_LIMIT, WALL_TOP, WALL_RIGHT, WALL_BOTTOM, WALL_LEFT
+from .generators import GENERATORS, MAX_RECURSIVE_DFS_CELLS
+from .solvers import SOLVERS
+
+
+def parse_size(text):
+    """解析 "宽x高" 或单个边长"""
+    width, _, height = text.lower().partition("x")
+    try:
+        width, height = int(width), int(height or width)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"无效的尺寸: {text}") from None
+    if width < 1 or height < 1:
+        raise argparse.ArgumentTypeError(f"无效的尺寸: {text}")
+    return width, height
+
+
+def parse_seed(text):
+    """解析随机种子：64 位无符号整数"""
+    try:
+        seed = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"无效的随机种子: {text}") from None
+    if not 0 <= seed < SEED_LIMIT:
+        raise argparse.ArgumentTypeError(f"随机种子必须在 [0, 2**64) 范围内: {text}")
+    return seed
+
+
+def to_text(maze):
+    """字符画：+ 为墙角，--- 和 | 为墙，路径上的格子标记为 *"""
+    width, walls = maze.width, maze.walls
+    lines = []
+    for y in range(maze.height):
+        row = walls[y * width:(y + 1) * width]
+        lines.append("".join("+---" if cell & WALL_TOP else "+   " for cell in row) + "+")
+        line = []
+        for x, cell in enumerate(row):
+            mark = " * " if maze.path and maze.on_path(y, x) else "   "
+            line.append(("|" if cell & WALL_LEFT else " ") + mark)
+        line.append("|" if row[-1] & WALL_RIGHT else " ")
+        lines.append("".join(line))
+    lines.append("".join("+---" if cell & WALL_BOTTOM else "+   "
+                         for cell in walls[(maze.height - 1) * width:]) + "+")
+    return "\n".join(lines)
+
+
+def describe(maze):
+    """迷宫的元数据字典，用于JSON输出"""
+    return {
+        "width": maze.width,
+        "height": maze.height,
+        "algorithm": maze.algorithm,
+        "seed": maze.seed,
+        "start": list(maze.start),
+        "end": list(maze.end),
+    }
+
+
+def open_output(path, binary):
+    if path in (None, "-"):
+        return sys.stdout.buffer if binary else sys.stdout
+    return open(path, "wb" if binary else "w", encoding=None if binary else "utf-8")
+
+
+def check_generation(parser, args):
+    if args.algorithm == "DFS" and args.size[0] * args.size[1] > MAX_RECURSIVE_DFS_CELLS:
+        parser.error("递归DFS不支持这么大的迷宫，请使用 DFS-Iter")
+    if args.count < 1:
+        parser.error("--count 必须为正整数")
+    if args.workers < 0:
+        parser.error("--workers 不能为负数")
+
+
+def generated(args):
+    """按命令行参数逐个产出 (序号, 序列化字节串)；单个迷宫时种子原样使用"""
+    width, height = args.size
+    if args.count == 1 and args.seed is not None:
+        specs = [(width, height, args.algorithm, args.seed)]
+    else:
+        specs = [(width, height, args.algorithm)] * args.count
+    return batch.generate_batch(specs, workers=args.workers, base_seed=args.seed,
+                                endpoints=args.endpoints)
+
+
+def command_generate(parser, args):
+    check_generation(parser, args)
+    directory = args.output if args.output and (
+        os.path.isdir(args.output) or args.output.endswith(os.sep)) else None
+    if directory is not None:
+        os.makedirs(directory, exist_ok=True)
+        if args.format != "maze":
+            parser.error("输出到目录时只支持 maze 格式")
+        digits = len(str(args.count - 1))
+        for index, data in generated(args):
+            with open(os.path.join(directory, f"maze-{index:0{digits}d}.maze"), "wb") as f:
+                f.write(data)
+        return 0
+
+    binary = args.format == "maze"
+    out = open_output(args.output, binary)
+    try:
+        for _, data in generated(args):
+            if binary:
+                out.write(data)
+                continue
+            maze = maze_io.loads(data)
+            if args.format == "json":
+                record = describe(maze)
+                record["walls"] = bytes(maze.walls).hex()
+                out.write(json.dumps(record) + "\n")
+            else:
+                out.write(f"# {maze.algorithm} {maze.width}x{maze.height} seed={maze.seed}\n")
+                out.write(to_text(maze) + "\n")
+        out.flush()
+    finally:
+        if args.output not in (None, "-"):
+            out.close()
+    return 0
+
+
+def input_mazes(parser, args):
+    """solve / analyze 的输入：文件 / 标准输入中的迷宫记录，或按生成参数现场生成"""
+    if args.inputs:
+        for path in args.inputs:
+            if path == "-":
+                yield from maze_io.read_mazes(sys.stdin.buffer)
+            else:
+                with open(path, "rb") as f:
+                    yield from maze_io.read_mazes(f)
+        return
+    if args.size is None:
+        parser.error("请给出迷宫文件（或 - 表示标准输入），或用 --size 现场生成")
+    check_generation(parser, args)
+    for _, data in generated(args):
+        yield maze_io.loads(data)
+
+
+def command_solve(parser, args):
+    solve = SOLVERS[args.solver]
+    out = open_output(args.output, binary=False)
+    failures = 0
+    try:
+        for maze in input_mazes(parser, args):
+            found = solve(maze)
+            failures += not found
+            if args.format == "json":
+                record = describe(maze)
+                record.update(solver=args.solver, found=bool(found),
+                              length=len(maze.path) - 1 if found else None,
+                              nodes_expanded=maze.nodes_expanded,
+                              solution_time=maze.solution_time)
+                if args.path:
+                    record["path"] = [list(cell) for cell in maze.path]
+                out.write(json.dumps(record) + "\n")
+            elif args.format == "text":
+                out.write(f"# {args.solver}: " + (f"{len(maze.path) - 1} 步\n" if found else "无解\n"))
+                out.write(to_text(maze) + "\n")
+            else:
+                length = f"{len(maze.path) - 1}步" if found else "无解"
+                out.write(f"{maze.algorithm or '-'}\t{maze.width}x{maze.height}\t"
+                          f"seed={maze.seed}\t{args.solver}\t{length}\t"
+                          f"扩展 {maze.nodes_expanded}\t{maze.solution_time * 1000:.2f}ms\n")
+        out.flush()
+    finally:
+        if args.output not in (None, "-"):
+            out.close()
+    return 1 if failures else 0
+
+
+def command_analyze(parser, args):
+    from .analysis import analyze
+
+    out = open_output(args.output, binary=False)
+    try:
+        for maze in input_mazes(parser, args):
+            metrics = analyze(maze)
+            del metrics["distances"]
+            if args.format == "json":
+                record = describe(maze)
+                record.update(metrics)
+                out.write(json.dumps(record) + "\n")
+            else:
+                out.write(f"{maze.algorithm or '-'}\t{maze.width}x{maze.height}\t"
+                          f"seed={maze.seed}\t死路 {metrics['dead_ends']}\t"
+                          f"岔路 {metrics['junctions']}\t"
+                          f"分支因子 {metrics['branching_factor']:.3f}\t"
+                          f"直径 {metrics['diameter']}\t"
+                          f"通道 平均 {metrics['corridor_mean']:.2f} 最长 {metrics['corridor_max']}\n")
+        out.flush()
+    finally:
+        if args.output not in (None, "-"):
+            out.close()
+    return 0
+
+
+def add_generation_options(parser, size_required):
+    parser.add_argument("--size", type=parse_size, required=size_required,
+                        help="迷宫尺寸，如 200x100 或 50")
+    parser.add_argument("--algorithm", default="Kruskal", choices=list(GENERATORS),
+                        help="生成算法（默认 Kruskal）")
+    parser.add_argument("--seed", type=parse_seed,
+                        help="随机种子；--count 大于 1 时作为基础种子派生各迷宫的种子")
+    parser.add_argument("--count", type=int, default=1, help="生成的迷宫数量")
+    parser.add_argument("--endpoints", default="corners", choices=ENDPOINT_MODES,
+                        help="起终点放在对角（默认）或最长路径的两端")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="生成使用的进程数，0 表示在当前进程内执行")
+    parser.add_argument("-o", "--output", help="输出文件，默认标准输出")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="迷宫生成与求解命令行工具")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    generate = commands.add_parser("generate", help="生成迷宫")
+    add_generation_options(generate, size_required=True)
+    generate.add_argument("--format", default="maze", choices=["maze", "json", "text"],
+                          help="输出格式：二进制 .maze 记录、JSON行或字符画")
+
+    solve = commands.add_parser("solve", help="求解迷宫")
+    solve.add_argument("inputs", nargs="*", help="迷宫文件，- 表示从标准输入读取")
+    add_generation_options(solve, size_required=False)
+    solve.add_argument("--solver", default="BFS", choices=list(SOLVERS), help="求解算法")
+    solve.add_argument("--format", default="summary", choices=["summary", "json", "text"],
+                       help="输出格式：每行一个摘要、JSON行或带路径的字符画")
+    solve.add_argument("--path", action="store_true", help="JSON输出中包含完整路径")
+
+    analyze = commands.add_parser("analyze", help="统计迷宫结构指标")
+    analyze.add_argument("inputs", nargs="*", help="迷宫文件，- 表示从标准输入读取")
+    add_generation_options(analyze, size_required=False)
+    analyze.add_argument("--format", default="summary", choices=["summary", "json"],
+                         help="输出格式：每行一个摘要或JSON行")
+
+    commands.add_parser("bench", add_help=False,
+                        help="运行基准测试，其余参数传给 maze.benchmark")
+    commands.add_parser("serve", add_help=False,
+                        help="启动HTTP/JSON服务，其余参数传给 maze.service")
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args, extra = parser.parse_known_args(argv)
+    if args.command == "bench":
+        from . import benchmark
+        return benchmark.main(extra)
+    if args.command == "serve":
+        from . import service
+        return service.main(extra)
+    if extra:
+        parser.error(f"无法识别的参数: {' '.join(extra)}")
+    if args.command == "generate":
+        return command_generate(parser, args)
+    if args.command == "analyze":
+        return command_analyze(parser, args)
+    return command_solve(parser, args)
+
+
+def run(argv=None):
+    """进程入口：在 main 之外处理下游（如 head）提前关闭管道的情况"""
+    try:
+        return main(argv)
+    except BrokenPipeError:
+        # 把标准输出指向空设备，避免解释器退出时刷新缓冲区再次报错
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(run())
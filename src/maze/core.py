@@ -0,0 +1,324 @@
+"""迷宫引擎的核心数据结构
+
+墙体位常量、Maze，以及各算法共用的随机数、路径回溯和并查集等工具。
+"""
+import random
+import sys
+from array import array
+
+# 引擎不依赖 tkinter；NumPy 为可选依赖，推迟到第一次用到时才导入，
+# 使命令行工具和测试的启动时间保持在毫秒级
+_numpy = False
+
+
+def load_numpy():
+    """按需导入 NumPy，未安装时返回 None（NumPy 为可选依赖，缺失时退回纯Python实现）"""
+    global _numpy
+    if _numpy is False:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        _numpy = numpy
+    return _numpy
+
+
+# 墙体位标记：每个格子占一个字节，低四位依次为上、右、下、左墙
+WALL_TOP = 1
+WALL_RIGHT = 2
+WALL_BOTTOM = 4
+WALL_LEFT = 8
+ALL_WALLS = WALL_TOP | WALL_RIGHT | WALL_BOTTOM | WALL_LEFT
+
+# 随机种子的取值范围为 [0, SEED_LIMIT)，即 64 位无符号整数
+SEED_LIMIT = 2 ** 64
+
+# 起点、终点在外圈开口时优先选用的方向
+ENTRANCE_ORDER = (WALL_LEFT, WALL_TOP, WALL_BOTTOM, WALL_RIGHT)
+EXIT_ORDER = (WALL_RIGHT, WALL_BOTTOM, WALL_TOP, WALL_LEFT)
+
+# 生成与求解算法可接收 progress(done, total) 回调，大约每处理这么多格子调用一次；
+# 回调中抛出异常即可中止算法
+PROGRESS_INTERVAL = 4096
+
+# 生成与求解算法还可接收 stats 计数器对象（见 instrument.Stats），需提供
+# add(名称, 数值) 与 maximum(名称, 数值)。计数尽量在算法结束后由已有的数据
+# 推算，或在开启时替换循环中已有的函数调用，stats 为 None 时不增加任何开销
+
+
+class Maze:
+    def __init__(self, width, height, walls=None):
+        self.width = width
+        self.height = height
+        # 扁平存储：格子 (y, x) 的墙体位位于 walls[y * width + x]；
+        # 也可传入已有缓冲区（如 mmap 映射的文件），不会复制
+        if walls is None:
+            walls = bytearray([ALL_WALLS]) * (width * height)
+        elif len(walls) != width * height:
+            raise ValueError("墙体缓冲区大小与迷宫尺寸不符")
+        self.walls = walls
+        self.start = (0, 0)  
+        self.end = (height-1, width-1) 
+        self.path = []  
+        self.algorithm = None
+        self.seed = None
+        self.generation_time = 0
+        self.solution_time = 0
+        self.nodes_expanded = 0
+        
+    @property
+    def path(self):
+        return self._path
+    
+    @path.setter
+    def path(self, path):
+        # 路径应整体替换而非原地修改，否则 path_mask 不会更新
+        self._path = path
+        self._path_mask = None
+    
+    @property
+    def path_mask(self):
+        """与 walls 同样按 y * width + x 编号的路径位图，首次访问时构建"""
+        if self._path_mask is None:
+            mask = bytearray(self.width * self.height)
+            width = self.width
+            for y, x in self._path:
+                mask[y * width + x] = 1
+            self._path_mask = mask
+        return self._path_mask
+    
+    def on_path(self, y, x):
+        """O(1) 判断格子是否在当前路径上"""
+        return bool(self.path_mask[y * self.width + x])
+        
+    def has_wall(self, y, x, direction):
+        """direction: 0上 1右 2下 3左"""
+        return bool(self.walls[y * self.width + x] >> direction & 1)
+        
+    def remove_wall(self, y1, x1, y2, x2):
+        cell1 = y1 * self.width + x1
+        cell2 = y2 * self.width + x2
+        if x1 == x2:  
+            if y2 > y1:  
+                self.walls[cell1] &= ~WALL_BOTTOM
+                self.walls[cell2] &= ~WALL_TOP
+            else:  
+                self.walls[cell1] &= ~WALL_TOP
+                self.walls[cell2] &= ~WALL_BOTTOM
+        elif y1 == y2:  
+            if x2 > x1: 
+                self.walls[cell1] &= ~WALL_RIGHT
+                self.walls[cell2] &= ~WALL_LEFT
+            else: 
+                self.walls[cell1] &= ~WALL_LEFT
+                self.walls[cell2] &= ~WALL_RIGHT
+                
+    def outer_walls(self, y, x):
+        """格子 (y, x) 位于外圈的那几面墙的墙体位"""
+        return ((WALL_TOP if y == 0 else 0) | (WALL_RIGHT if x == self.width - 1 else 0)
+                | (WALL_BOTTOM if y == self.height - 1 else 0) | (WALL_LEFT if x == 0 else 0))
+    
+    def open_entrances(self):
+        """打通起点和终点的一面外墙，不在外圈的端点不开口
+
+        起点依次优先左、上、下、右侧，终点依次优先右、下、上、左侧，
+        因此默认的对角起终点总是打通起点左侧和终点右侧。
+        """
+        for (y, x), order in ((self.start, ENTRANCE_ORDER), (self.end, EXIT_ORDER)):
+            outer = self.outer_walls(y, x)
+            for wall in order:
+                if outer & wall:
+                    self.walls[y * self.width + x] &= ~wall
+                    break
+    
+    def close_entrances(self):
+        """封闭起点和终点的外墙，移动起终点前调用"""
+        for y, x in (self.start, self.end):
+            self.walls[y * self.width + x] |= self.outer_walls(y, x)
+                
+    def get_neighbors(self, y, x, with_walls=True):
+        neighbors = []
+        cell = self.walls[y * self.width + x] if with_walls else 0
+        
+        if y > 0 and not cell & WALL_TOP:
+            neighbors.append((y - 1, x))
+        if x < self.width - 1 and not cell & WALL_RIGHT:
+            neighbors.append((y, x + 1))
+        if y < self.height - 1 and not cell & WALL_BOTTOM:
+            neighbors.append((y + 1, x))
+        if x > 0 and not cell & WALL_LEFT:
+            neighbors.append((y, x - 1))
+        return neighbors
+
+
+def make_rng(seed=None):
+    """把生成算法的 seed 参数统一为 (random.Random, 整数种子)
+
+    seed 可以是整数、random.Random 或 NumPy Generator；后两者只用来抽取一个
+    64 位整数种子，算法内部总是使用由该整数创建的独立 random.Random。
+    seed 为 None 时从全局 random 抽取种子，因此 random.seed() 仍然有效。
+    同一整数种子在任何线程、任何进程中都生成逐位相同的迷宫。
+    整数种子必须是 64 位无符号整数（与 .maze 文件头一致），否则抛出 ValueError。
+    """
+    if seed is None:
+        seed = random.getrandbits(64)
+    elif isinstance(seed, random.Random):
+        seed = seed.getrandbits(64)
+    elif "numpy" in sys.modules and isinstance(seed, sys.modules["numpy"].random.Generator):
+        seed = int(seed.integers(2 ** 63))
+    elif not isinstance(seed, int) or isinstance(seed, bool):
+        raise TypeError(f"不支持的随机种子类型: {type(seed).__name__}")
+    elif not 0 <= seed < SEED_LIMIT:
+        raise ValueError(f"随机种子必须在 [0, 2**64) 范围内: {seed}")
+    return random.Random(seed), seed
+
+
+def sealed_walls(maze):
+    """返回墙体缓冲区的副本，外圈墙（包括出入口）一律视为封闭"""
+    width, height = maze.width, maze.height
+    walls = bytearray(maze.walls)
+    last_row = width * (height - 1)
+    walls[0:width] = bytes(cell | WALL_TOP for cell in walls[0:width])
+    walls[last_row:] = bytes(cell | WALL_BOTTOM for cell in walls[last_row:])
+    walls[0::width] = bytes(cell | WALL_LEFT for cell in walls[0::width])
+    walls[width - 1::width] = bytes(cell | WALL_RIGHT for cell in walls[width - 1::width])
+    return walls
+
+
+def move_table(width):
+    """墙体位 -> 可通行方向的编号偏移（顺序为上、右、下、左）"""
+    directions = ((WALL_TOP, -width), (WALL_RIGHT, 1), (WALL_BOTTOM, width), (WALL_LEFT, -1))
+    return [tuple(offset for wall, offset in directions if not bits & wall)
+            for bits in range(ALL_WALLS + 1)]
+
+
+def trace_path(parent, start, end, width):
+    """沿父节点表从 end 回溯到 start，返回 (y, x) 形式的正向路径"""
+    path = []
+    cell = end
+    while cell != start:
+        path.append(divmod(cell, width))
+        cell = parent[cell]
+    path.append(divmod(start, width))
+    path.reverse()
+    return path
+
+
+def tree_depth(maze, origin=None):
+    """从 origin（默认起点）出发的最大BFS距离，对完美迷宫即生成树的深度"""
+    width = maze.width
+    walls = sealed_walls(maze)
+    moves = move_table(width)
+    origin_y, origin_x = maze.start if origin is None else origin
+    origin = origin_y * width + origin_x
+    depth = array('i', [-1]) * (width * maze.height)
+    depth[origin] = 0
+    queue = [origin]
+    for cell in queue:
+        next_depth = depth[cell] + 1
+        for offset in moves[walls[cell]]:
+            neighbor = cell + offset
+            if depth[neighbor] < 0:
+                depth[neighbor] = next_depth
+                queue.append(neighbor)
+    return depth[queue[-1]]
+
+
+class DisjointSet:
+    def __init__(self, size):
+        # 紧凑整型数组存储，按集合大小合并
+        self.parent = array('i', range(size))
+        self.size = array('i', [1]) * size
+        self.components = size
+        
+    def find(self, x):
+        # 迭代式路径减半，不受递归深度限制
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+        
+    def union(self, x, y):
+        root_x = self.find(x)
+        root_y = self.find(y)
+        
+        if root_x != root_y:
+            if self.size[root_x] < self.size[root_y]:
+                root_x, root_y = root_y, root_x
+            self.parent[root_y] = root_x
+            self.size[root_x] += self.size[root_y]
+            self.components -= 1
+            return True
+        return False
+        
+    def union_many(self, xs, ys):
+        """批量合并 (xs[i], ys[i])，返回每对是否发生合并的 bytearray"""
+        parent = self.parent
+        size = self.size
+        merged = bytearray(len(xs))
+        merged_count = 0
+        
+        for i, (x, y) in enumerate(zip(xs, ys)):
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            while parent[y] != y:
+                parent[y] = parent[parent[y]]
+                y = parent[y]
+            if x != y:
+                if size[x] < size[y]:
+                    x, y = y, x
+                parent[y] = x
+                size[x] += size[y]
+                merged[i] = 1
+                merged_count += 1
+        
+        self.components -= merged_count
+        return merged
+
+
+class CountingDisjointSet(DisjointSet):
+    """带计数器的并查集，仅在性能分析时使用，DisjointSet 本身不做任何计数
+
+    finds: 查找次数；union_calls: 合并调用次数；unions: 实际发生的合并次数；
+    compression_steps: 路径减半时改写父指针的次数。
+    """
+    
+    def __init__(self, size):
+        super().__init__(size)
+        self.finds = 0
+        self.union_calls = 0
+        self.unions = 0
+        self.compression_steps = 0
+    
+    def find(self, x):
+        self.finds += 1
+        parent = self.parent
+        steps = 0
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+            steps += 1
+        self.compression_steps += steps
+        return x
+    
+    def union(self, x, y):
+        self.union_calls += 1
+        merged = super().union(x, y)
+        self.unions += merged
+        return merged
+    
+    def union_many(self, xs, ys):
+        merged = bytearray(len(xs))
+        for i, (x, y) in enumerate(zip(xs, ys)):
+            merged[i] = self.union(x, y)
+        return merged
+    
+    def counters(self):
+        return {"finds": self.finds, "union_calls": self.union_calls, 
+                "unions": self.unions, "compression_steps": self.compression_steps}
+    
+    def record(self, stats):
+        for name, value in self.counters().items():
+            stats.add(name, value)
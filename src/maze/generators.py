@@ -0,0 +1,758 @@
+"""迷宫生成算法
+
+生成器的签名统一为 generate_xxx(maze, progress=None, stats=None, seed=None)，
+按名称注册在 GENERATORS 中；STEP_GENERATORS 中是逐步执行的版本，供动画使用。
+"""
+import sys
+import time
+from array import array
+
+from .core import (ALL_WALLS, WALL_BOTTOM, WALL_LEFT, WALL_RIGHT, WALL_TOP, PROGRESS_INTERVAL,
+                   CountingDisjointSet, DisjointSet, Maze, load_numpy, make_rng, move_table,
+                   sealed_walls, tree_depth)
+
+
+class MazeGenerator:
+
+    
+    @staticmethod
+    def generate_dfs(maze, progress=None, stats=None, seed=None):
+        sys.setrecursionlimit(max(sys.getrecursionlimit(), maze.width * maze.height * 2))
+        start_time = time.time()
+        rng, maze.seed = make_rng(seed)
+        cell_count = maze.width * maze.height
+        carved = 0
+        
+        def dfs(y, x, visited):
+            nonlocal carved
+            visited[y][x] = True
+            carved += 1
+            if progress is not None and not carved % PROGRESS_INTERVAL:
+                progress(carved, cell_count)
+            directions = [(-1, 0), (0, 1), (1, 0), (0, -1)] 
+            rng.shuffle(directions)
+            
+            for dy, dx in directions:
+                ny, nx = y + dy, x + dx
+                if 0 <= ny < maze.height and 0 <= nx < maze.width and not visited[ny][nx]:
+                    maze.remove_wall(y, x, ny, nx)
+                    dfs(ny, nx, visited)
+        
+        visited = [[False for _ in range(maze.width)] for _ in range(maze.height)]
+        start_y, start_x = maze.start
+        dfs(start_y, start_x, visited)
+
+        maze.open_entrances()
+        
+        maze.generation_time = time.time() - start_time
+        if stats is not None:
+            # 每个格子访问一次、尝试四个方向；递归深度即生成树深度
+            stats.add("cells_visited", cell_count)
+            stats.add("neighbor_checks", 4 * cell_count)
+            stats.maximum("stack_high_water", tree_depth(maze) + 1)
+    
+    @staticmethod
+    def generate_dfs_iterative(maze, progress=None, stats=None, seed=None):
+        """显式栈实现的回溯算法，内存只与栈深度相关，不受递归深度限制"""
+        start_time = time.time()
+        rng, maze.seed = make_rng(seed)
+        width, height = maze.width, maze.height
+        walls = maze.walls
+        carved = 1
+
+        visited = bytearray(width * height)
+        start_y, start_x = maze.start
+        start_id = start_y * width + start_x
+        visited[start_id] = 1
+        stack = array('i', [start_id])
+
+        while stack:
+            cell = stack[-1]
+            y, x = divmod(cell, width)
+            candidates = []
+            if y > 0 and not visited[cell - width]:
+                candidates.append((cell - width, WALL_TOP, WALL_BOTTOM))
+            if x < width - 1 and not visited[cell + 1]:
+                candidates.append((cell + 1, WALL_RIGHT, WALL_LEFT))
+            if y < height - 1 and not visited[cell + width]:
+                candidates.append((cell + width, WALL_BOTTOM, WALL_TOP))
+            if x > 0 and not visited[cell - 1]:
+                candidates.append((cell - 1, WALL_LEFT, WALL_RIGHT))
+
+            if not candidates:
+                stack.pop()
+                continue
+
+            neighbor, wall, opposite = rng.choice(candidates)
+            visited[neighbor] = 1
+            walls[cell] &= ~wall
+            walls[neighbor] &= ~opposite
+            stack.append(neighbor)
+            carved += 1
+            if progress is not None and not carved % PROGRESS_INTERVAL:
+                progress(carved, width * height)
+
+        maze.open_entrances()
+
+        maze.generation_time = time.time() - start_time
+        if stats is not None:
+            # 每个格子入栈、出栈各一次，栈顶每次检查四个方向
+            stats.add("cells_visited", carved)
+            stats.add("neighbor_checks", 4 * (2 * carved - 1))
+            stats.maximum("stack_high_water", tree_depth(maze) + 1)
+
+    @staticmethod
+    def generate_dfs_steps(maze, batch_size=256, seed=None):
+        """逐步执行的回溯算法，供动画使用
+
+        每次产出一批被打通的墙 [(格子, 相邻格子), ...]，迷宫随之就地修改；
+        迭代结束后迷宫已完整生成，generation_time 只计算生成器内部的耗时。
+        """
+        elapsed = 0.0
+        start_time = time.time()
+        rng, maze.seed = make_rng(seed)
+        width, height = maze.width, maze.height
+        walls = maze.walls
+
+        visited = bytearray(width * height)
+        start_y, start_x = maze.start
+        start_id = start_y * width + start_x
+        visited[start_id] = 1
+        stack = array('i', [start_id])
+        batch = []
+
+        while stack:
+            cell = stack[-1]
+            y, x = divmod(cell, width)
+            candidates = []
+            if y > 0 and not visited[cell - width]:
+                candidates.append((cell - width, WALL_TOP, WALL_BOTTOM))
+            if x < width - 1 and not visited[cell + 1]:
+                candidates.append((cell + 1, WALL_RIGHT, WALL_LEFT))
+            if y < height - 1 and not visited[cell + width]:
+                candidates.append((cell + width, WALL_BOTTOM, WALL_TOP))
+            if x > 0 and not visited[cell - 1]:
+                candidates.append((cell - 1, WALL_LEFT, WALL_RIGHT))
+
+            if not candidates:
+                stack.pop()
+                continue
+
+            neighbor, wall, opposite = rng.choice(candidates)
+            visited[neighbor] = 1
+            walls[cell] &= ~wall
+            walls[neighbor] &= ~opposite
+            stack.append(neighbor)
+            batch.append((cell, neighbor))
+            if len(batch) >= batch_size:
+                elapsed += time.time() - start_time
+                yield batch
+                start_time = time.time()
+                batch = []
+
+        maze.open_entrances()
+        maze.generation_time = elapsed + time.time() - start_time
+        if batch:
+            yield batch
+
+    @staticmethod
+    def generate_kruskal(maze, progress=None, stats=None, seed=None):
+        start_time = time.time()
+        rng, maze.seed = make_rng(seed)
+        width, height = maze.width, maze.height
+        # 边编码为 cell_id * 2 + 方向，0 表示与右侧相邻，1 表示与下方相邻
+        edges = []
+        
+        for y in range(height):
+            for x in range(width):
+                cell_id = y * width + x
+
+                if x < width - 1:
+                    edges.append(cell_id * 2)
+
+                if y < height - 1:
+                    edges.append(cell_id * 2 + 1)
+
+        rng.shuffle(edges)
+
+        cells = [edge >> 1 for edge in edges]
+        neighbors = [(edge >> 1) + (width if edge & 1 else 1) for edge in edges]
+        cell_count = width * height
+        dsu = DisjointSet(cell_count) if stats is None else CountingDisjointSet(cell_count)
+        # 分段合并以便汇报进度，已合并的格子数 = 格子总数 - 连通分量数
+        merged = bytearray()
+        chunk = PROGRESS_INTERVAL * 16
+        for i in range(0, len(edges), chunk):
+            merged += dsu.union_many(cells[i:i + chunk], neighbors[i:i + chunk])
+            if progress is not None:
+                progress(cell_count - dsu.components, cell_count)
+        walls = maze.walls
+
+        for edge, cell1_id, cell2_id, accepted in zip(edges, cells, neighbors, merged):
+            if accepted:
+                if edge & 1:
+                    walls[cell1_id] &= ~WALL_BOTTOM
+                    walls[cell2_id] &= ~WALL_TOP
+                else:
+                    walls[cell1_id] &= ~WALL_RIGHT
+                    walls[cell2_id] &= ~WALL_LEFT
+
+        maze.open_entrances()
+        
+        maze.generation_time = time.time() - start_time
+        if stats is not None:
+            stats.add("cells_visited", cell_count)
+            stats.add("edges_examined", len(edges))
+            dsu.record(stats)
+
+    @staticmethod
+    def generate_kruskal_steps(maze, batch_size=256, seed=None):
+        """逐步执行的Kruskal算法，供动画使用，产出格式与 generate_dfs_steps 相同"""
+        elapsed = 0.0
+        start_time = time.time()
+        rng, maze.seed = make_rng(seed)
+        width, height = maze.width, maze.height
+        edges = []
+        for y in range(height):
+            for x in range(width):
+                cell_id = y * width + x
+                if x < width - 1:
+                    edges.append(cell_id * 2)
+                if y < height - 1:
+                    edges.append(cell_id * 2 + 1)
+        rng.shuffle(edges)
+
+        dsu = DisjointSet(width * height)
+        walls = maze.walls
+        batch = []
+
+        for edge in edges:
+            cell = edge >> 1
+            if edge & 1:
+                neighbor, wall, opposite = cell + width, WALL_BOTTOM, WALL_TOP
+            else:
+                neighbor, wall, opposite = cell + 1, WALL_RIGHT, WALL_LEFT
+            if not dsu.union(cell, neighbor):
+                continue
+            walls[cell] &= ~wall
+            walls[neighbor] &= ~opposite
+            batch.append((cell, neighbor))
+            if dsu.components == 1:
+                break
+            if len(batch) >= batch_size:
+                elapsed += time.time() - start_time
+                yield batch
+                start_time = time.time()
+                batch = []
+
+        maze.open_entrances()
+        maze.generation_time = elapsed + time.time() - start_time
+        if batch:
+            yield batch
+
+    @staticmethod
+    def generate_kruskal_numpy(maze, progress=None, stats=None, seed=None):
+        """向量化的Kruskal算法，未安装NumPy时退回 generate_kruskal
+
+        两者的随机序列不同，同一种子生成的迷宫也不同；退回时 maze.algorithm
+        记为 "Kruskal"，保证记录的 (算法, 种子) 总能重新生成同一迷宫。
+        """
+        np = load_numpy()
+        if np is None:
+            result = MazeGenerator.generate_kruskal(maze, progress, stats, seed)
+            maze.algorithm = "Kruskal"
+            return result
+
+        start_time = time.time()
+        maze.seed = make_rng(seed)[1]
+        width, height = maze.width, maze.height
+        cells = np.arange(width * height, dtype=np.int64).reshape(height, width)
+
+        # 先排横向边（左右相邻），再排纵向边（上下相邻）
+        first = np.concatenate((cells[:, :-1].ravel(), cells[:-1, :].ravel()))
+        second = np.concatenate((cells[:, 1:].ravel(), cells[1:, :].ravel()))
+        horizontal_count = height * (width - 1)
+
+        # 随机排列后边的下标即其权重，按权重逐条合并等价于按此顺序执行Kruskal
+        order = np.random.default_rng(maze.seed).permutation(len(first))
+        first = first[order]
+        second = second[order]
+        edge_count = len(order)
+
+        # 以Borůvka方式批量合并：每轮每个连通分量选出权重最小的外连边，
+        # 再用指针跳跃合并分量并重新编号，得到的生成树与逐边执行并查集完全相同
+        accepted = np.zeros(edge_count, dtype=np.bool_)
+        edge_ids = np.arange(edge_count)
+        label1, label2 = first, second
+        cell_count = component_count = width * height
+        rounds = pointer_jumps = 0
+        while len(edge_ids):
+            rounds += 1
+            # edge_ids 始终升序，因此位置最小即权重最小
+            positions = np.arange(len(edge_ids))
+            best = np.full(component_count, edge_count)
+            np.minimum.at(best, label1, positions)
+            np.minimum.at(best, label2, positions)
+            accepted[edge_ids[best]] = True
+
+            components = np.arange(component_count)
+            end1 = label1[best]
+            pointer = np.where(end1 == components, label2[best], end1)
+            # 两个分量互选同一条边时，保留编号较小的一方作为根
+            mutual = (pointer[pointer] == components) & (components < pointer)
+            pointer[mutual] = components[mutual]
+            while True:
+                jumped = pointer[pointer]
+                if np.array_equal(jumped, pointer):
+                    break
+                pointer = jumped
+                pointer_jumps += 1
+
+            is_root = pointer == components
+            pointer = (np.cumsum(is_root) - 1)[pointer]
+            component_count = int(is_root.sum())
+
+            label1 = pointer[label1]
+            label2 = pointer[label2]
+            external = label1 != label2
+            edge_ids = edge_ids[external]
+            label1 = label1[external]
+            label2 = label2[external]
+            if progress is not None:
+                progress(cell_count - component_count, cell_count)
+
+        horizontal = accepted & (order < horizontal_count)
+        vertical = accepted & (order >= horizontal_count)
+
+        walls = np.frombuffer(maze.walls, dtype=np.uint8)
+        walls[first[horizontal]] &= np.uint8(ALL_WALLS & ~WALL_RIGHT)
+        walls[second[horizontal]] &= np.uint8(ALL_WALLS & ~WALL_LEFT)
+        walls[first[vertical]] &= np.uint8(ALL_WALLS & ~WALL_BOTTOM)
+        walls[second[vertical]] &= np.uint8(ALL_WALLS & ~WALL_TOP)
+
+        maze.open_entrances()
+
+        maze.generation_time = time.time() - start_time
+        if stats is not None:
+            stats.add("cells_visited", cell_count)
+            stats.add("edges_examined", edge_count)
+            stats.add("unions", int(accepted.sum()))
+            stats.add("boruvka_rounds", rounds)
+            stats.add("pointer_jumps", pointer_jumps)
+
+
+    @staticmethod
+    def generate_eller_rows(width, height, seed=None):
+        """Eller算法逐行生成迷宫，每次产出一行墙体位（bytes），内存只与宽度相关
+
+        产出的行可直接写入文件，例如 f.writelines(generate_eller_rows(w, h))；
+        与其他生成器一致，左上角左墙和右下角右墙作为出入口被打通。
+        """
+        rng = make_rng(seed)[0]
+        row_sets = array('i', [0]) * width
+        open_top = bytearray(width)
+
+        for y in range(height):
+            last_row = y == height - 1
+            row = bytearray([ALL_WALLS]) * width
+
+            # 从上一行延续下来的格子保留所属集合，其余格子各自成为新集合；
+            # 每行重新编号，集合编号始终小于宽度
+            renumber = {}
+            next_set = 0
+            for x in range(width):
+                if open_top[x]:
+                    row[x] &= ~WALL_TOP
+                    set_id = renumber.get(row_sets[x])
+                    if set_id is None:
+                        set_id = renumber[row_sets[x]] = next_set
+                        next_set += 1
+                else:
+                    set_id = next_set
+                    next_set += 1
+                row_sets[x] = set_id
+
+            members = {}
+            for x in range(width):
+                members.setdefault(row_sets[x], []).append(x)
+
+            # 随机合并相邻的不同集合，最后一行必须全部合并
+            for x in range(width - 1):
+                left, right = row_sets[x], row_sets[x + 1]
+                if left != right and (last_row or rng.random() < 0.5):
+                    row[x] &= ~WALL_RIGHT
+                    row[x + 1] &= ~WALL_LEFT
+                    if len(members[left]) < len(members[right]):
+                        left, right = right, left
+                    for column in members[right]:
+                        row_sets[column] = left
+                    members[left].extend(members.pop(right))
+
+            # 每个集合至少向下打通一个格子
+            open_top = bytearray(width)
+            if not last_row:
+                for columns in members.values():
+                    chosen = [column for column in columns if rng.random() < 0.5]
+                    if not chosen:
+                        chosen = [rng.choice(columns)]
+                    for column in chosen:
+                        row[column] &= ~WALL_BOTTOM
+                        open_top[column] = 1
+
+            if y == 0:
+                row[0] &= ~WALL_LEFT
+            if last_row:
+                row[width - 1] &= ~WALL_RIGHT
+            yield bytes(row)
+
+    @staticmethod
+    def generate_eller(maze, progress=None, stats=None, seed=None):
+        """用逐行Eller算法填充内存中的迷宫"""
+        start_time = time.time()
+        width = maze.width
+        cell_count = width * maze.height
+        rows_per_report = max(1, PROGRESS_INTERVAL // width)
+        maze.seed = make_rng(seed)[1]
+        for y, row in enumerate(MazeGenerator.generate_eller_rows(width, maze.height, maze.seed)):
+            maze.walls[y * width:(y + 1) * width] = row
+            if progress is not None and not (y + 1) % rows_per_report:
+                progress((y + 1) * width, cell_count)
+
+        maze.open_entrances()
+
+        maze.generation_time = time.time() - start_time
+        if stats is not None:
+            # 横向打通即同一行内的集合合并
+            walls = maze.walls
+            stats.add("cells_visited", cell_count)
+            stats.add("rows", maze.height)
+            stats.add("unions", sum(1 for i in range(cell_count)
+                                    if i % width < width - 1 and not walls[i] & WALL_RIGHT))
+
+    @staticmethod
+    def generate_binary_tree_rows(width, height, seed=None):
+        """二叉树算法逐行生成，每个格子随机向右或向下打通，单次遍历且只依赖当前行
+
+        最后一行只能向右、最后一列只能向下，因此右下角以外的格子都恰好有一条
+        出边，得到的生成树偏向右下方。产出格式与 generate_eller_rows 相同。
+        """
+        getrandbits = make_rng(seed)[0].getrandbits
+        open_top = bytearray(width)
+        for y in range(height):
+            last_row = y == height - 1
+            row = bytearray([ALL_WALLS]) * width
+            # 每行一次取出 width 个随机位，第 x 位为 1 表示向右
+            bits = getrandbits(width)
+            for x in range(width):
+                if open_top[x]:
+                    row[x] &= ~WALL_TOP
+                if x < width - 1 and (last_row or bits >> x & 1):
+                    row[x] &= ~WALL_RIGHT
+                    row[x + 1] &= ~WALL_LEFT
+                    open_top[x] = 0
+                elif not last_row:
+                    row[x] &= ~WALL_BOTTOM
+                    open_top[x] = 1
+
+            if y == 0:
+                row[0] &= ~WALL_LEFT
+            if last_row:
+                row[width - 1] &= ~WALL_RIGHT
+            yield bytes(row)
+
+    @staticmethod
+    def generate_sidewinder_rows(width, height, seed=None):
+        """Sidewinder算法逐行生成，产出格式与 generate_eller_rows 相同
+
+        每行从左到右积累一段连续通道，随机决定继续向右延伸或结束该段；
+        结束时从段内随机选一个格子向下打通。最后一行是一整条横向通道。
+        """
+        rng = make_rng(seed)[0]
+        open_top = bytearray(width)
+        for y in range(height):
+            last_row = y == height - 1
+            row = bytearray([ALL_WALLS]) * width
+            for x in range(width):
+                if open_top[x]:
+                    row[x] &= ~WALL_TOP
+            open_top = bytearray(width)
+
+            run_start = 0
+            for x in range(width):
+                if x < width - 1 and (last_row or rng.random() < 0.5):
+                    row[x] &= ~WALL_RIGHT
+                    row[x + 1] &= ~WALL_LEFT
+                elif not last_row:
+                    column = rng.randint(run_start, x)
+                    row[column] &= ~WALL_BOTTOM
+                    open_top[column] = 1
+                    run_start = x + 1
+
+            if y == 0:
+                row[0] &= ~WALL_LEFT
+            if last_row:
+                row[width - 1] &= ~WALL_RIGHT
+            yield bytes(row)
+
+    @staticmethod
+    def _fill_rows(maze, rows, progress):
+        """把逐行生成器的输出写入迷宫"""
+        width = maze.width
+        cell_count = width * maze.height
+        rows_per_report = max(1, PROGRESS_INTERVAL // width)
+        for y, row in enumerate(rows):
+            maze.walls[y * width:(y + 1) * width] = row
+            if progress is not None and not (y + 1) % rows_per_report:
+                progress((y + 1) * width, cell_count)
+
+    @staticmethod
+    def generate_binary_tree(maze, progress=None, stats=None, seed=None):
+        """用逐行二叉树算法填充内存中的迷宫"""
+        start_time = time.time()
+        maze.seed = make_rng(seed)[1]
+        rows = MazeGenerator.generate_binary_tree_rows(maze.width, maze.height, maze.seed)
+        MazeGenerator._fill_rows(maze, rows, progress)
+        maze.open_entrances()
+        maze.generation_time = time.time() - start_time
+        if stats is not None:
+            stats.add("cells_visited", maze.width * maze.height)
+            stats.add("rows", maze.height)
+
+    @staticmethod
+    def generate_sidewinder(maze, progress=None, stats=None, seed=None):
+        """用逐行Sidewinder算法填充内存中的迷宫"""
+        start_time = time.time()
+        maze.seed = make_rng(seed)[1]
+        rows = MazeGenerator.generate_sidewinder_rows(maze.width, maze.height, maze.seed)
+        MazeGenerator._fill_rows(maze, rows, progress)
+        maze.open_entrances()
+        maze.generation_time = time.time() - start_time
+        if stats is not None:
+            stats.add("cells_visited", maze.width * maze.height)
+            stats.add("rows", maze.height)
+
+    @staticmethod
+    def _carve(walls, cell, neighbor, width):
+        """打通相邻格子 cell 与 neighbor 之间的墙"""
+        offset = neighbor - cell
+        # 先判断上下：宽度为 1 时上下相邻的偏移也是 ±1
+        if offset == width:
+            walls[cell] &= ~WALL_BOTTOM
+            walls[neighbor] &= ~WALL_TOP
+        elif offset == -width:
+            walls[cell] &= ~WALL_TOP
+            walls[neighbor] &= ~WALL_BOTTOM
+        elif offset == 1:
+            walls[cell] &= ~WALL_RIGHT
+            walls[neighbor] &= ~WALL_LEFT
+        else:
+            walls[cell] &= ~WALL_LEFT
+            walls[neighbor] &= ~WALL_RIGHT
+
+    @staticmethod
+    def _border_moves(maze):
+        """(每个格子的外圈墙位, 墙体位 -> 编号偏移表)，用于不考虑内墙时枚举相邻格子"""
+        border = sealed_walls(Maze(maze.width, maze.height, bytearray(maze.width * maze.height)))
+        return border, move_table(maze.width)
+
+    @staticmethod
+    def generate_aldous_broder(maze, progress=None, stats=None, seed=None):
+        """Aldous-Broder算法：随机游走，首次进入某格时打通来路，得到均匀生成树
+
+        期望步数为网格的覆盖时间，约 O(n log² n)，适合小迷宫或作为均匀分布的参照。
+        """
+        start_time = time.time()
+        width = maze.width
+        cell_count = width * maze.height
+        walls = maze.walls
+        border, moves = MazeGenerator._border_moves(maze)
+        carve = MazeGenerator._carve
+        rng, maze.seed = make_rng(seed)
+        choice = rng.choice
+
+        visited = bytearray(cell_count)
+        cell = maze.start[0] * width + maze.start[1]
+        visited[cell] = 1
+        remaining = cell_count - 1
+        while remaining:
+            neighbor = cell + choice(moves[border[cell]])
+            if not visited[neighbor]:
+                visited[neighbor] = 1
+                carve(walls, cell, neighbor, width)
+                remaining -= 1
+                if progress is not None and not remaining % PROGRESS_INTERVAL:
+                    progress(cell_count - remaining, cell_count)
+            cell = neighbor
+
+        maze.open_entrances()
+        maze.generation_time = time.time() - start_time
+        if stats is not None:
+            stats.add("cells_visited", cell_count)
+
+    @staticmethod
+    def generate_wilson(maze, progress=None, stats=None, seed=None):
+        """Wilson算法：从树外格子做擦除环路的随机游走，游走到树上后把路径并入树
+
+        与 Aldous-Broder 一样得到均匀生成树，但通常快得多。游走时只记录每格
+        最后一次离开的方向，回放时自然擦除了环路。
+        """
+        start_time = time.time()
+        width = maze.width
+        cell_count = width * maze.height
+        walls = maze.walls
+        border, moves = MazeGenerator._border_moves(maze)
+        carve = MazeGenerator._carve
+        rng, maze.seed = make_rng(seed)
+        choice = rng.choice
+
+        in_tree = bytearray(cell_count)
+        in_tree[maze.start[0] * width + maze.start[1]] = 1
+        next_cell = array('i', [-1]) * cell_count
+        added = 1
+        walks = 0
+
+        for origin in range(cell_count):
+            if in_tree[origin]:
+                continue
+            walks += 1
+            cell = origin
+            while not in_tree[cell]:
+                neighbor = cell + choice(moves[border[cell]])
+                next_cell[cell] = neighbor
+                cell = neighbor
+
+            cell = origin
+            while not in_tree[cell]:
+                in_tree[cell] = 1
+                carve(walls, cell, next_cell[cell], width)
+                cell = next_cell[cell]
+                added += 1
+            if progress is not None:
+                progress(added, cell_count)
+
+        maze.open_entrances()
+        maze.generation_time = time.time() - start_time
+        if stats is not None:
+            stats.add("cells_visited", cell_count)
+            stats.add("walks", walks)
+
+    @staticmethod
+    def generate_prim(maze, progress=None, stats=None, seed=None):
+        """随机Prim算法：每次从边界格子中随机取一个，连到一个已在迷宫中的相邻格子"""
+        start_time = time.time()
+        width = maze.width
+        cell_count = width * maze.height
+        walls = maze.walls
+        border, moves = MazeGenerator._border_moves(maze)
+        carve = MazeGenerator._carve
+        rng, maze.seed = make_rng(seed)
+        randrange = rng.randrange
+        choice = rng.choice
+
+        # 0 未访问，1 在边界中，2 已在迷宫中
+        state = bytearray(cell_count)
+        start = maze.start[0] * width + maze.start[1]
+        state[start] = 2
+        frontier = []
+        for offset in moves[border[start]]:
+            state[start + offset] = 1
+            frontier.append(start + offset)
+
+        added = 1
+        while frontier:
+            # 随机取出一个边界格子（与末尾交换后弹出）
+            index = randrange(len(frontier))
+            cell = frontier[index]
+            frontier[index] = frontier[-1]
+            frontier.pop()
+
+            cell_moves = moves[border[cell]]
+            inside = [cell + offset for offset in cell_moves if state[cell + offset] == 2]
+            carve(walls, cell, choice(inside), width)
+            state[cell] = 2
+            for offset in cell_moves:
+                if not state[cell + offset]:
+                    state[cell + offset] = 1
+                    frontier.append(cell + offset)
+
+            added += 1
+            if progress is not None and not added % PROGRESS_INTERVAL:
+                progress(added, cell_count)
+
+        maze.open_entrances()
+        maze.generation_time = time.time() - start_time
+        if stats is not None:
+            stats.add("cells_visited", added)
+
+    @staticmethod
+    def generate_growing_tree(maze, progress=None, stats=None, seed=None, *, newest_ratio=0.5):
+        """Growing Tree算法：维护活动格子列表，每步从中选一个向未访问的相邻格子延伸
+
+        以 newest_ratio 的概率选最新加入的格子（趋近DFS，长走廊、速度快），
+        否则随机选一个（趋近Prim，短分支、更多岔路），用于在速度与纹理间取舍。
+        """
+        start_time = time.time()
+        width = maze.width
+        cell_count = width * maze.height
+        walls = maze.walls
+        border, moves = MazeGenerator._border_moves(maze)
+        carve = MazeGenerator._carve
+        rng, maze.seed = make_rng(seed)
+        rand = rng.random
+        randrange = rng.randrange
+        choice = rng.choice
+
+        visited = bytearray(cell_count)
+        start = maze.start[0] * width + maze.start[1]
+        visited[start] = 1
+        active = [start]
+        added = 1
+        while active:
+            index = len(active) - 1 if rand() < newest_ratio else randrange(len(active))
+            cell = active[index]
+            candidates = [cell + offset for offset in moves[border[cell]]
+                          if not visited[cell + offset]]
+            if not candidates:
+                # 与末尾交换后弹出，避免从列表中间删除
+                active[index] = active[-1]
+                active.pop()
+                continue
+
+            neighbor = choice(candidates)
+            visited[neighbor] = 1
+            carve(walls, cell, neighbor, width)
+            active.append(neighbor)
+            added += 1
+            if progress is not None and not added % PROGRESS_INTERVAL:
+                progress(added, cell_count)
+
+        maze.open_entrances()
+        maze.generation_time = time.time() - start_time
+        if stats is not None:
+            stats.add("cells_visited", added)
+
+
+# 按名称选择的生成算法
+GENERATORS = {
+    "DFS": MazeGenerator.generate_dfs,
+    "DFS-Iter": MazeGenerator.generate_dfs_iterative,
+    "Kruskal": MazeGenerator.generate_kruskal,
+    "Kruskal-NumPy": MazeGenerator.generate_kruskal_numpy,
+    "Eller": MazeGenerator.generate_eller,
+    "Sidewinder": MazeGenerator.generate_sidewinder,
+    "Binary Tree": MazeGenerator.generate_binary_tree,
+    "Prim": MazeGenerator.generate_prim,
+    "Growing Tree": MazeGenerator.generate_growing_tree,
+    "Wilson": MazeGenerator.generate_wilson,
+    "Aldous-Broder": MazeGenerator.generate_aldous_broder,
+}
+
+# 递归DFS受C栈限制，格子数超过此值时应改用 DFS-Iter
+MAX_RECURSIVE_DFS_CELLS = 100 * 100
+
+# 支持逐步执行（动画演示）的算法，逐步版本须与 GENERATORS 中的同名算法逐位一致；
+# 递归DFS与显式栈版本的随机序列不同，因此不在此列
+STEP_GENERATORS = {
+    "DFS-Iter": MazeGenerator.generate_dfs_steps,
+    "Kruskal": MazeGenerator.generate_kruskal_steps,
+}
@@ -0,0 +1,915 @@
+"""迷宫生成与求解的图形界面
+
+只有启动界面时才需要导入本模块（python -m maze.gui 或 python main.py），
+命令行工具和测试只使用引擎，不会加载 tkinter。
+"""
+import threading
+import queue
+import tkinter as tk
+from tkinter import ttk, messagebox, scrolledtext, filedialog
+
+try:
+    import numpy as np
+except ImportError:  # NumPy 为可选依赖，缺失时缩略图模式不可用
+    np = None
+
+from .analysis import place_on_diameter
+from .core import SEED_LIMIT, Maze
+from .generators import GENERATORS, STEP_GENERATORS, MAX_RECURSIVE_DFS_CELLS
+from .jobs import Job
+from .render import wall_segments, overview_levels
+from .solvers import SOLVERS, STEP_SOLVERS
+
+
+class MazeGUI:
+    
+    MAX_SIZE = 2000                    # 迷宫边长上限
+    VECTOR_MIN_SCALE = 6               # 每格像素不小于此值时用矢量图元绘制，否则用缩略图
+    MAX_SCALE = 60
+    MAX_ANIMATION_STEPS = 5000         # 每帧最多处理的步数，限制单帧耗时
+    
+    def __init__(self):
+        self.root = tk.Tk()
+        self.root.title("迷宫生成与求解系统")
+        self.root.geometry("1200x700")
+
+        self.setup_styles()
+
+        self.setup_ui()
+
+        self.current_maze = None
+        self.maze_title = ""
+        # 视图变换：画布坐标 = 原点 + 格子坐标 * 缩放
+        self.view_scale = 30.0
+        self.view_origin = (0.0, 0.0)
+        self.pan_anchor = None
+        self.render_job = None
+        self.overview = None
+        self.overview_image = None
+        self.path_points = None
+        
+        # 后台任务：同一时间只运行一个，事件队列由主循环定时取出
+        self.events = queue.Queue()
+        self.job = None
+        self.job_handlers = {}
+        self.animation = None
+        self.poll_events()
+        
+    def setup_styles(self):
+        """设置UI样式"""
+        style = ttk.Style()
+        style.theme_use('clam')
+
+        self.bg_color = "#f0f0f0"
+        self.cell_color = "#ffffff"
+        self.wall_color = "#333333"
+        self.start_color = "#4CAF50"
+        self.end_color = "#F44336"
+        self.path_color = "#2196F3"
+        self.grid_color = "#e0e0e0"
+        self.visit_color = "#BBDEFB"
+        
+        self.root.configure(bg=self.bg_color)
+    
+    def setup_ui(self):
+        """设置用户界面"""
+
+        main_frame = ttk.Frame(self.root)
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+
+        control_frame = ttk.LabelFrame(main_frame, text="控制面板", padding=15)
+        control_frame.pack(side=tk.LEFT, fill=tk.Y, padx=(0, 10))
+
+        settings_frame = ttk.LabelFrame(control_frame, text="迷宫设置", padding=10)
+        settings_frame.pack(fill=tk.X, pady=(0, 10))
+
+        ttk.Label(settings_frame, text=f"宽度 (5-{self.MAX_SIZE}):").grid(row=0, column=0, sticky=tk.W, pady=5)
+        self.width_var = tk.IntVar(value=15)
+        width_spinbox = ttk.Spinbox(settings_frame, from_=5, to=self.MAX_SIZE, textvariable=self.width_var, width=10)
+        width_spinbox.grid(row=0, column=1, pady=5, padx=(5, 0))
+
+        ttk.Label(settings_frame, text=f"高度 (5-{self.MAX_SIZE}):").grid(row=1, column=0, sticky=tk.W, pady=5)
+        self.height_var = tk.IntVar(value=15)
+        height_spinbox = ttk.Spinbox(settings_frame, from_=5, to=self.MAX_SIZE, textvariable=self.height_var, width=10)
+        height_spinbox.grid(row=1, column=1, pady=5, padx=(5, 0))
+
+        ttk.Label(settings_frame, text="生成算法:").grid(row=2, column=0, sticky=tk.W, pady=5)
+        self.algorithm_var = tk.StringVar(value="DFS")
+        algorithms = list(GENERATORS)
+        algorithm_menu = ttk.Combobox(settings_frame, textvariable=self.algorithm_var, 
+                                     values=algorithms, state="readonly", width=14)
+        algorithm_menu.grid(row=2, column=1, pady=5, padx=(5, 0))
+
+        ttk.Label(settings_frame, text="求解算法:").grid(row=3, column=0, sticky=tk.W, pady=5)
+        self.solver_var = tk.StringVar(value="BFS")
+        solver_menu = ttk.Combobox(settings_frame, textvariable=self.solver_var, 
+                                  values=list(SOLVERS), state="readonly", width=14)
+        solver_menu.grid(row=3, column=1, pady=5, padx=(5, 0))
+
+        ttk.Label(settings_frame, text="随机种子:").grid(row=4, column=0, sticky=tk.W, pady=5)
+        self.seed_var = tk.StringVar(value="")  # 留空则随机选取
+        ttk.Entry(settings_frame, textvariable=self.seed_var, width=16).grid(
+            row=4, column=1, pady=5, padx=(5, 0))
+
+        self.diameter_var = tk.BooleanVar(value=False)  # 起终点放在最长路径两端
+        ttk.Checkbutton(settings_frame, text="起终点取最长路径（最难）",
+                        variable=self.diameter_var).grid(row=5, column=0, columnspan=2,
+                                                         sticky=tk.W, pady=5)
+
+        ttk.Separator(control_frame, orient='horizontal').pack(fill=tk.X, pady=10)
+        
+        button_frame = ttk.Frame(control_frame)
+        button_frame.pack(fill=tk.X)
+        
+        self.generate_btn = ttk.Button(button_frame, text="生成迷宫", 
+                                      command=self.generate_maze, width=15)
+        self.generate_btn.pack(pady=5)
+        
+        self.solve_btn = ttk.Button(button_frame, text="求解迷宫", 
+                                   command=self.solve_maze, width=15, state=tk.DISABLED)
+        self.solve_btn.pack(pady=5)
+        
+        self.clear_btn = ttk.Button(button_frame, text="清除路径", 
+                                   command=self.clear_path, width=15, state=tk.DISABLED)
+        self.clear_btn.pack(pady=5)
+        
+        self.save_btn = ttk.Button(button_frame, text="保存迷宫", 
+                                  command=self.save_maze, width=15, state=tk.DISABLED)
+        self.save_btn.pack(pady=5)
+        
+        self.load_btn = ttk.Button(button_frame, text="加载迷宫", 
+                                  command=self.load_maze, width=15)
+        self.load_btn.pack(pady=5)
+        
+        self.performance_btn = ttk.Button(button_frame, text="性能测试", 
+                                         command=self.run_performance_test, width=15)
+        self.performance_btn.pack(pady=5)
+        
+        self.cancel_btn = ttk.Button(button_frame, text="取消任务", 
+                                    command=self.cancel_job, width=15, state=tk.DISABLED)
+        self.cancel_btn.pack(pady=5)
+        
+        self.progress_var = tk.DoubleVar(value=0)
+        self.progress_bar = ttk.Progressbar(button_frame, variable=self.progress_var, 
+                                            maximum=100, length=120)
+        self.progress_bar.pack(pady=5, fill=tk.X)
+        
+        options_frame = ttk.LabelFrame(control_frame, text="显示选项", padding=10)
+        options_frame.pack(fill=tk.X, pady=10)
+        
+        self.show_path_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(options_frame, text="显示路径", variable=self.show_path_var,
+                       command=self.toggle_path).pack(anchor=tk.W, pady=2)
+        
+        self.show_grid_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(options_frame, text="显示网格", variable=self.show_grid_var,
+                       command=self.toggle_grid).pack(anchor=tk.W, pady=2)
+        
+        self.thick_walls_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(options_frame, text="加粗墙体", variable=self.thick_walls_var,
+                       command=self.toggle_walls).pack(anchor=tk.W, pady=2)
+        
+        self.animate_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(options_frame, text="动画演示", 
+                       variable=self.animate_var).pack(anchor=tk.W, pady=2)
+        
+        speed_frame = ttk.Frame(options_frame)
+        speed_frame.pack(fill=tk.X, pady=2)
+        ttk.Label(speed_frame, text="帧率:").grid(row=0, column=0, sticky=tk.W)
+        self.fps_var = tk.IntVar(value=30)
+        ttk.Spinbox(speed_frame, from_=1, to=60, textvariable=self.fps_var, 
+                   width=6).grid(row=0, column=1, padx=(5, 0))
+        ttk.Label(speed_frame, text="每帧步数:").grid(row=1, column=0, sticky=tk.W)
+        self.steps_var = tk.IntVar(value=20)
+        ttk.Spinbox(speed_frame, from_=1, to=self.MAX_ANIMATION_STEPS, textvariable=self.steps_var, 
+                   width=6).grid(row=1, column=1, padx=(5, 0))
+        
+        info_frame = ttk.LabelFrame(control_frame, text="迷宫信息", padding=10)
+        info_frame.pack(fill=tk.BOTH, expand=True, pady=(10, 0))
+        
+        self.info_text = scrolledtext.ScrolledText(info_frame, height=10, width=25,
+                                                  font=("Consolas", 9))
+        self.info_text.pack(fill=tk.BOTH, expand=True)
+        self.info_text.configure(state=tk.DISABLED)
+        
+        display_frame = ttk.Frame(main_frame)
+        display_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
+        
+        self.canvas = tk.Canvas(display_frame, bg="white", bd=2, relief=tk.SUNKEN)
+        self.canvas.pack(fill=tk.BOTH, expand=True)
+        
+        # 拖动平移，滚轮缩放
+        self.canvas.bind("<Configure>", lambda event: self.schedule_render())
+        self.canvas.bind("<ButtonPress-1>", self.start_pan)
+        self.canvas.bind("<B1-Motion>", self.pan)
+        self.canvas.bind("<ButtonRelease-1>", self.end_pan)
+        self.canvas.bind("<MouseWheel>", self.zoom)
+        self.canvas.bind("<Button-4>", self.zoom)
+        self.canvas.bind("<Button-5>", self.zoom)
+        
+        self.status_var = tk.StringVar(value="就绪")
+        status_bar = ttk.Label(self.root, textvariable=self.status_var, 
+                              relief=tk.SUNKEN, anchor=tk.W)
+        status_bar.pack(side=tk.BOTTOM, fill=tk.X)
+    
+    def update_status(self, message):
+        self.status_var.set(message)
+        self.root.update_idletasks()
+    
+    def update_info(self, info_text):
+        self.info_text.configure(state=tk.NORMAL)
+        self.info_text.delete(1.0, tk.END)
+        self.info_text.insert(tk.END, info_text)
+        self.info_text.configure(state=tk.DISABLED)
+    
+    def job_buttons(self):
+        return (self.generate_btn, self.solve_btn, self.clear_btn, self.save_btn, 
+                self.load_btn, self.performance_btn)
+    
+    def start_job(self, name, target, on_done, *args, unit="格"):
+        """在工作线程中运行 target(job, *args)，完成后在主线程调用 on_done(结果)"""
+        if self.job is not None:
+            return
+        self.job = Job(name, self.events, unit)
+        self.job_handlers = {"done": on_done}
+        for button in self.job_buttons():
+            button.configure(state=tk.DISABLED)
+        self.cancel_btn.configure(state=tk.NORMAL)
+        self.progress_var.set(0)
+        self.update_status(f"正在{name}...")
+        threading.Thread(target=self.job.run, args=(target,) + args, daemon=True).start()
+    
+    def cancel_job(self):
+        if self.animation is not None:
+            self.stop_animation()
+        elif self.job is not None:
+            self.job.cancel()
+            self.cancel_btn.configure(state=tk.DISABLED)
+            self.update_status(f"正在取消{self.job.name}...")
+    
+    def finish_job(self):
+        self.job = None
+        self.cancel_btn.configure(state=tk.DISABLED)
+        self.generate_btn.configure(state=tk.NORMAL)
+        self.load_btn.configure(state=tk.NORMAL)
+        self.performance_btn.configure(state=tk.NORMAL)
+        if self.current_maze:
+            for button in (self.solve_btn, self.clear_btn, self.save_btn):
+                button.configure(state=tk.NORMAL)
+    
+    def poll_events(self):
+        """在主线程中处理工作线程发来的事件"""
+        try:
+            while True:
+                kind, job, data = self.events.get_nowait()
+                if job is not self.job:
+                    continue
+                if kind == "progress":
+                    self.show_progress(job, *data)
+                    continue
+                
+                if kind == "done":
+                    self.progress_var.set(100)
+                    try:
+                        self.job_handlers["done"](data)
+                    finally:
+                        self.finish_job()
+                    continue
+                
+                self.finish_job()
+                if kind == "cancelled":
+                    self.progress_var.set(0)
+                    self.update_status(f"{job.name}已取消")
+                else:
+                    self.progress_var.set(0)
+                    self.update_status(f"{job.name}失败")
+                    messagebox.showerror("错误", f"{job.name}时出错：{str(data)}")
+        except queue.Empty:
+            pass
+        self.root.after(50, self.poll_events)
+    
+    def show_progress(self, job, done, total, elapsed):
+        self.progress_var.set(100 * done / total if total else 0)
+        rate = done / elapsed if elapsed > 0 else 0
+        self.status_var.set(f"正在{job.name}... {done:,}/{total:,} {job.unit} "
+                            f"({rate:,.0f} {job.unit}/秒)")
+    
+    def generate_maze(self):
+        try:
+            width = self.width_var.get()
+            height = self.height_var.get()
+            algorithm = self.algorithm_var.get()
+        except tk.TclError:
+            messagebox.showerror("错误", "请输入有效的迷宫尺寸！")
+            return
+        
+        seed_text = self.seed_var.get().strip()
+        if seed_text and not (seed_text.isdigit() and int(seed_text) < SEED_LIMIT):
+            messagebox.showerror("错误", "随机种子必须是小于 2^64 的非负整数！")
+            return
+        seed = int(seed_text) if seed_text else None
+        
+        if not (5 <= width <= self.MAX_SIZE and 5 <= height <= self.MAX_SIZE):
+            messagebox.showerror("错误", f"迷宫尺寸必须在5-{self.MAX_SIZE}之间！")
+            return
+        
+        endpoints = "diameter" if self.diameter_var.get() else "corners"
+        if self.animate_var.get() and algorithm in STEP_GENERATORS:
+            # 动画使用逐步生成的迭代版本，不受递归深度限制
+            self.animate_generation(width, height, algorithm, seed, endpoints)
+            return
+        
+        if algorithm == "DFS" and width * height > MAX_RECURSIVE_DFS_CELLS:
+            messagebox.showerror("错误", "递归DFS不支持这么大的迷宫，请选择 DFS-Iter！")
+            return
+        
+        self.start_job("生成迷宫", self._generate_maze_job, self._on_maze_generated, 
+                       width, height, algorithm, seed, endpoints)
+    
+    @staticmethod
+    def _generate_maze_job(job, width, height, algorithm, seed=None, endpoints="corners"):
+        """工作线程中执行：只做计算，不访问界面"""
+        maze = Maze(width, height)
+        maze.algorithm = algorithm     # 生成器可改写为实际使用的算法
+        GENERATORS[algorithm](maze, progress=job.report, seed=seed)
+        if endpoints == "diameter":
+            place_on_diameter(maze)
+        return maze
+    
+    def _on_maze_generated(self, maze):
+        info = f"算法: {maze.algorithm}\n"
+        info += f"尺寸: {maze.width}x{maze.height}\n"
+        info += f"随机种子: {maze.seed}\n"
+        info += f"生成时间: {maze.generation_time:.4f}秒\n"
+        info += f"起点: {maze.start}\n"
+        info += f"终点: {maze.end}\n"
+        info += f"路径长度: 未求解\n"
+        info += "-" * 30 + "\n"
+        
+        self.update_info(info)
+        self.draw_maze(maze, f"{maze.algorithm}算法生成的迷宫")
+        rate = maze.width * maze.height / maze.generation_time if maze.generation_time > 0 else 0
+        self.update_status(f"迷宫生成完成！({rate:,.0f} 格/秒)")
+    
+    def solve_maze(self):
+        if not self.current_maze:
+            messagebox.showwarning("警告", "请先生成迷宫！")
+            return
+        
+        if self.animate_var.get():
+            solver = self.solver_var.get()
+            if solver not in STEP_SOLVERS:
+                solver = next(iter(STEP_SOLVERS))
+                self.update_status(f"动画演示使用 {solver} 求解")
+            self.animate_solution(solver)
+            return
+        
+        self.start_job("求解迷宫", self._solve_maze_job, self._on_maze_solved, 
+                       self.current_maze, self.solver_var.get())
+    
+    @staticmethod
+    def _solve_maze_job(job, maze, solver):
+        """工作线程中执行：结果先写入共享墙体的临时迷宫，回到主线程后再交给当前迷宫"""
+        work = Maze(maze.width, maze.height, maze.walls)
+        work.start, work.end = maze.start, maze.end
+        success = SOLVERS[solver](work, progress=job.report)
+        return maze, solver, success, work
+    
+    def _on_maze_solved(self, result):
+        maze, solver, success, work = result
+        if maze is not self.current_maze:
+            return
+        if not success:
+            messagebox.showwarning("警告", "未找到路径！")
+            self.update_status("未找到路径")
+            return
+        
+        maze.path = work.path
+        maze.solution_time = work.solution_time
+        maze.nodes_expanded = work.nodes_expanded
+        
+        info = f"算法: {maze.algorithm or self.algorithm_var.get()}\n"
+        info += f"尺寸: {maze.width}x{maze.height}\n"
+        info += f"随机种子: {maze.seed if maze.seed is not None else '未知'}\n"
+        info += f"生成时间: {maze.generation_time:.4f}秒\n"
+        info += f"求解算法: {solver}\n"
+        info += f"求解时间: {maze.solution_time:.4f}秒\n"
+        info += f"扩展节点: {maze.nodes_expanded}\n"
+        info += f"起点: {maze.start}\n"
+        info += f"终点: {maze.end}\n"
+        info += f"路径长度: {len(maze.path)-1}步\n"
+        info += "-" * 30 + "\n"
+        
+        self.update_info(info)
+        self.draw_path()
+        self.update_status(f"迷宫求解完成！路径长度：{len(maze.path)-1}步")
+    
+    def start_animation(self, name, steps, draw_batch, on_done, on_cancel=None):
+        """在主循环中逐帧推进 steps 生成器，每帧取一批事件交给 draw_batch 增量绘制"""
+        for button in self.job_buttons():
+            button.configure(state=tk.DISABLED)
+        self.cancel_btn.configure(state=tk.NORMAL)
+        self.progress_var.set(0)
+        self.update_status(f"正在{name}...")
+        self.animation = (name, steps, draw_batch, on_done, on_cancel)
+        self.root.after(0, self.animate_frame)
+    
+    def animate_frame(self):
+        if self.animation is None:
+            return
+        name, steps, draw_batch, on_done = self.animation[:4]
+        try:
+            batch = next(steps)
+        except StopIteration as stop:
+            self.animation = None
+            try:
+                on_done(stop.value)
+            finally:
+                self.finish_job()
+            return
+        draw_batch(batch)
+        try:
+            fps = max(1, min(60, self.fps_var.get()))
+        except tk.TclError:
+            fps = 30
+        self.root.after(1000 // fps, self.animate_frame)
+    
+    def stop_animation(self):
+        name, steps, on_cancel = self.animation[0], self.animation[1], self.animation[4]
+        self.animation = None
+        steps.close()
+        if on_cancel is not None:
+            on_cancel()
+        self.finish_job()
+        self.progress_var.set(0)
+        self.update_status(f"{name}已取消")
+    
+    def animation_batch_size(self):
+        try:
+            return max(1, min(self.MAX_ANIMATION_STEPS, self.steps_var.get()))
+        except tk.TclError:
+            return 20
+    
+    def visible_cells(self):
+        """视口内的格子范围 (x0, y0, x1, y1)，与 render_view 的裁剪一致"""
+        canvas_width, canvas_height = self.canvas_size()
+        scale = self.view_scale
+        origin_x, origin_y = self.view_origin
+        maze = self.current_maze
+        return (max(0, int(-origin_x // scale)), max(0, int(-origin_y // scale)),
+                min(maze.width, int((canvas_width - origin_x) // scale) + 1),
+                min(maze.height, int((canvas_height - origin_y) // scale) + 1))
+    
+    def animate_generation(self, width, height, algorithm, seed=None, endpoints="corners"):
+        maze = Maze(width, height)
+        maze.algorithm = algorithm
+        self.draw_maze(maze, f"{algorithm}算法生成中...")
+        steps = STEP_GENERATORS[algorithm](maze, self.animation_batch_size(), seed)
+        carved = [0]
+        
+        def draw_batch(batch):
+            """用底色线段盖住被打通的墙，不重画整个迷宫"""
+            carved[0] += len(batch)
+            self.progress_var.set(100 * carved[0] / (width * height - 1))
+            self.status_var.set(f"正在生成迷宫... {carved[0]:,}/{width * height - 1:,} 步")
+            if self.view_scale < self.VECTOR_MIN_SCALE and np is not None:
+                # 缩略图模式下没有单独的墙体图元，定期整体重绘
+                if self.render_job is None:
+                    self.overview = None
+                    self.schedule_render(500)
+                return
+            
+            x0, y0, x1, y1 = self.visible_cells()
+            scale = self.view_scale
+            origin_x, origin_y = self.view_origin
+            inset = (3 if self.thick_walls_var.get() else 1) / 2 + 0.5
+            color = self.grid_color if self.show_grid_var.get() else self.cell_color
+            for cell, neighbor in batch:
+                y, x = divmod(max(cell, neighbor), width)
+                if not (x0 <= x < x1 and y0 <= y < y1):
+                    continue
+                left, top = origin_x + x * scale, origin_y + y * scale
+                if abs(cell - neighbor) == 1:
+                    self.canvas.create_line(left, top + inset, left, top + scale - inset, 
+                                          fill=color, width=inset * 2, tags=("view", "carve"))
+                else:
+                    self.canvas.create_line(left + inset, top, left + scale - inset, top, 
+                                          fill=color, width=inset * 2, tags=("view", "carve"))
+        
+        def on_done(result):
+            if endpoints == "diameter":
+                place_on_diameter(maze)
+            self.maze_title = f"{algorithm}算法生成的迷宫"
+            self.overview = None
+            self.render_view()
+            self._on_maze_generated(maze)
+        
+        def on_cancel():
+            # 未完成的迷宫不可求解，直接丢弃
+            self.current_maze = None
+            self.render_view()
+        
+        self.start_animation("生成迷宫", steps, draw_batch, on_done, on_cancel)
+    
+    def animate_solution(self, solver):
+        maze = self.current_maze
+        maze.path = []
+        self.render_view()
+        steps = STEP_SOLVERS[solver](maze, self.animation_batch_size())
+        width = maze.width
+        cell_count = width * maze.height
+        endpoints = {maze.start[0] * width + maze.start[1], maze.end[0] * width + maze.end[1]}
+        expanded = [0]
+        
+        def draw_batch(batch):
+            """把本批扩展的格子画成浅色方块，逐层显示搜索前沿"""
+            expanded[0] += len(batch)
+            self.progress_var.set(100 * expanded[0] / cell_count)
+            self.status_var.set(f"正在求解迷宫... 已扩展 {expanded[0]:,} 格")
+            scale = self.view_scale
+            if scale < self.VECTOR_MIN_SCALE:
+                return
+            x0, y0, x1, y1 = self.visible_cells()
+            origin_x, origin_y = self.view_origin
+            inset = max(1, scale / 6)
+            for cell in batch:
+                y, x = divmod(cell, width)
+                if x0 <= x < x1 and y0 <= y < y1 and cell not in endpoints:
+                    left, top = origin_x + x * scale, origin_y + y * scale
+                    self.canvas.create_rectangle(left + inset, top + inset, 
+                                               left + scale - inset, top + scale - inset, 
+                                               fill=self.visit_color, outline="", 
+                                               tags=("view", "visit"))
+        
+        def on_done(found):
+            self._on_maze_solved((maze, solver, found, maze))
+        
+        self.start_animation("求解迷宫", steps, draw_batch, on_done, self.render_view)
+    
+    def clear_path(self):
+        """清除路径"""
+        if self.current_maze:
+            self.current_maze.path = []
+        
+        self.draw_path()
+        self.update_status("路径已清除")
+    
+    def save_maze(self):
+        """保存当前迷宫为二进制文件"""
+        if not self.current_maze:
+            messagebox.showwarning("警告", "请先生成迷宫！")
+            return
+        
+        path = filedialog.asksaveasfilename(defaultextension=".maze",
+                                            filetypes=[("迷宫文件", "*.maze"), ("所有文件", "*.*")])
+        if not path:
+            return
+        
+        try:
+            from .io import save_maze
+            save_maze(self.current_maze, path)
+            self.update_status(f"迷宫已保存到 {path}")
+        except Exception as e:
+            messagebox.showerror("错误", f"保存迷宫时出错：{str(e)}")
+    
+    def load_maze(self):
+        """从二进制文件加载迷宫"""
+        path = filedialog.askopenfilename(filetypes=[("迷宫文件", "*.maze"), ("所有文件", "*.*")])
+        if not path:
+            return
+        
+        try:
+            from .io import load_maze
+            maze = load_maze(path, lazy=False)
+        except Exception as e:
+            messagebox.showerror("错误", f"加载迷宫时出错：{str(e)}")
+            return
+        
+        if maze.algorithm:
+            self.algorithm_var.set(maze.algorithm)
+        info = f"算法: {maze.algorithm or '未知'}\n"
+        info += f"尺寸: {maze.width}x{maze.height}\n"
+        info += f"随机种子: {maze.seed if maze.seed is not None else '未知'}\n"
+        info += f"起点: {maze.start}\n"
+        info += f"终点: {maze.end}\n"
+        info += f"路径长度: 未求解\n"
+        info += "-" * 30 + "\n"
+        self.update_info(info)
+        
+        self.draw_maze(maze, f"{maze.algorithm or '已加载'}迷宫")
+        self.solve_btn.configure(state=tk.NORMAL)
+        self.clear_btn.configure(state=tk.NORMAL)
+        self.save_btn.configure(state=tk.NORMAL)
+        self.update_status(f"已加载迷宫 {path}")
+    
+    def draw_maze(self, maze, title=""):
+        """显示迷宫，视图缩放到整个迷宫可见"""
+        self.current_maze = maze
+        self.maze_title = title
+        self.overview = None
+        self.path_points = None
+        self.fit_view()
+        self.render_view()
+    
+    def canvas_size(self):
+        canvas_width = self.canvas.winfo_width()
+        canvas_height = self.canvas.winfo_height()
+        if canvas_width <= 50 or canvas_height <= 50:
+            return 900, 650
+        return canvas_width, canvas_height
+    
+    def fit_view(self):
+        """选择能容纳整个迷宫的缩放，并居中（上方留出标题，下方留出图例）"""
+        maze = self.current_maze
+        canvas_width, canvas_height = self.canvas_size()
+        scale = min((canvas_width - 20) / maze.width, (canvas_height - 100) / maze.height)
+        scale = min(scale, 40)
+        if np is None:
+            # 缩略图需要NumPy，没有时只能以矢量方式显示局部并平移浏览
+            scale = max(scale, self.VECTOR_MIN_SCALE)
+        self.view_scale = scale
+        self.view_origin = ((canvas_width - maze.width * scale) / 2,
+                            50 + (canvas_height - 100 - maze.height * scale) / 2)
+    
+    def schedule_render(self, delay=15):
+        """合并短时间内的多次重绘请求"""
+        if self.render_job is None and self.current_maze:
+            self.render_job = self.root.after(delay, self.render_view)
+    
+    def render_view(self):
+        """只绘制视口内可见的格子
+
+        画布按图层组织，每层用 tag 标记：底色 cell、网格 grid、路径 path、
+        起终点 marker、墙体 wall，视图内的图元都带 view。缩放较大时墙体按网格线
+        合并成长线段绘制；缩放较小时改为从缩略图金字塔采样生成一张图片。
+        显示选项切换时只修改对应 tag 的属性，不重新创建图元。
+        """
+        self.render_job = None
+        self.canvas.delete("all")
+        maze = self.current_maze
+        if not maze:
+            return
+        
+        canvas_width, canvas_height = self.canvas_size()
+        scale = self.view_scale
+        origin_x, origin_y = self.view_origin
+        x0 = max(0, int(-origin_x // scale))
+        y0 = max(0, int(-origin_y // scale))
+        x1 = min(maze.width, int((canvas_width - origin_x) // scale) + 1)
+        y1 = min(maze.height, int((canvas_height - origin_y) // scale) + 1)
+        
+        if x0 < x1 and y0 < y1:
+            if scale >= self.VECTOR_MIN_SCALE or np is None:
+                self.draw_cells(x0, y0, x1, y1)
+            else:
+                self.draw_overview(canvas_width, canvas_height)
+            
+            for (y, x), color in ((maze.start, self.start_color), (maze.end, self.end_color)):
+                cell_x = origin_x + x * scale
+                cell_y = origin_y + y * scale
+                marker = max(scale, 4)
+                self.canvas.create_rectangle(cell_x, cell_y, cell_x + marker, cell_y + marker, 
+                                           fill=color, outline="", tags=("view", "marker"))
+            if self.canvas.find_withtag("wall"):
+                self.canvas.tag_raise("wall", "marker")
+            self.draw_path()
+        
+        self.canvas.create_rectangle(0, 0, canvas_width, 40, fill="white", outline="")
+        if self.maze_title:
+            self.canvas.create_text(canvas_width//2, 20, text=self.maze_title, 
+                                  font=("Arial", 14, "bold"), fill="black")
+        self.draw_legend(10, canvas_height - 30)
+    
+    def draw_cells(self, x0, y0, x1, y1):
+        """以矢量图元绘制列 [x0, x1)、行 [y0, y1) 范围内的格子"""
+        maze = self.current_maze
+        scale = self.view_scale
+        origin_x, origin_y = self.view_origin
+        left, top = origin_x + x0 * scale, origin_y + y0 * scale
+        right, bottom = origin_x + x1 * scale, origin_y + y1 * scale
+        
+        self.canvas.create_rectangle(left, top, right, bottom, 
+                                   fill=self.cell_color, outline="", tags=("view", "cell"))
+        
+        grid_state = tk.NORMAL if self.show_grid_var.get() else tk.HIDDEN
+        for y in range(max(y0, 1), min(y1, maze.height - 1) + 1):
+            self.canvas.create_line(left, origin_y + y * scale, right, origin_y + y * scale, 
+                                  fill=self.grid_color, state=grid_state, tags=("view", "grid"))
+        for x in range(max(x0, 1), min(x1, maze.width - 1) + 1):
+            self.canvas.create_line(origin_x + x * scale, top, origin_x + x * scale, bottom, 
+                                  fill=self.grid_color, state=grid_state, tags=("view", "grid"))
+        
+        wall_width = 3 if self.thick_walls_var.get() else 1
+        for wall_x1, wall_y1, wall_x2, wall_y2 in wall_segments(maze, x0, y0, x1, y1):
+            self.canvas.create_line(origin_x + wall_x1 * scale, origin_y + wall_y1 * scale, 
+                                  origin_x + wall_x2 * scale, origin_y + wall_y2 * scale, 
+                                  fill=self.wall_color, width=wall_width, 
+                                  capstyle=tk.PROJECTING, tags=("view", "wall"))
+    
+    def draw_overview(self, canvas_width, canvas_height):
+        """低倍率时从缩略图金字塔按像素采样，整个视口只生成一张图片"""
+        maze = self.current_maze
+        if self.overview is None:
+            self.overview = overview_levels(maze)
+        scale = self.view_scale
+        origin_x, origin_y = self.view_origin
+        
+        # 第 0 层每格 2 像素，选择每格像素数不少于屏幕每格像素数的最小一层
+        level_index = 0
+        while level_index + 1 < len(self.overview) and 2 / 2 ** (level_index + 1) >= scale:
+            level_index += 1
+        level = self.overview[level_index]
+        level_scale = level.shape[1] / (maze.width * scale)
+        
+        left = max(0, int(origin_x))
+        top = max(0, int(origin_y))
+        right = min(canvas_width, int(origin_x + maze.width * scale) + 1)
+        bottom = min(canvas_height, int(origin_y + maze.height * scale) + 1)
+        if left >= right or top >= bottom:
+            return
+        
+        columns = ((np.arange(left, right) - origin_x) * level_scale).astype(np.intp)
+        rows = ((np.arange(top, bottom) - origin_y) * level_scale).astype(np.intp)
+        np.clip(columns, 0, level.shape[1] - 1, out=columns)
+        np.clip(rows, 0, level.shape[0] - 1, out=rows)
+        shade = level[np.ix_(rows, columns)].astype(np.float32)[..., None] / 255
+        
+        wall = np.array(self.canvas.winfo_rgb(self.wall_color), dtype=np.float32) / 257
+        cell = np.array(self.canvas.winfo_rgb(self.cell_color), dtype=np.float32) / 257
+        rgb = (wall + (cell - wall) * shade).astype(np.uint8)
+        
+        header = f"P6 {right - left} {bottom - top} 255\n".encode("ascii")
+        # 需要保留对图片的引用，否则会被回收
+        self.overview_image = tk.PhotoImage(data=header + rgb.tobytes(), format="PPM")
+        self.canvas.create_image(left, top, image=self.overview_image, anchor=tk.NW, 
+                               tags=("view", "cell"))
+    
+    def draw_path(self):
+        """重画路径图层：路径按拐点连成宽度为格子大小的折线，只保留与视口相交的部分"""
+        self.canvas.delete("path")
+        maze = self.current_maze
+        if not maze or not maze.path:
+            return
+        
+        if self.path_points is None or self.path_points[0] is not maze.path:
+            points = [maze.path[0]]
+            for previous, current, following in zip(maze.path, maze.path[1:], maze.path[2:]):
+                if (current[0] - previous[0], current[1] - previous[1]) != \
+                   (following[0] - current[0], following[1] - current[1]):
+                    points.append(current)
+            points.append(maze.path[-1])
+            self.path_points = (maze.path, points)
+        points = self.path_points[1]
+        
+        canvas_width, canvas_height = self.canvas_size()
+        scale = self.view_scale
+        origin_x, origin_y = self.view_origin
+        half = scale / 2
+        # 视口对应的格子范围（多留一格）
+        view_x0 = -origin_x / scale - 1
+        view_y0 = -origin_y / scale - 1
+        view_x1 = (canvas_width - origin_x) / scale + 1
+        view_y1 = (canvas_height - origin_y) / scale + 1
+        
+        runs = []
+        run = None
+        for (y1, x1), (y2, x2) in zip(points, points[1:] or points):
+            visible = (min(x1, x2) <= view_x1 and max(x1, x2) >= view_x0 and
+                       min(y1, y2) <= view_y1 and max(y1, y2) >= view_y0)
+            if visible:
+                if run is None:
+                    run = [(y1, x1)]
+                    runs.append(run)
+                run.append((y2, x2))
+            else:
+                run = None
+        
+        state = tk.NORMAL if self.show_path_var.get() else tk.HIDDEN
+        for run in runs:
+            coords = []
+            for y, x in run:
+                coords.extend((origin_x + x * scale + half, origin_y + y * scale + half))
+            self.canvas.create_line(*coords, fill=self.path_color, width=max(scale, 1), 
+                                  capstyle=tk.PROJECTING, joinstyle=tk.MITER, 
+                                  state=state, tags=("view", "path"))
+        if runs:
+            self.canvas.tag_lower("path", "marker")
+    
+    def start_pan(self, event):
+        self.pan_anchor = (event.x, event.y)
+    
+    def pan(self, event):
+        """拖动时直接移动已有图元，松开后再补画新露出的区域"""
+        if self.pan_anchor is None or not self.current_maze:
+            return
+        dx = event.x - self.pan_anchor[0]
+        dy = event.y - self.pan_anchor[1]
+        self.pan_anchor = (event.x, event.y)
+        origin_x, origin_y = self.view_origin
+        self.view_origin = (origin_x + dx, origin_y + dy)
+        self.canvas.move("view", dx, dy)
+    
+    def end_pan(self, event):
+        if self.pan_anchor is not None:
+            self.pan_anchor = None
+            self.schedule_render(0)
+    
+    def zoom(self, event):
+        """以鼠标位置为中心缩放"""
+        if not self.current_maze:
+            return
+        factor = 1.25 if event.num == 4 or getattr(event, "delta", 0) > 0 else 0.8
+        canvas_width, canvas_height = self.canvas_size()
+        fit_scale = min(canvas_width / self.current_maze.width, 
+                        canvas_height / self.current_maze.height)
+        min_scale = self.VECTOR_MIN_SCALE if np is None else min(fit_scale / 2, self.VECTOR_MIN_SCALE)
+        scale = max(min_scale, min(self.MAX_SCALE, self.view_scale * factor))
+        
+        origin_x, origin_y = self.view_origin
+        ratio = scale / self.view_scale
+        self.view_origin = (event.x - (event.x - origin_x) * ratio, 
+                            event.y - (event.y - origin_y) * ratio)
+        self.view_scale = scale
+        self.schedule_render()
+    
+    def toggle_path(self):
+        self.canvas.itemconfigure("path", 
+                                  state=tk.NORMAL if self.show_path_var.get() else tk.HIDDEN)
+    
+    def toggle_grid(self):
+        self.canvas.itemconfigure("grid", 
+                                  state=tk.NORMAL if self.show_grid_var.get() else tk.HIDDEN)
+    
+    def toggle_walls(self):
+        self.canvas.itemconfigure("wall", width=3 if self.thick_walls_var.get() else 1)
+    
+    def draw_legend(self, x, y):
+        legend_items = [
+            ("起点", self.start_color),
+            ("终点", self.end_color),
+            ("路径", self.path_color),
+            ("墙体", self.wall_color)
+        ]
+        
+        self.canvas.create_rectangle(x - 5, y - 5, x + len(legend_items) * 100, y + 20, 
+                                   fill="white", outline="")
+        
+        for i, (text, color) in enumerate(legend_items):
+            box_x = x + i * 100
+            box_size = 15
+            
+            if text == "墙体":
+                self.canvas.create_rectangle(box_x, y, box_x + box_size, y + box_size, 
+                                           fill="white", outline=color, width=2)
+            else:
+                self.canvas.create_rectangle(box_x, y, box_x + box_size, y + box_size, 
+                                           fill=color, outline="black")
+            
+            self.canvas.create_text(box_x + box_size + 10, y + box_size//2, 
+                                  text=text, anchor=tk.W, font=("Arial", 10))
+    
+    def redraw_maze(self):
+        if self.current_maze:
+            self.render_view()
+    
+    def run_performance_test(self):
+        self.start_job("性能测试", self._performance_test_job, self.show_performance_results, 
+                       unit="项")
+    
+    @staticmethod
+    def _performance_test_job(job):
+        """性能测试任务：各生成、求解算法分阶段计时，每完成一个用例汇报一次进度"""
+        from . import benchmark
+        result = benchmark.run_benchmark(sizes=benchmark.sweep(100), repeat=5, 
+                                         progress=job.report)
+        return "性能测试：分配 / 生成 / 求解\n" + "=" * 80 + "\n" + benchmark.format_report(result)
+    
+    def show_performance_results(self, result_text):
+        self.update_status("性能测试完成！")
+        result_window = tk.Toplevel(self.root)
+        result_window.title("性能测试结果")
+        result_window.geometry("760x480")
+        
+
+        text_widget = scrolledtext.ScrolledText(result_window, wrap=tk.WORD, 
+                                               font=("Consolas", 10))
+        text_widget.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        text_widget.insert(tk.END, result_text)
+        text_widget.configure(state=tk.DISABLED)
+        
+        ttk.Button(result_window, text="关闭", 
+                  command=result_window.destroy).pack(pady=10)
+    
+    def run(self):
+        """运行GUI"""
+        self.root.mainloop()
+
+
+def main():
+    gui = MazeGUI()
+    gui.run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""完美迷宫的路径索引"""
+import time
+from array import array
+
+from .core import load_numpy, move_table, sealed_walls
+
+
+class MazeIndex:
+    """完美迷宫（生成树）的路径索引：一次构建后，距离查询 O(log n)，路径提取 O(路径长度)"""
+    
+    def __init__(self, maze, root=None):
+        self.width = maze.width
+        self.height = maze.height
+        width = maze.width
+        cell_count = width * maze.height
+        walls = sealed_walls(maze)
+        moves = move_table(width)
+        root_y, root_x = maze.start if root is None else root
+        root = root_y * width + root_x
+        
+        # BFS 为生成树定根，同时检查是否有环或不连通
+        parent = array('i', [-1]) * cell_count
+        depth = array('i', [0]) * cell_count
+        parent[root] = root
+        order = [root]
+        for cell in order:
+            next_depth = depth[cell] + 1
+            for offset in moves[walls[cell]]:
+                neighbor = cell + offset
+                if parent[neighbor] < 0:
+                    parent[neighbor] = cell
+                    depth[neighbor] = next_depth
+                    order.append(neighbor)
+                elif neighbor != parent[cell]:
+                    raise ValueError("迷宫中存在环路，不是完美迷宫")
+        if len(order) != cell_count:
+            raise ValueError("迷宫不连通，不是完美迷宫")
+        
+        self.root = root
+        self.depth = depth
+        # 倍增祖先表：up[k][cell] 为 cell 向上第 2^k 个祖先（根的祖先为自身）
+        self.up = [parent]
+        np = load_numpy()
+        for _ in range(max(depth[order[-1]], 1).bit_length() - 1):
+            previous = self.up[-1]
+            if np is not None:
+                ancestors = np.frombuffer(previous, dtype=np.intc)
+                level = array('i')
+                level.frombytes(ancestors[ancestors].tobytes())
+            else:
+                level = array('i', map(previous.__getitem__, previous))
+            self.up.append(level)
+    
+    def _cell_id(self, cell):
+        y, x = cell
+        return y * self.width + x
+    
+    def _lca_id(self, a, b):
+        depth = self.depth
+        up = self.up
+        if depth[a] < depth[b]:
+            a, b = b, a
+        diff = depth[a] - depth[b]
+        level = 0
+        while diff:
+            if diff & 1:
+                a = up[level][a]
+            diff >>= 1
+            level += 1
+        if a == b:
+            return a
+        for level in range(len(up) - 1, -1, -1):
+            if up[level][a] != up[level][b]:
+                a = up[level][a]
+                b = up[level][b]
+        return up[0][a]
+    
+    def lca(self, a, b):
+        """两个格子的最近公共祖先"""
+        return divmod(self._lca_id(self._cell_id(a), self._cell_id(b)), self.width)
+    
+    def distance(self, a, b):
+        """两个格子之间的最短路径步数"""
+        a, b = self._cell_id(a), self._cell_id(b)
+        depth = self.depth
+        return depth[a] + depth[b] - 2 * depth[self._lca_id(a, b)]
+    
+    def path(self, a, b):
+        """a 到 b 的唯一路径，只沿父指针走到公共祖先，不做图搜索"""
+        a, b = self._cell_id(a), self._cell_id(b)
+        ancestor = self._lca_id(a, b)
+        parent = self.up[0]
+        width = self.width
+        
+        forward = []
+        while a != ancestor:
+            forward.append(divmod(a, width))
+            a = parent[a]
+        forward.append(divmod(ancestor, width))
+        
+        backward = []
+        while b != ancestor:
+            backward.append(divmod(b, width))
+            b = parent[b]
+        backward.reverse()
+        return forward + backward
+    
+    def solve(self, maze):
+        """按 maze.start / maze.end 填充 maze.path，与各求解器的输出格式一致"""
+        start_time = time.time()
+        maze.path = self.path(maze.start, maze.end)
+        maze.nodes_expanded = 0
+        maze.solution_time = time.time() - start_time
+        return True
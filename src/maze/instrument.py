@@ -0,0 +1,165 @@
+"""可选的性能分析工具
+
+Stats 按阶段收集计数器、墙钟时间，并可选地记录 tracemalloc 峰值内存和
+cProfile 剖析结果。把 Stats 对象作为 stats 参数传给生成或求解算法即可启用
+计数，不传时算法内部不做任何额外工作：
+
+    stats = Stats(trace_memory=True, profile=True)
+    maze = Maze(1000, 1000)
+    with stats.phase("generate"):
+        MazeGenerator.generate_kruskal(maze, stats=stats)
+    print(stats.report())
+
+命令行用法：
+    python -m maze.instrument --size 1000x1000 --generator Kruskal --solver BFS --memory --profile
+"""
+import cProfile
+import io
+import pstats
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+from .core import Maze
+from .generators import GENERATORS
+from .solvers import SOLVERS
+
+
+class PhaseStats:
+    """单个阶段的统计结果"""
+
+    def __init__(self, name):
+        self.name = name
+        self.counters = {}
+        self.wall_ns = 0
+        self.peak_memory = None  # 字节，仅在 trace_memory 时记录
+        self.profile = None      # pstats.Stats，仅在 profile 时记录
+
+    def as_dict(self):
+        return {
+            "counters": dict(self.counters),
+            "wall_ns": self.wall_ns,
+            "peak_memory": self.peak_memory,
+        }
+
+
+class Stats:
+    """按阶段记录的计数器集合，算法通过 add / maximum 写入当前阶段"""
+
+    def __init__(self, trace_memory=False, profile=False):
+        self.trace_memory = trace_memory
+        self.profile = profile
+        self.phases = {}
+        self.current = self._get_phase("total")
+
+    def _get_phase(self, name):
+        phase = self.phases.get(name)
+        if phase is None:
+            phase = self.phases[name] = PhaseStats(name)
+        return phase
+
+    def add(self, name, value=1):
+        counters = self.current.counters
+        counters[name] = counters.get(name, 0) + value
+
+    def maximum(self, name, value):
+        counters = self.current.counters
+        counters[name] = max(counters.get(name, value), value)
+
+    def __getitem__(self, name):
+        """当前阶段的计数器"""
+        return self.current.counters[name]
+
+    @contextmanager
+    def phase(self, name):
+        """在 with 块内把计数记入 name 阶段，并记录耗时、峰值内存和剖析结果"""
+        previous = self.current
+        phase = self.current = self._get_phase(name)
+
+        started_tracing = False
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                started_tracing = True
+            tracemalloc.reset_peak()
+            memory_before = tracemalloc.get_traced_memory()[0]
+        profiler = cProfile.Profile() if self.profile else None
+
+        start = time.perf_counter_ns()
+        if profiler is not None:
+            profiler.enable()
+        try:
+            yield phase
+        finally:
+            if profiler is not None:
+                profiler.disable()
+            phase.wall_ns += time.perf_counter_ns() - start
+            if self.trace_memory:
+                peak = tracemalloc.get_traced_memory()[1] - memory_before
+                phase.peak_memory = max(phase.peak_memory or 0, peak)
+                if started_tracing:
+                    tracemalloc.stop()
+            if profiler is not None:
+                if phase.profile is None:
+                    phase.profile = pstats.Stats(profiler)
+                else:
+                    phase.profile.add(profiler)
+            self.current = previous
+
+    def as_dict(self):
+        return {name: phase.as_dict() for name, phase in self.phases.items()
+                if phase.counters or phase.wall_ns}
+
+    def report(self, profile_lines=15):
+        """文本报告；开启剖析时附上按累计时间排序的前 profile_lines 个函数"""
+        lines = []
+        for name, phase in self.phases.items():
+            if not phase.counters and not phase.wall_ns:
+                continue
+            lines.append(f"[{name}] 耗时 {phase.wall_ns / 1e6:.2f}ms"
+                         + (f", 峰值内存 {phase.peak_memory / 1024:.1f}KiB"
+                            if phase.peak_memory is not None else ""))
+            for counter, value in phase.counters.items():
+                lines.append(f"  {counter:<20}{value:>14,}")
+            if phase.profile is not None:
+                buffer = io.StringIO()
+                phase.profile.stream = buffer
+                phase.profile.sort_stats("cumulative").print_stats(profile_lines)
+                lines.append(buffer.getvalue().rstrip())
+        return "\n".join(lines)
+
+
+def profile_run(width, height, generator="Kruskal", solver="BFS",
+                trace_memory=False, profile=False):
+    """生成并求解一个迷宫，返回 (迷宫, Stats)，生成与求解分别为一个阶段"""
+    stats = Stats(trace_memory=trace_memory, profile=profile)
+    with stats.phase("alloc"):
+        maze = Maze(width, height)
+    with stats.phase("generate"):
+        GENERATORS[generator](maze, stats=stats)
+    with stats.phase("solve"):
+        SOLVERS[solver](maze, stats=stats)
+    return maze, stats
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="迷宫生成与求解的分阶段性能分析")
+    parser.add_argument("--size", default="500x500", help="迷宫尺寸，如 1000x1000")
+    parser.add_argument("--generator", default="Kruskal", choices=list(GENERATORS))
+    parser.add_argument("--solver", default="BFS", choices=list(SOLVERS))
+    parser.add_argument("--memory", action="store_true", help="用 tracemalloc 记录峰值内存")
+    parser.add_argument("--profile", action="store_true", help="用 cProfile 剖析各阶段")
+    args = parser.parse_args(argv)
+
+    width, _, height = args.size.lower().partition("x")
+    _, stats = profile_run(int(width), int(height or width), args.generator, args.solver,
+                           trace_memory=args.memory, profile=args.profile)
+    print(stats.report())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,149 @@
+"""迷宫二进制文件格式
+
+文件由 64 字节的文件头和墙体数据组成：
+
+    偏移  类型      含义
+    0     4s        魔数 b"MAZE"
+    4     uint16    格式版本
+    6     uint16    标志位（bit0: 是否记录了随机种子）
+    8     uint32    宽度
+    12    uint32    高度
+    16    uint32*4  起点 (y, x)、终点 (y, x)
+    32    uint64    随机种子
+    40    16s       生成算法名（UTF-8，不足补零）
+    56    -         保留，补零到 64 字节
+
+随后是 width * height 字节的墙体位，布局与 Maze.walls 完全相同，
+因此可以用 mmap 直接映射为 Maze.walls，只有被访问到的页才会读入内存。
+"""
+import mmap
+import struct
+
+from .core import SEED_LIMIT, Maze
+
+MAGIC = b"MAZE"
+VERSION = 1
+HEADER_SIZE = 64
+FLAG_HAS_SEED = 1
+
+_HEADER = struct.Struct("<4sHHIIIIIIQ16s")
+
+
+def pack_header(width, height, start=(0, 0), end=None, algorithm=None, seed=None):
+    """构造文件头"""
+    if end is None:
+        end = (height - 1, width - 1)
+    flags = 0
+    if seed is not None:
+        if not 0 <= seed < SEED_LIMIT:
+            raise ValueError("随机种子必须是 64 位无符号整数")
+        flags |= FLAG_HAS_SEED
+    name = (algorithm or "").encode("utf-8")
+    if len(name) > 16:
+        raise ValueError("算法名不能超过 16 字节")
+    header = _HEADER.pack(MAGIC, VERSION, flags, width, height,
+                          start[0], start[1], end[0], end[1], seed or 0, name)
+    return header.ljust(HEADER_SIZE, b"\0")
+
+
+def unpack_header(data):
+    """解析文件头，返回字段字典"""
+    if len(data) < HEADER_SIZE:
+        raise ValueError("文件过短，不是迷宫文件")
+    (magic, version, flags, width, height,
+     start_y, start_x, end_y, end_x, seed, name) = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("不是迷宫文件")
+    if version != VERSION:
+        raise ValueError(f"不支持的文件版本: {version}")
+    return {
+        "width": width,
+        "height": height,
+        "start": (start_y, start_x),
+        "end": (end_y, end_x),
+        "algorithm": name.rstrip(b"\0").decode("utf-8") or None,
+        "seed": seed if flags & FLAG_HAS_SEED else None,
+    }
+
+
+def _maze_from_header(header, walls):
+    maze = Maze(header["width"], header["height"], walls=walls)
+    maze.start = header["start"]
+    maze.end = header["end"]
+    maze.algorithm = header["algorithm"]
+    maze.seed = header["seed"]
+    return maze
+
+
+def dumps(maze):
+    """序列化为紧凑的字节串"""
+    header = pack_header(maze.width, maze.height, maze.start, maze.end,
+                         maze.algorithm, maze.seed)
+    return header + bytes(maze.walls)
+
+
+def loads(data):
+    """从 dumps 的结果恢复迷宫（墙体数据会复制到新的 bytearray）"""
+    header = unpack_header(data)
+    size = header["width"] * header["height"]
+    walls = bytearray(data[HEADER_SIZE:HEADER_SIZE + size])
+    if len(walls) != size:
+        raise ValueError("墙体数据不完整")
+    return _maze_from_header(header, walls)
+
+
+def read_mazes(stream):
+    """从二进制流中依次读取 dumps / save_maze 写出的迷宫记录，直到流结束
+
+    多条记录可以直接首尾相接，因此可以通过管道在进程间传递一串迷宫。
+    """
+    while True:
+        head = stream.read(HEADER_SIZE)
+        if not head:
+            return
+        header = unpack_header(head)
+        size = header["width"] * header["height"]
+        walls = bytearray(stream.read(size))
+        if len(walls) != size:
+            raise ValueError("墙体数据不完整")
+        yield _maze_from_header(header, walls)
+
+
+def save_maze(maze, path):
+    """保存迷宫到文件"""
+    with open(path, "wb") as f:
+        f.write(pack_header(maze.width, maze.height, maze.start, maze.end,
+                            maze.algorithm, maze.seed))
+        f.write(maze.walls)
+
+
+def write_rows(path, width, height, rows, algorithm=None, seed=None):
+    """把逐行产生的墙体数据（如 generate_eller_rows）直接写入文件，内存只占一行"""
+    written = 0
+    with open(path, "wb") as f:
+        f.write(pack_header(width, height, algorithm=algorithm, seed=seed))
+        for row in rows:
+            f.write(row)
+            written += len(row)
+    if written != width * height:
+        raise ValueError("写入的墙体数据与迷宫尺寸不符")
+
+
+def load_maze(path, lazy=True):
+    """读取迷宫文件
+
+    lazy=True 时通过 mmap 映射文件，Maze.walls 是映射区的 memoryview，
+    打开几乎不耗时，格子在被访问时才分页读入；映射采用写时复制，
+    修改墙体不会写回文件。lazy=False 时把墙体完整读入 bytearray。
+    """
+    with open(path, "rb") as f:
+        if not lazy:
+            return loads(f.read())
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+
+    header = unpack_header(mapped[:HEADER_SIZE])
+    size = header["width"] * header["height"]
+    if len(mapped) < HEADER_SIZE + size:
+        raise ValueError("墙体数据不完整")
+    walls = memoryview(mapped)[HEADER_SIZE:HEADER_SIZE + size]
+    return _maze_from_header(header, walls)
@@ -0,0 +1,50 @@
+"""在工作线程中运行、可取消并汇报进度的后台任务"""
+import threading
+import time
+
+
+class JobCancelled(Exception):
+    """后台任务被用户取消"""
+
+
+class Job:
+    """在工作线程中运行的后台任务
+
+    工作线程不直接调用Tk，只把 (事件, 任务, 数据) 放入事件队列，由主循环取出处理。
+    report 作为算法的 progress 回调：检查取消标记，并限制进度事件的发送频率。
+    """
+    
+    REPORT_INTERVAL = 0.1  # 秒
+    
+    def __init__(self, name, events, unit="格"):
+        self.name = name
+        self.events = events
+        self.unit = unit
+        self.cancel_event = threading.Event()
+        self.started = time.perf_counter()
+        self.last_report = 0.0
+    
+    def cancel(self):
+        self.cancel_event.set()
+    
+    @property
+    def cancelled(self):
+        return self.cancel_event.is_set()
+    
+    def report(self, done, total):
+        if self.cancel_event.is_set():
+            raise JobCancelled()
+        now = time.perf_counter()
+        if now - self.last_report >= self.REPORT_INTERVAL:
+            self.last_report = now
+            self.events.put(("progress", self, (done, total, now - self.started)))
+    
+    def run(self, target, *args):
+        try:
+            result = target(self, *args)
+        except JobCancelled:
+            self.events.put(("cancelled", self, None))
+        except Exception as e:
+            self.events.put(("error", self, e))
+        else:
+            self.events.put(("done", self, result))
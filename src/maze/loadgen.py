@@ -0,0 +1,189 @@
+"""迷宫服务的压测工具：报告每秒请求数和延迟分位数
+
+    python -m maze.service --port 8080 &
+    python -m maze.loadgen --port 8080 --requests 2000 --concurrency 32 --size 100 --seeds 50
+
+每个并发客户端使用一条保持连接（keep-alive）的TCP连接，按顺序发送请求。
+种子从 0..seeds-1 中随机选取：种子越少，请求合并和服务端缓存命中越多；
+--seeds 0 表示每个请求使用不同的随机种子。
+"""
+import argparse
+import asyncio
+import math
+import random
+import sys
+import time
+from collections import Counter
+from urllib.parse import urlencode
+
+from .benchmark import format_duration
+
+# 报告的延迟分位数
+PERCENTILES = (50, 90, 99)
+
+
+class HttpConnection:
+    """最简单的 HTTP/1.1 客户端连接，支持 Content-Length 和分块传输编码的响应"""
+
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self._reader = self._writer = None
+
+    async def request(self, method, target, body=b""):
+        """发送请求，返回 (状态码, 响应头, 响应体)；服务端关闭了连接时自动重连"""
+        if self._writer is None:
+            self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+        head = [f"{method} {target} HTTP/1.1", f"Host: {self.host}:{self.port}",
+                f"Content-Length: {len(body)}"]
+        if body:
+            head.append("Content-Type: application/json")
+        self._writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body)
+        await self._writer.drain()
+        status, headers, data = await self._read_response()
+        if headers.get("connection", "").lower() == "close":
+            await self.close()
+        return status, headers, data
+
+    async def _read_response(self):
+        reader = self._reader
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionError("服务端关闭了连接")
+        status = int(status_line.split()[1])
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await reader.readline()).split(b";")[0], 16)
+                if size == 0:
+                    await reader.readline()
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readline()
+            return status, headers, b"".join(chunks)
+        length = int(headers.get("content-length", 0))
+        return status, headers, await reader.readexactly(length)
+
+    async def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except ConnectionError:
+                pass
+            self._reader = self._writer = None
+
+
+def percentile(ordered, p):
+    """已排序样本的 p 分位数（最近秩法）"""
+    return ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)]
+
+
+def make_targets(endpoint="solve", width=100, height=None, algorithm="Kruskal",
+                 solver="BFS", seeds=50, rng=None):
+    """返回一个无参函数，每次调用生成一个请求目标（路径加查询字符串）"""
+    rng = rng or random.Random()
+    params = {"width": width, "height": height or width, "algorithm": algorithm}
+    if endpoint == "solve":
+        params.update(solver=solver, path=0)
+
+    def target():
+        seed = rng.randrange(seeds) if seeds else rng.getrandbits(64)
+        return f"/{endpoint}?{urlencode(dict(params, seed=seed))}"
+
+    return target
+
+
+async def run_load(host, port, next_target, requests=1000, concurrency=16):
+    """以 concurrency 个并发连接共发送 requests 个请求，返回统计结果
+
+    延迟单位为纳秒；连接错误计入状态码 0。
+    """
+    latencies = []
+    statuses = Counter()
+    remaining = requests
+
+    async def client():
+        nonlocal remaining
+        connection = HttpConnection(host, port)
+        try:
+            while remaining > 0:
+                remaining -= 1
+                begin = time.perf_counter_ns()
+                try:
+                    status, _headers, _body = await connection.request("GET", next_target())
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    await connection.close()
+                    status = 0
+                latencies.append(time.perf_counter_ns() - begin)
+                statuses[status] += 1
+        finally:
+            await connection.close()
+
+    begin = time.perf_counter_ns()
+    await asyncio.gather(*(client() for _ in range(min(concurrency, requests))))
+    elapsed = time.perf_counter_ns() - begin
+
+    ordered = sorted(latencies)
+    result = {
+        "requests": len(ordered),
+        "concurrency": concurrency,
+        "elapsed": elapsed,
+        "rps": len(ordered) / (elapsed / 1e9) if elapsed else 0.0,
+        "statuses": dict(statuses),
+    }
+    if ordered:
+        for p in PERCENTILES:
+            result[f"p{p}"] = percentile(ordered, p)
+        result["max"] = ordered[-1]
+    return result
+
+
+def format_load_report(result):
+    lines = [
+        f"请求数: {result['requests']}  并发: {result['concurrency']}  "
+        f"耗时: {format_duration(result['elapsed'])}",
+        f"吞吐: {result['rps']:,.1f} 请求/秒",
+        "状态码: " + "  ".join(f"{status}×{count}"
+                             for status, count in sorted(result["statuses"].items())),
+    ]
+    if result["requests"]:
+        lines.append("延迟: " + "  ".join(
+            f"p{p} {format_duration(result[f'p{p}'])}" for p in PERCENTILES)
+            + f"  最大 {format_duration(result['max'])}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="迷宫服务压测工具")
+    parser.add_argument("--host", default="127.0.0.1", help="服务地址")
+    parser.add_argument("--port", type=int, default=8080, help="服务端口")
+    parser.add_argument("--requests", type=int, default=1000, help="请求总数")
+    parser.add_argument("--concurrency", type=int, default=16, help="并发连接数")
+    parser.add_argument("--endpoint", default="solve", choices=["solve", "generate"],
+                        help="压测的接口")
+    parser.add_argument("--size", type=int, default=100, help="迷宫边长")
+    parser.add_argument("--algorithm", default="Kruskal", help="生成算法")
+    parser.add_argument("--solver", default="BFS", help="求解算法")
+    parser.add_argument("--seeds", type=int, default=50,
+                        help="种子池大小，0 表示每个请求使用新的随机种子")
+    args = parser.parse_args(argv)
+
+    targets = make_targets(args.endpoint, args.size, args.size, args.algorithm,
+                           args.solver, args.seeds)
+    result = asyncio.run(run_load(args.host, args.port, targets,
+                                  args.requests, args.concurrency))
+    print(format_load_report(result))
+    return 0 if result["statuses"].get(200) == result["requests"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
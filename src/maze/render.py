@@ -0,0 +1,80 @@
+"""绘制用的几何辅助函数：墙体线段合并与缩略图金字塔"""
+import re
+
+from .core import WALL_BOTTOM, WALL_LEFT, WALL_RIGHT, WALL_TOP, load_numpy
+
+
+def _wall_table(wall):
+    return bytes(1 if bits & wall else 0 for bits in range(256))
+
+
+_TOP_TABLE = _wall_table(WALL_TOP)
+_BOTTOM_TABLE = _wall_table(WALL_BOTTOM)
+_LEFT_TABLE = _wall_table(WALL_LEFT)
+_RIGHT_TABLE = _wall_table(WALL_RIGHT)
+_WALL_RUN = re.compile(b"\x01+")
+
+
+def wall_segments(maze, x0=0, y0=0, x1=None, y1=None):
+    """把墙体合并为尽量长的共线线段，返回网格坐标 (x1, y1, x2, y2) 的列表
+
+    第 y 条横线取第 y 行的上墙（最后一条取末行的下墙），竖线同理，
+    每个网格线上的连续墙只生成一条线段。可以只取列 [x0, x1)、行 [y0, y1)
+    范围内的墙，用于只绘制视口内的部分。
+    """
+    width, height = maze.width, maze.height
+    x1 = width if x1 is None else x1
+    y1 = height if y1 is None else y1
+    walls = maze.walls
+    segments = []
+    
+    for y in range(y0, y1 + 1):
+        if y < height:
+            line = bytes(walls[y * width + x0:y * width + x1]).translate(_TOP_TABLE)
+        else:
+            row = (height - 1) * width
+            line = bytes(walls[row + x0:row + x1]).translate(_BOTTOM_TABLE)
+        for run in _WALL_RUN.finditer(line):
+            segments.append((x0 + run.start(), y, x0 + run.end(), y))
+    
+    for x in range(x0, x1 + 1):
+        if x < width:
+            line = bytes(walls[y0 * width + x:y1 * width:width]).translate(_LEFT_TABLE)
+        else:
+            column = width - 1
+            line = bytes(walls[y0 * width + column:y1 * width:width]).translate(_RIGHT_TABLE)
+        for run in _WALL_RUN.finditer(line):
+            segments.append((x, y0 + run.start(), x, y0 + run.end()))
+    
+    return segments
+
+
+def overview_levels(maze, min_size=64):
+    """缩略图金字塔（需要NumPy）
+
+    第 0 层是 (2h+1) x (2w+1) 的位图，每个格子占奇数行列上的一个像素，
+    格子之间的像素表示墙；取值 0 为墙、255 为通道。之后每层把上一层按
+    2x2 取平均缩小一半，直到边长小于 min_size，低倍率显示时从合适的层采样。
+    """
+    np = load_numpy()
+    width, height = maze.width, maze.height
+    walls = np.frombuffer(maze.walls, dtype=np.uint8).reshape(height, width)
+    bitmap = np.zeros((2 * height + 1, 2 * width + 1), dtype=np.uint8)
+    bitmap[1::2, 1::2] = 255
+    bitmap[1::2, 2:-1:2] = np.where(walls[:, :-1] & WALL_RIGHT, 0, 255)
+    bitmap[2:-1:2, 1::2] = np.where(walls[:-1, :] & WALL_BOTTOM, 0, 255)
+    bitmap[0, 1::2] = np.where(walls[0, :] & WALL_TOP, 0, 255)
+    bitmap[-1, 1::2] = np.where(walls[-1, :] & WALL_BOTTOM, 0, 255)
+    bitmap[1::2, 0] = np.where(walls[:, 0] & WALL_LEFT, 0, 255)
+    bitmap[1::2, -1] = np.where(walls[:, -1] & WALL_RIGHT, 0, 255)
+
+    levels = [bitmap]
+    while min(levels[-1].shape) >= 2 * min_size:
+        level = levels[-1]
+        rows, columns = level.shape[0] // 2 * 2, level.shape[1] // 2 * 2
+        total = level[0:rows:2, 0:columns:2].astype(np.uint16)
+        total += level[1:rows:2, 0:columns:2]
+        total += level[0:rows:2, 1:columns:2]
+        total += level[1:rows:2, 1:columns:2]
+        levels.append((total >> 2).astype(np.uint8))
+    return levels
@@ -0,0 +1,466 @@
+"""迷宫生成与求解的HTTP/JSON服务
+
+单进程的 asyncio 前端负责收发请求，生成和求解这类CPU密集型工作交给进程池，
+事件循环始终只做I/O：
+
+    python -m maze.service --port 8080 --workers 4
+    curl "http://127.0.0.1:8080/generate?width=200&height=100&seed=42"
+    curl "http://127.0.0.1:8080/solve?width=200&seed=42&solver=A*"
+    curl "http://127.0.0.1:8080/generate?width=1000&seed=1&format=maze" -o big.maze
+
+接口（GET 用查询参数，POST 也可以用JSON请求体传参数）：
+    /generate  width、height（默认等于 width）、algorithm、seed、format=json|maze、
+               endpoints=corners|diameter（起终点放在对角或最长路径两端）
+    /solve     width、height、algorithm、seed、solver、start=y,x、end=y,x、endpoints、path=0|1
+    /stats     服务计数器
+    /health    存活检查
+
+- 合并：参数完全相同的请求在计算期间只提交一次，后到的请求等待同一个结果；
+- 背压：待处理任务放在有界队列中，队列满时立即返回 503 而不是无限堆积；
+- 分块传输：超过 STREAM_CHUNK 的响应体用分块传输编码分段写出，每段写完
+  等待写缓冲排空。响应体在写出前已完整地位于内存中（工作进程一次返回
+  整个 .maze 记录），分段只是避免传输层再缓冲一份完整副本，并非边生成边发送。
+
+未指定 seed 时由服务选取随机种子并在响应中返回，之后可凭该种子取回同一迷宫。
+每个工作进程各有一个 MazeCache，同一迷宫的重复请求（例如先生成再求解）
+不会重复生成。
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+from urllib.parse import parse_qsl, urlsplit
+
+from . import io as maze_io
+from .analysis import ENDPOINT_MODES
+from .cache import MazeCache
+from .cli import describe
+from .core import SEED_LIMIT
+from .generators import GENERATORS, MAX_RECURSIVE_DFS_CELLS
+from .solvers import SOLVERS
+
+# 单个迷宫的格子数上限，与图形界面的 2000x2000 一致
+MAX_CELLS = 2000 * 2000
+
+# 默认的待处理任务队列长度
+DEFAULT_MAX_PENDING = 64
+
+# 分块传输每段的字节数，更短的响应体直接带 Content-Length 一次写出
+STREAM_CHUNK = 64 * 1024
+
+# 请求头和请求体的大小上限
+MAX_HEADER_LINES = 100
+MAX_BODY = 64 * 1024
+
+# 每个工作进程的迷宫缓存容量
+WORKER_CACHE_BYTES = 64 * 1024 * 1024
+
+REASONS = {
+    200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+    413: "Payload Too Large", 500: "Internal Server Error", 503: "Service Unavailable",
+}
+
+
+class HttpError(Exception):
+    """以指定状态码返回给客户端的错误"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+# ---- 工作进程中执行的任务（须为模块级函数才能被 pickle） ----
+
+_worker_cache = None
+
+
+def _cache():
+    global _worker_cache
+    if _worker_cache is None:
+        _worker_cache = MazeCache(max_bytes=WORKER_CACHE_BYTES)
+    return _worker_cache
+
+
+def generate_task(width, height, algorithm, seed, endpoints="corners"):
+    """生成迷宫，返回 maze_io.dumps 的字节串"""
+    return maze_io.dumps(_cache().get_maze(width, height, algorithm, seed, endpoints))
+
+
+def solve_task(width, height, algorithm, seed, solver, start, end, endpoints="corners"):
+    """求解迷宫，返回 (起点, 终点, 扩展节点数, 路径格子编号)"""
+    if endpoints == "diameter":
+        maze = _cache().get_maze(width, height, algorithm, seed, endpoints)
+        start, end = maze.start, maze.end
+    maze = _cache().solve(width, height, algorithm, seed, solver, start, end)
+    cells = [y * width + x for y, x in maze.path]
+    return maze.start, maze.end, maze.nodes_expanded, cells
+
+
+# ---- 请求参数 ----
+
+def _to_int(value):
+    """查询参数中的整数字符串或JSON中的整数；浮点数、布尔值等不做截断，直接拒绝"""
+    if isinstance(value, bool) or not isinstance(value, (int, str)):
+        raise TypeError(f"不是整数: {value!r}")
+    return int(value)
+
+
+def _integer(params, name, default=None):
+    value = params.get(name, default)
+    if value is None:
+        raise HttpError(400, f"缺少参数: {name}")
+    try:
+        return _to_int(value)
+    except (TypeError, ValueError):
+        raise HttpError(400, f"参数 {name} 必须是整数: {value!r}") from None
+
+
+def _text(params, name, default):
+    value = params.get(name, default)
+    if not isinstance(value, str):
+        raise HttpError(400, f"参数 {name} 必须是字符串: {value!r}")
+    return value
+
+
+def _point(params, name, width, height):
+    value = params.get(name)
+    if value is None:
+        return None
+    try:
+        y, x = (_to_int(v) for v in (value.split(",") if isinstance(value, str) else value))
+    except (TypeError, ValueError):
+        raise HttpError(400, f"参数 {name} 必须是 y,x 形式: {value!r}") from None
+    if not (0 <= y < height and 0 <= x < width):
+        raise HttpError(400, f"参数 {name} 超出迷宫范围: {value!r}")
+    return y, x
+
+
+def parse_maze_params(params):
+    """校验生成参数，返回 (宽, 高, 算法, 种子)；未给出种子时随机选取"""
+    width = _integer(params, "width")
+    height = _integer(params, "height", width)
+    if width < 1 or height < 1 or width * height > MAX_CELLS:
+        raise HttpError(400, f"迷宫尺寸必须为正且不超过 {MAX_CELLS} 格")
+    algorithm = _text(params, "algorithm", "Kruskal")
+    if algorithm not in GENERATORS:
+        raise HttpError(400, f"未知的生成算法: {algorithm}")
+    if algorithm == "DFS" and width * height > MAX_RECURSIVE_DFS_CELLS:
+        raise HttpError(400, "递归DFS不支持这么大的迷宫，请使用 DFS-Iter")
+    seed = params.get("seed")
+    seed = random.getrandbits(64) if seed is None else _integer(params, "seed")
+    if not 0 <= seed < SEED_LIMIT:
+        raise HttpError(400, "参数 seed 必须在 [0, 2**64) 范围内")
+    return width, height, algorithm, seed
+
+
+def _endpoints(params):
+    endpoints = _text(params, "endpoints", "corners")
+    if endpoints not in ENDPOINT_MODES:
+        raise HttpError(400, f"未知的起终点放置方式: {endpoints}")
+    return endpoints
+
+
+def _flag(params, name, default):
+    value = params.get(name, default)
+    if isinstance(value, str):
+        return value.lower() not in ("0", "false", "no", "")
+    return bool(value)
+
+
+# ---- HTTP/1.1 ----
+
+async def read_request(reader):
+    """读取一个请求，返回 (方法, 目标, 请求头, 请求体)；连接已关闭时返回 None"""
+    line = await reader.readline()
+    if not line:
+        return None
+    try:
+        method, target, _version = line.decode("latin-1").split()
+    except ValueError:
+        raise HttpError(400, "无效的请求行") from None
+
+    headers = {}
+    for _ in range(MAX_HEADER_LINES):
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    else:
+        raise HttpError(400, "请求头过多")
+
+    length = headers.get("content-length") or "0"
+    if not length.isdigit():       # 拒绝负数、非数字等无效值
+        raise HttpError(400, f"无效的 Content-Length: {length!r}")
+    length = int(length)
+    if length > MAX_BODY:
+        raise HttpError(413, "请求体过大")
+    body = await reader.readexactly(length) if length else b""
+    return method.upper(), target, headers, body
+
+
+async def write_response(writer, status, body, content_type="application/json",
+                         keep_alive=True, extra_headers=()):
+    """写出响应；超过 STREAM_CHUNK 的响应体按分块传输编码分段写出
+
+    body 须已完整位于内存中。
+    """
+    lines = [f"HTTP/1.1 {status} {REASONS.get(status, 'Unknown')}",
+             f"Content-Type: {content_type}",
+             f"Connection: {'keep-alive' if keep_alive else 'close'}",
+             *extra_headers]
+    if len(body) <= STREAM_CHUNK:
+        lines.append(f"Content-Length: {len(body)}")
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body)
+        await writer.drain()
+        return
+
+    lines.append("Transfer-Encoding: chunked")
+    writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+    view = memoryview(body)
+    for offset in range(0, len(view), STREAM_CHUNK):
+        chunk = view[offset:offset + STREAM_CHUNK]
+        writer.write(b"%x\r\n" % len(chunk))
+        writer.write(chunk)
+        writer.write(b"\r\n")
+        await writer.drain()       # 等待客户端读走，传输层至多缓冲约一段数据
+    writer.write(b"0\r\n\r\n")
+    await writer.drain()
+
+
+def _json(payload):
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+# ---- 服务 ----
+
+class MazeService:
+    """asyncio 前端 + 进程池后端的迷宫服务
+
+    executor 默认为 workers 个进程的 ProcessPoolExecutor（None 表示CPU核数），
+    也可传入任意 concurrent.futures.Executor（由调用方负责关闭），此时 workers
+    为同时提交给它的任务数。
+    max_pending 为排队等待执行的任务数上限，已在执行的任务不计入。
+    """
+
+    def __init__(self, workers=None, max_pending=DEFAULT_MAX_PENDING, executor=None):
+        self.executor = executor
+        self._owns_executor = executor is None
+        if executor is None:
+            from concurrent.futures import ProcessPoolExecutor
+            self.executor = ProcessPoolExecutor(workers)
+        # 并发执行的任务数等于工作进程数，其余任务在有界队列中等待
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending
+        self.counters = dict.fromkeys(
+            ("requests", "coalesced", "rejected", "completed", "errors"), 0)
+        self._queue = None
+        self._inflight = {}
+        self._dispatchers = []
+        self._server = None
+        self._connections = set()
+
+    @property
+    def port(self):
+        return self._server.sockets[0].getsockname()[1]
+
+    async def start(self, host="127.0.0.1", port=0):
+        """开始监听，port 为 0 时由系统分配端口（见 self.port）"""
+        self._queue = asyncio.Queue(self.max_pending)
+        self._dispatchers = [asyncio.create_task(self._dispatch())
+                             for _ in range(self.workers)]
+        self._server = await asyncio.start_server(self._handle, host, port)
+        return self
+
+    async def serve_forever(self):
+        await self._server.serve_forever()
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            # 关闭空闲的保持连接，让其处理协程读到EOF后退出
+            for writer in list(self._connections):
+                writer.close()
+            await self._server.wait_closed()
+        for task in self._dispatchers:
+            task.cancel()
+        await asyncio.gather(*self._dispatchers, return_exceptions=True)
+        self._dispatchers = []
+        if self._owns_executor:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def stats(self):
+        result = dict(self.counters)
+        result["queued"] = self._queue.qsize() if self._queue is not None else 0
+        result["in_flight"] = len(self._inflight)
+        return result
+
+    # ---- 任务调度 ----
+
+    async def submit(self, key, func, *args):
+        """把任务提交给进程池并等待结果；key 相同的进行中任务只执行一次"""
+        future = self._inflight.get(key)
+        if future is not None:
+            self.counters["coalesced"] += 1
+        else:
+            future = asyncio.get_running_loop().create_future()
+            try:
+                self._queue.put_nowait((func, args, future))
+            except asyncio.QueueFull:
+                self.counters["rejected"] += 1
+                raise HttpError(503, "服务繁忙，请稍后重试") from None
+            self._inflight[key] = future
+            future.add_done_callback(lambda done: self._finish(key, done))
+        # shield：某个客户端断开只取消它自己的等待，不影响其他合并的请求
+        return await asyncio.shield(future)
+
+    def _finish(self, key, future):
+        self._inflight.pop(key, None)
+        if not future.cancelled():
+            future.exception()     # 所有等待者都已离开时避免“异常未被获取”的警告
+
+    async def _dispatch(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            func, args, future = await self._queue.get()
+            try:
+                result = await loop.run_in_executor(self.executor, func, *args)
+            except asyncio.CancelledError:
+                future.cancel()
+                raise
+            except Exception as error:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+            finally:
+                self._queue.task_done()
+
+    # ---- 请求处理 ----
+
+    async def _handle(self, reader, writer):
+        self._connections.add(writer)
+        try:
+            while True:
+                try:
+                    request = await read_request(reader)
+                except HttpError as error:
+                    await write_response(writer, error.status, _json({"error": str(error)}),
+                                         keep_alive=False)
+                    break
+                if request is None:
+                    break
+                method, target, headers, body = request
+                keep_alive = headers.get("connection", "").lower() != "close"
+                status, body, content_type, extra = await self.route(method, target, body)
+                await write_response(writer, status, body, content_type, keep_alive, extra)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._connections.discard(writer)
+            writer.close()
+
+    async def route(self, method, target, body=b""):
+        """处理一个请求，返回 (状态码, 响应体, 内容类型, 附加响应头)"""
+        self.counters["requests"] += 1
+        url = urlsplit(target)
+        handler = {"/generate": self.generate, "/solve": self.solve}.get(url.path)
+        try:
+            if url.path in ("/stats", "/health"):
+                payload = self.stats() if url.path == "/stats" else {"status": "ok"}
+                return 200, _json(payload), "application/json", ()
+            if handler is None:
+                raise HttpError(404, f"未知的路径: {url.path}")
+            if method not in ("GET", "POST"):
+                raise HttpError(405, f"不支持的方法: {method}")
+            params = dict(parse_qsl(url.query))
+            if method == "POST" and body:
+                try:
+                    fields = json.loads(body)
+                except ValueError:
+                    fields = None
+                if not isinstance(fields, dict):
+                    raise HttpError(400, "请求体不是有效的JSON对象")
+                params.update(fields)
+            status, body, content_type = await handler(params)
+            self.counters["completed"] += 1
+            return status, body, content_type, ()
+        except HttpError as error:
+            extra = ("Retry-After: 1",) if error.status == 503 else ()
+            return error.status, _json({"error": str(error)}), "application/json", extra
+        except Exception as error:
+            self.counters["errors"] += 1
+            return 500, _json({"error": f"{type(error).__name__}: {error}"}), "application/json", ()
+
+    async def generate(self, params):
+        width, height, algorithm, seed = parse_maze_params(params)
+        output = _text(params, "format", "json")
+        if output not in ("json", "maze"):
+            raise HttpError(400, f"未知的输出格式: {output}")
+        endpoints = _endpoints(params)
+        data = await self.submit(("generate", width, height, algorithm, seed, endpoints),
+                                 generate_task, width, height, algorithm, seed, endpoints)
+        if output == "maze":
+            return 200, data, "application/octet-stream"
+        maze = maze_io.loads(data)
+        payload = describe(maze)
+        payload["walls"] = maze.walls.hex()
+        return 200, _json(payload), "application/json"
+
+    async def solve(self, params):
+        width, height, algorithm, seed = parse_maze_params(params)
+        solver = _text(params, "solver", "BFS")
+        if solver not in SOLVERS:
+            raise HttpError(400, f"未知的求解算法: {solver}")
+        start = _point(params, "start", width, height)
+        end = _point(params, "end", width, height)
+        endpoints = _endpoints(params)
+        if endpoints == "diameter" and (start or end):
+            raise HttpError(400, "endpoints=diameter 时不能再指定 start / end")
+        start, end, nodes_expanded, cells = await self.submit(
+            ("solve", width, height, algorithm, seed, solver, start, end, endpoints),
+            solve_task, width, height, algorithm, seed, solver, start, end, endpoints)
+        payload = {"width": width, "height": height, "algorithm": algorithm, "seed": seed,
+                   "solver": solver, "start": list(start), "end": list(end),
+                   "found": bool(cells), "length": len(cells) - 1 if cells else None,
+                   "nodes_expanded": nodes_expanded}
+        if _flag(params, "path", True):
+            payload["path"] = [list(divmod(cell, width)) for cell in cells]
+        return 200, _json(payload), "application/json"
+
+
+async def serve(host="127.0.0.1", port=8080, workers=None, max_pending=DEFAULT_MAX_PENDING):
+    service = await MazeService(workers, max_pending).start(host, port)
+    print(f"迷宫服务已启动: http://{host}:{service.port}", file=sys.stderr)
+    try:
+        await service.serve_forever()
+    finally:
+        await service.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="迷宫生成与求解的HTTP/JSON服务")
+    parser.add_argument("--host", default="127.0.0.1", help="监听地址（默认仅本机）")
+    parser.add_argument("--port", type=int, default=8080, help="监听端口")
+    parser.add_argument("--workers", type=int, default=None, help="工作进程数，默认CPU核数")
+    parser.add_argument("--max-pending", type=int, default=DEFAULT_MAX_PENDING,
+                        help="排队任务上限，超出时返回 503")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, args.workers, args.max_pending))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,400 @@
+"""迷宫求解算法
+
+求解器的签名统一为 solve_xxx(maze, progress=None, stats=None)，找到路径时
+写入 maze.path 并返回 True；按名称注册在 SOLVERS 中。
+"""
+import heapq
+import time
+from array import array
+from collections import deque
+
+from .core import PROGRESS_INTERVAL, move_table, sealed_walls, trace_path
+
+
+def record_search(stats, queue, expanded, walls, moves, parent):
+    """由BFS结束后的队列与父节点表推算计数：访问格子数、邻居检查次数、队列峰值"""
+    stats.add("cells_visited", len(queue))
+    stats.add("nodes_expanded", expanded)
+    stats.add("neighbor_checks", sum(len(moves[walls[cell]]) for cell in queue[:expanded]))
+    # 扩展第 k 个格子后队列长度 = 已发现格子数 - (k + 1)
+    children = [0] * expanded
+    position = {cell: k for k, cell in enumerate(queue[:expanded])}
+    for cell in queue[1:]:
+        k = position.get(parent[cell])
+        if k is not None:
+            children[k] += 1
+    discovered = 1
+    high_water = 1
+    for k, count in enumerate(children):
+        discovered += count
+        high_water = max(high_water, discovered - k - 1)
+    stats.maximum("queue_high_water", high_water)
+
+
+class MazeSolver:
+
+    
+    @staticmethod
+    def solve_bfs(maze, progress=None, stats=None):
+        """基于 (y, x) 元组和 get_neighbors 的原始BFS，作为其他求解器的对照"""
+        start_time = time.time()
+        cell_count = maze.width * maze.height
+        start = maze.start
+        end = maze.end
+
+        queue = deque([start])
+        visited = [[False for _ in range(maze.width)] for _ in range(maze.height)]
+        visited[start[0]][start[1]] = True
+        parent = {start: None} 
+        
+        expanded = 0
+        
+        while queue:
+            current = queue.popleft()
+            expanded += 1
+            if progress is not None and not expanded % PROGRESS_INTERVAL:
+                progress(expanded, cell_count)
+            
+            if current == end:
+                path = []
+                while current is not None:
+                    path.append(current)
+                    current = parent[current]
+                maze.path = path[::-1]  # 反转路径
+                maze.nodes_expanded = expanded
+                maze.solution_time = time.time() - start_time
+                if stats is not None:
+                    MazeSolver._record_bfs(stats, expanded, len(parent))
+                return True
+
+            neighbors = maze.get_neighbors(current[0], current[1], with_walls=True)
+            
+            for neighbor in neighbors:
+                if not visited[neighbor[0]][neighbor[1]]:
+                    visited[neighbor[0]][neighbor[1]] = True
+                    parent[neighbor] = current
+                    queue.append(neighbor)
+        
+        maze.nodes_expanded = expanded
+        maze.solution_time = time.time() - start_time
+        if stats is not None:
+            MazeSolver._record_bfs(stats, expanded, len(parent))
+        return False  
+
+    @staticmethod
+    def _record_bfs(stats, expanded, visited):
+        # 每扩展一个格子调用一次 get_neighbors
+        stats.add("cells_visited", visited)
+        stats.add("nodes_expanded", expanded)
+        stats.add("neighbor_calls", expanded)
+
+    @staticmethod
+    def solve_bfs_flat(maze, progress=None, stats=None):
+        """按整数格子编号进行BFS，直接查墙体位，路径与 solve_bfs 完全一致"""
+        start_time = time.time()
+        width = maze.width
+        cell_count = width * maze.height
+        walls = sealed_walls(maze)
+        moves = move_table(width)
+        start = maze.start[0] * width + maze.start[1]
+        end = maze.end[0] * width + maze.end[1]
+
+        visited = bytearray(cell_count)
+        visited[start] = 1
+        parent = array('i', [-1]) * cell_count
+        queue = [start]
+        append = queue.append
+
+        # 边遍历边追加，for 循环会继续处理新入队的格子
+        for expanded, cell in enumerate(queue, 1):
+            if progress is not None and not expanded % PROGRESS_INTERVAL:
+                progress(expanded, cell_count)
+            if cell == end:
+                maze.path = trace_path(parent, start, end, width)
+                maze.nodes_expanded = expanded
+                maze.solution_time = time.time() - start_time
+                if stats is not None:
+                    record_search(stats, queue, expanded, walls, moves, parent)
+                return True
+
+            for offset in moves[walls[cell]]:
+                neighbor = cell + offset
+                if not visited[neighbor]:
+                    visited[neighbor] = 1
+                    parent[neighbor] = cell
+                    append(neighbor)
+
+        maze.nodes_expanded = len(queue)
+        maze.solution_time = time.time() - start_time
+        if stats is not None:
+            record_search(stats, queue, len(queue), walls, moves, parent)
+        return False
+
+    @staticmethod
+    def bfs_tree(maze, origin=None):
+        """从 origin（默认起点）出发遍历整个连通区域的BFS
+
+        返回 (扩展顺序, 距离, 父节点)：扩展顺序是格子编号列表，最后一个格子距离最远；
+        距离与父节点为按格子编号索引的 array('i')，不可达的格子均为 -1。
+        """
+        width = maze.width
+        cell_count = width * maze.height
+        walls = sealed_walls(maze)
+        moves = move_table(width)
+        origin_y, origin_x = maze.start if origin is None else origin
+        origin = origin_y * width + origin_x
+
+        distance = array('i', [-1]) * cell_count
+        parent = array('i', [-1]) * cell_count
+        distance[origin] = 0
+        order = [origin]
+        append = order.append
+        for cell in order:
+            next_distance = distance[cell] + 1
+            for offset in moves[walls[cell]]:
+                neighbor = cell + offset
+                if distance[neighbor] < 0:
+                    distance[neighbor] = next_distance
+                    parent[neighbor] = cell
+                    append(neighbor)
+        return order, distance, parent
+
+    @staticmethod
+    def solve_bfs_steps(maze, batch_size=256):
+        """逐步执行的 solve_bfs_flat，供动画使用
+
+        每次产出一批按扩展顺序排列的格子编号；迭代结束时设置 maze.path，
+        生成器的返回值（StopIteration.value）表示是否找到路径。
+        """
+        elapsed = 0.0
+        start_time = time.time()
+        width = maze.width
+        cell_count = width * maze.height
+        walls = sealed_walls(maze)
+        moves = move_table(width)
+        start = maze.start[0] * width + maze.start[1]
+        end = maze.end[0] * width + maze.end[1]
+
+        visited = bytearray(cell_count)
+        visited[start] = 1
+        parent = array('i', [-1]) * cell_count
+        queue = [start]
+        append = queue.append
+        found = False
+        reported = 0
+
+        for expanded, cell in enumerate(queue, 1):
+            if cell == end:
+                found = True
+                break
+
+            for offset in moves[walls[cell]]:
+                neighbor = cell + offset
+                if not visited[neighbor]:
+                    visited[neighbor] = 1
+                    parent[neighbor] = cell
+                    append(neighbor)
+
+            if expanded - reported >= batch_size:
+                elapsed += time.time() - start_time
+                yield queue[reported:expanded]
+                reported = expanded
+                start_time = time.time()
+
+        # 最后一批：上次产出之后扩展的格子（找到终点时包括终点本身）
+        if found:
+            done = expanded
+            maze.path = trace_path(parent, start, end, width)
+        else:
+            done = len(queue)
+        maze.nodes_expanded = done
+        maze.solution_time = elapsed + time.time() - start_time
+        if reported < done:
+            yield queue[reported:done]
+        return found
+
+    @staticmethod
+    def solve_astar(maze, progress=None, stats=None):
+        """以曼哈顿距离为启发函数的A*搜索，开放表为二叉堆"""
+        start_time = time.time()
+        width = maze.width
+        cell_count = width * maze.height
+        walls = sealed_walls(maze)
+        moves = move_table(width)
+        start = maze.start[0] * width + maze.start[1]
+        end = maze.end[0] * width + maze.end[1]
+        end_y, end_x = maze.end
+
+        cost = array('i', [-1]) * cell_count
+        cost[start] = 0
+        parent = array('i', [-1]) * cell_count
+        closed = bytearray(cell_count)
+        start_h = abs(maze.start[0] - end_y) + abs(maze.start[1] - end_x)
+        # 堆元素为 (f, h, cell)，f 相同时优先扩展离终点更近的格子
+        heap = [(start_h, start_h, start)]
+        expanded = 0
+        push = heapq.heappush
+        if stats is not None:
+            # 开启统计时才换成带计数的入堆函数
+            pushes = [1]
+            high_water = [1]
+
+            def push(heap, item):
+                heapq.heappush(heap, item)
+                pushes[0] += 1
+                if len(heap) > high_water[0]:
+                    high_water[0] = len(heap)
+
+            def record():
+                stats.add("nodes_expanded", expanded)
+                stats.add("cells_visited", sum(1 for known in cost if known >= 0))
+                stats.add("neighbor_checks", sum(len(moves[walls[cell]])
+                                                 for cell in range(cell_count) if closed[cell]))
+                stats.add("heap_pushes", pushes[0])
+                stats.maximum("queue_high_water", high_water[0])
+
+        while heap:
+            cell = heapq.heappop(heap)[2]
+            if closed[cell]:
+                continue
+            closed[cell] = 1
+            expanded += 1
+            if progress is not None and not expanded % PROGRESS_INTERVAL:
+                progress(expanded, cell_count)
+
+            if cell == end:
+                maze.path = trace_path(parent, start, end, width)
+                maze.nodes_expanded = expanded
+                maze.solution_time = time.time() - start_time
+                if stats is not None:
+                    record()
+                return True
+
+            next_cost = cost[cell] + 1
+            for offset in moves[walls[cell]]:
+                neighbor = cell + offset
+                if closed[neighbor]:
+                    continue
+                known = cost[neighbor]
+                if known < 0 or next_cost < known:
+                    cost[neighbor] = next_cost
+                    parent[neighbor] = cell
+                    y, x = divmod(neighbor, width)
+                    h = abs(y - end_y) + abs(x - end_x)
+                    push(heap, (next_cost + h, h, neighbor))
+
+        maze.nodes_expanded = expanded
+        maze.solution_time = time.time() - start_time
+        if stats is not None:
+            record()
+        return False
+
+    @staticmethod
+    def solve_bidirectional_bfs(maze, progress=None, stats=None):
+        """从起点和终点同时逐层BFS，每次扩展较小的一侧，两侧相遇即得最短路径"""
+        start_time = time.time()
+        width = maze.width
+        cell_count = width * maze.height
+        walls = sealed_walls(maze)
+        moves = move_table(width)
+        start = maze.start[0] * width + maze.start[1]
+        end = maze.end[0] * width + maze.end[1]
+
+        if start == end:
+            maze.path = [maze.start]
+            maze.nodes_expanded = 0
+            maze.solution_time = time.time() - start_time
+            return True
+
+        forward_dist = array('i', [-1]) * cell_count
+        backward_dist = array('i', [-1]) * cell_count
+        forward_parent = array('i', [-1]) * cell_count
+        backward_parent = array('i', [-1]) * cell_count
+        forward_dist[start] = 0
+        backward_dist[end] = 0
+        forward_frontier = [start]
+        backward_frontier = [end]
+        expanded = 0
+        best_length = -1
+        meeting = None  # (起点侧格子, 终点侧格子)
+        frontier_high_water = 1
+
+        while forward_frontier and backward_frontier:
+            is_forward = len(forward_frontier) <= len(backward_frontier)
+            if is_forward:
+                frontier, dist, parent, other_dist = (forward_frontier, forward_dist,
+                                                      forward_parent, backward_dist)
+            else:
+                frontier, dist, parent, other_dist = (backward_frontier, backward_dist,
+                                                      backward_parent, forward_dist)
+
+            # 扩展完整的一层后取所有相遇边中最短的一条
+            next_frontier = []
+            for cell in frontier:
+                expanded += 1
+                if progress is not None and not expanded % PROGRESS_INTERVAL:
+                    progress(expanded, cell_count)
+                next_dist = dist[cell] + 1
+                for offset in moves[walls[cell]]:
+                    neighbor = cell + offset
+                    if other_dist[neighbor] >= 0:
+                        length = next_dist + other_dist[neighbor]
+                        if best_length < 0 or length < best_length:
+                            best_length = length
+                            meeting = (cell, neighbor) if is_forward else (neighbor, cell)
+                    if dist[neighbor] < 0:
+                        dist[neighbor] = next_dist
+                        parent[neighbor] = cell
+                        next_frontier.append(neighbor)
+
+            if stats is not None:
+                frontier_high_water = max(frontier_high_water, 
+                                          len(next_frontier) + len(forward_frontier if not is_forward 
+                                                                   else backward_frontier))
+
+            if meeting is not None:
+                forward_cell, backward_cell = meeting
+                path = trace_path(forward_parent, start, forward_cell, width)
+                while backward_cell != end:
+                    path.append(divmod(backward_cell, width))
+                    backward_cell = backward_parent[backward_cell]
+                path.append(maze.end)
+                maze.path = path
+                maze.nodes_expanded = expanded
+                maze.solution_time = time.time() - start_time
+                if stats is not None:
+                    MazeSolver._record_bidirectional(stats, expanded, forward_dist, 
+                                                     backward_dist, frontier_high_water)
+                return True
+
+            if is_forward:
+                forward_frontier = next_frontier
+            else:
+                backward_frontier = next_frontier
+
+        maze.nodes_expanded = expanded
+        maze.solution_time = time.time() - start_time
+        if stats is not None:
+            MazeSolver._record_bidirectional(stats, expanded, forward_dist, 
+                                             backward_dist, frontier_high_water)
+        return False
+
+    @staticmethod
+    def _record_bidirectional(stats, expanded, forward_dist, backward_dist, frontier_high_water):
+        stats.add("nodes_expanded", expanded)
+        stats.add("cells_visited", sum(1 for forward, backward in zip(forward_dist, backward_dist)
+                                       if forward >= 0 or backward >= 0))
+        stats.maximum("queue_high_water", frontier_high_water)
+
+
+# 界面中可选的求解算法
+SOLVERS = {
+    "BFS": MazeSolver.solve_bfs_flat,
+    "A*": MazeSolver.solve_astar,
+    "双向BFS": MazeSolver.solve_bidirectional_bfs,
+}
+
+# 支持逐步执行（动画演示）的算法
+STEP_SOLVERS = {
+    "BFS": MazeSolver.solve_bfs_steps,
+}
@@ -3,97 +3,1404 @@ import time
 import sys
 import os
 import random
+from collections import deque
 from io import StringIO
 import tempfile
-from main import Maze, MazeGenerator, MazeSolver, DisjointSet
+import json
+from maze import Maze, MazeGenerator, MazeSolver, DisjointSet, MazeIndex, ALL_WALLS, wall_segments, overview_levels
+from maze import GENERATORS, SOLVERS, PROGRESS_INTERVAL, Job, JobCancelled
+from maze import STEP_GENERATORS, STEP_SOLVERS, MAX_RECURSIVE_DFS_CELLS, CountingDisjointSet
+from maze import WALL_TOP, WALL_RIGHT, WALL_BOTTOM, WALL_LEFT
+import queue
+from maze import io as maze_io
+from maze import analysis, batch, benchmark, cache, cli, instrument, loadgen, service
+import asyncio
+import statistics
+from contextlib import redirect_stderr, redirect_stdout
+from unittest import mock
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 # ... [之前的测试类保持不变，包括 TestDisjointSet, TestMaze, TestMazeGenerator, TestMazeSolver, TestIntegration] ...
 
-class PerformanceTest:
-    """性能测试类"""
+
+def count_passages(maze):
+    """统计迷宫内部打通的墙（每条通道只计一次）"""
+    count = 0
+    for y in range(maze.height):
+        for x in range(maze.width):
+            for ny, nx in maze.get_neighbors(y, x, with_walls=True):
+                if (ny, nx) > (y, x):
+                    count += 1
+    return count
+
+
+def longest_path(maze):
+    """暴力求直径：从每个格子出发各做一次BFS"""
+    longest = 0
+    for y in range(maze.height):
+        for x in range(maze.width):
+            order, distance, _ = MazeSolver.bfs_tree(maze, (y, x))
+            longest = max(longest, distance[order[-1]])
+    return longest
+
+
+def add_loops(maze, rng, count=None):
+    """额外打通若干墙，构造带环的迷宫"""
+    if count is None:
+        count = maze.width * maze.height // 5
+    for _ in range(count):
+        y, x = rng.randrange(maze.height), rng.randrange(maze.width)
+        neighbors = maze.get_neighbors(y, x, with_walls=False)
+        if neighbors:
+            maze.remove_wall(y, x, *rng.choice(neighbors))
+
+
+def assert_valid_path(test, maze):
+    """路径首尾正确，且相邻两步之间没有墙"""
+    test.assertEqual(maze.path[0], maze.start)
+    test.assertEqual(maze.path[-1], maze.end)
+    for (y1, x1), step in zip(maze.path, maze.path[1:]):
+        test.assertIn(step, maze.get_neighbors(y1, x1))
+
+
+class TestArrayDisjointSet(unittest.TestCase):
+    """数组实现的并查集测试"""
+    
+    def test_union_and_components(self):
+        dsu = DisjointSet(6)
+        self.assertEqual(dsu.components, 6)
+        self.assertTrue(dsu.union(0, 1))
+        self.assertTrue(dsu.union(2, 3))
+        self.assertFalse(dsu.union(1, 0))
+        self.assertEqual(dsu.components, 4)
+        self.assertEqual(dsu.find(0), dsu.find(1))
+        self.assertNotEqual(dsu.find(0), dsu.find(2))
+    
+    def test_union_many(self):
+        dsu = DisjointSet(5)
+        merged = dsu.union_many([0, 1, 0, 3], [1, 2, 2, 4])
+        self.assertEqual(list(merged), [1, 1, 0, 1])
+        self.assertEqual(dsu.components, 2)
+        self.assertEqual(dsu.size[dsu.find(2)], 3)
+    
+    def test_long_chain_is_iterative(self):
+        size = sys.getrecursionlimit() * 5
+        dsu = DisjointSet(size)
+        # 人为构造一条很长的父指针链
+        for i in range(1, size):
+            dsu.parent[i] = i - 1
+        self.assertEqual(dsu.find(size - 1), 0)
+        self.assertLess(dsu.parent[size - 1], size - 2)
+
+
+class TestCompactWalls(unittest.TestCase):
+    """扁平位存储的墙体测试"""
+    
+    def test_one_byte_per_cell(self):
+        maze = Maze(40, 30)
+        self.assertIsInstance(maze.walls, bytearray)
+        self.assertEqual(len(maze.walls), 40 * 30)
+        self.assertTrue(all(cell == ALL_WALLS for cell in maze.walls))
+    
+    def test_remove_wall_is_symmetric(self):
+        maze = Maze(5, 5)
+        maze.remove_wall(2, 2, 2, 3)
+        self.assertFalse(maze.has_wall(2, 2, 1))
+        self.assertFalse(maze.has_wall(2, 3, 3))
+        maze.remove_wall(2, 2, 1, 2)
+        self.assertFalse(maze.has_wall(2, 2, 0))
+        self.assertFalse(maze.has_wall(1, 2, 2))
+        self.assertTrue(maze.has_wall(2, 2, 2))
+        self.assertEqual(maze.get_neighbors(2, 2), [(1, 2), (2, 3)])
+    
+    def test_neighbors_without_walls(self):
+        maze = Maze(5, 5)
+        self.assertEqual(maze.get_neighbors(0, 0), [])
+        self.assertEqual(maze.get_neighbors(0, 0, with_walls=False), [(0, 1), (1, 0)])
+        self.assertEqual(maze.get_neighbors(2, 2, with_walls=False),
+                         [(1, 2), (2, 3), (3, 2), (2, 1)])
+
+
+class TestWallSegments(unittest.TestCase):
+    """绘制用的合并墙体线段测试"""
     
     @staticmethod
-    def run_comprehensive_performance_test():
-        """运行全面的性能测试"""
-        print("=" * 60)
-        print("迷宫生成与求解系统 - 性能测试报告")
-        print("=" * 60)
+    def unit_walls(segments):
+        drawn = set()
+        for x1, y1, x2, y2 in segments:
+            if y1 == y2:
+                drawn.update(("h", x, y1) for x in range(x1, x2))
+            else:
+                drawn.update(("v", x1, y) for y in range(y1, y2))
+        return drawn
+    
+    def test_segments_cover_exactly_the_walls(self):
+        maze = Maze(19, 11)
+        MazeGenerator.generate_kruskal(maze)
+        segments = wall_segments(maze)
+        for x1, y1, x2, y2 in segments:
+            self.assertTrue(x1 == x2 or y1 == y2)
         
-        sizes = [(5, 5), (10, 10), (15, 15), (20, 20), (25, 25)]
-        algorithms = [
-            ("DFS", MazeGenerator.generate_dfs),
-            ("Kruskal", MazeGenerator.generate_kruskal)
-        ]
+        expected = set()
+        for y in range(maze.height):
+            for x in range(maze.width):
+                if maze.has_wall(y, x, 0):
+                    expected.add(("h", x, y))
+                if maze.has_wall(y, x, 2):
+                    expected.add(("h", x, y + 1))
+                if maze.has_wall(y, x, 3):
+                    expected.add(("v", x, y))
+                if maze.has_wall(y, x, 1):
+                    expected.add(("v", x + 1, y))
+        self.assertEqual(self.unit_walls(segments), expected)
+    
+    def test_window_is_clipped_from_full_result(self):
+        maze = Maze(23, 17)
+        MazeGenerator.generate_kruskal(maze)
+        full = self.unit_walls(wall_segments(maze))
+        rng = random.Random(7)
+        for _ in range(50):
+            x0 = rng.randrange(maze.width)
+            x1 = rng.randrange(x0 + 1, maze.width + 1)
+            y0 = rng.randrange(maze.height)
+            y1 = rng.randrange(y0 + 1, maze.height + 1)
+            expected = {(kind, x, y) for kind, x, y in full
+                        if (kind == "h" and x0 <= x < x1 and y0 <= y <= y1) or
+                           (kind == "v" and x0 <= x <= x1 and y0 <= y < y1)}
+            self.assertEqual(self.unit_walls(wall_segments(maze, x0, y0, x1, y1)), expected)
+    
+    def test_collinear_walls_are_merged(self):
+        maze = Maze(30, 1)
+        segments = wall_segments(maze)
+        # 上下两条长边 + 31 条竖线
+        self.assertEqual(len(segments), 2 + 31)
+        self.assertIn((0, 0, 30, 0), segments)
+
+
+@unittest.skipIf(np is None, "需要NumPy")
+class TestOverviewLevels(unittest.TestCase):
+    """缩略图金字塔测试"""
+    
+    def test_bitmap_matches_walls(self):
+        maze = Maze(13, 8)
+        MazeGenerator.generate_kruskal(maze)
+        bitmap = overview_levels(maze)[0]
+        self.assertEqual(bitmap.shape, (17, 27))
+        for y in range(maze.height):
+            for x in range(maze.width):
+                self.assertEqual(bitmap[2 * y + 1, 2 * x + 1], 255)
+                self.assertEqual(bitmap[2 * y + 1, 2 * x + 2] == 0, maze.has_wall(y, x, 1))
+                self.assertEqual(bitmap[2 * y + 2, 2 * x + 1] == 0, maze.has_wall(y, x, 2))
+                self.assertEqual(bitmap[2 * y, 2 * x + 1] == 0, maze.has_wall(y, x, 0))
+                self.assertEqual(bitmap[2 * y + 1, 2 * x] == 0, maze.has_wall(y, x, 3))
+        # 格子角上的像素总是墙
+        self.assertFalse(bitmap[::2, ::2].any())
+    
+    def test_levels_halve_until_small(self):
+        maze = Maze(300, 100)
+        MazeGenerator.generate_kruskal(maze)
+        levels = overview_levels(maze, min_size=32)
+        for finer, coarser in zip(levels, levels[1:]):
+            self.assertEqual(coarser.shape, (finer.shape[0] // 2, finer.shape[1] // 2))
+            self.assertAlmostEqual(float(coarser.mean()), float(finer[:coarser.shape[0] * 2, :coarser.shape[1] * 2].mean()), delta=1)
+        self.assertLess(min(levels[-1].shape), 64)
+
+
+class TestPathMask(unittest.TestCase):
+    """路径位图测试"""
+    
+    def test_membership_follows_path(self):
+        maze = Maze(12, 9)
+        MazeGenerator.generate_dfs_iterative(maze)
+        self.assertFalse(maze.on_path(0, 0))
         
-        results = {}
+        MazeSolver.solve_bfs_flat(maze)
+        on_path = {(y, x) for y in range(9) for x in range(12) if maze.on_path(y, x)}
+        self.assertEqual(on_path, set(maze.path))
+        self.assertEqual(sum(maze.path_mask), len(maze.path))
         
-        for size_name, (width, height) in enumerate(sizes):
-            print(f"\n{'='*40}")
-            print(f"测试迷宫尺寸: {width} x {height}")
-            print(f"{'='*40}")
+        maze.path = []
+        self.assertFalse(any(maze.path_mask))
+
+
+class TestIterativeDFS(unittest.TestCase):
+    """显式栈DFS生成器测试"""
+    
+    def test_generates_perfect_maze(self):
+        maze = Maze(23, 17)
+        MazeGenerator.generate_dfs_iterative(maze)
+        # 完美迷宫是生成树：恰好 n-1 条通道且连通
+        self.assertEqual(count_passages(maze), maze.width * maze.height - 1)
+        self.assertTrue(MazeSolver.solve_bfs(maze))
+        self.assertEqual(maze.path[0], maze.start)
+        self.assertEqual(maze.path[-1], maze.end)
+    
+    def test_exceeds_recursion_limit(self):
+        width, height = 200, 100
+        self.assertGreater(width * height, sys.getrecursionlimit())
+        maze = Maze(width, height)
+        MazeGenerator.generate_dfs_iterative(maze)
+        self.assertEqual(count_passages(maze), width * height - 1)
+
+class TestFlatBFS(unittest.TestCase):
+    """整数编号BFS求解器测试"""
+    
+    def test_same_path_as_solve_bfs(self):
+        rng = random.Random(5)
+        for width, height in [(1, 1), (1, 12), (15, 15), (37, 21)]:
+            maze = Maze(width, height)
+            MazeGenerator.generate_dfs_iterative(maze)
+            add_loops(maze, rng)
+            maze.end = (rng.randrange(height), rng.randrange(width))
+            
+            self.assertTrue(MazeSolver.solve_bfs(maze))
+            expected = maze.path
+            self.assertTrue(MazeSolver.solve_bfs_flat(maze))
+            self.assertEqual(maze.path, expected)
+    
+    def test_entrances_do_not_wrap_rows(self):
+        maze = Maze(6, 6)
+        maze.open_entrances()
+        maze.remove_wall(0, 0, 1, 0)
+        self.assertFalse(MazeSolver.solve_bfs_flat(maze))
+    
+    def test_unsolvable(self):
+        maze = Maze(8, 8)
+        self.assertFalse(MazeSolver.solve_bfs_flat(maze))
+
+
+class TestAlternativeSolvers(unittest.TestCase):
+    """A* 与双向BFS求解器测试"""
+    
+    solvers = [MazeSolver.solve_astar, MazeSolver.solve_bidirectional_bfs]
+    
+    def test_shortest_paths_with_loops(self):
+        rng = random.Random(11)
+        for width, height in [(2, 1), (1, 9), (12, 12), (30, 17)]:
+            maze = Maze(width, height)
+            MazeGenerator.generate_kruskal(maze)
+            add_loops(maze, rng)
+            maze.start = (rng.randrange(height), rng.randrange(width))
+            self.assertTrue(MazeSolver.solve_bfs_flat(maze))
+            bfs_length = len(maze.path)
+            
+            for solver in self.solvers:
+                self.assertTrue(solver(maze))
+                self.assertEqual(len(maze.path), bfs_length, solver.__name__)
+                assert_valid_path(self, maze)
+                if maze.start != maze.end:
+                    self.assertGreater(maze.nodes_expanded, 0)
+    
+    def test_start_equals_end(self):
+        maze = Maze(5, 5)
+        maze.end = maze.start
+        for solver in self.solvers:
+            self.assertTrue(solver(maze))
+            self.assertEqual(maze.path, [maze.start])
+    
+    def test_unsolvable(self):
+        for solver in self.solvers:
+            maze = Maze(6, 4)
+            self.assertFalse(solver(maze))
+    
+    def test_reports_nodes_expanded(self):
+        maze = Maze(20, 20)
+        MazeGenerator.generate_dfs_iterative(maze)
+        MazeSolver.solve_bfs(maze)
+        expected = maze.nodes_expanded
+        MazeSolver.solve_bfs_flat(maze)
+        self.assertEqual(maze.nodes_expanded, expected)
+
+
+class TestEllerStreaming(unittest.TestCase):
+    """逐行Eller生成器测试"""
+    
+    def test_rows_form_perfect_maze(self):
+        for width, height in [(1, 1), (1, 7), (9, 1), (27, 31)]:
+            rows = list(MazeGenerator.generate_eller_rows(width, height))
+            self.assertEqual(len(rows), height)
+            self.assertTrue(all(len(row) == width for row in rows))
             
-            size_results = []
+            maze = Maze(width, height)
+            maze.walls[:] = b"".join(rows)
+            self.assertEqual(count_passages(maze), width * height - 1)
+            self.assertTrue(MazeSolver.solve_bfs_flat(maze))
+    
+    def test_rows_stream_to_file(self):
+        with tempfile.TemporaryFile() as f:
+            f.writelines(MazeGenerator.generate_eller_rows(64, 300))
+            self.assertEqual(f.tell(), 64 * 300)
+    
+    def test_generate_eller_in_memory(self):
+        maze = Maze(20, 12)
+        MazeGenerator.generate_eller(maze)
+        self.assertEqual(count_passages(maze), 20 * 12 - 1)
+        self.assertFalse(maze.has_wall(0, 0, 3))
+        self.assertFalse(maze.has_wall(11, 19, 1))
+
+
+class TestProgress(unittest.TestCase):
+    """进度回调与取消测试"""
+    
+    def test_generators_report_progress(self):
+        for name, generate in GENERATORS.items():
+            maze = Maze(90, 70)
+            reports = []
+            generate(maze, progress=lambda done, total: reports.append((done, total)))
+            self.assertTrue(reports, name)
+            self.assertEqual([total for _, total in reports], [90 * 70] * len(reports))
+            done = [done for done, _ in reports]
+            self.assertEqual(done, sorted(done), name)
+            self.assertLessEqual(done[-1], 90 * 70)
+            self.assertEqual(count_passages(maze), 90 * 70 - 1, name)
+    
+    def test_solvers_report_progress(self):
+        maze = Maze(90, 70)
+        MazeGenerator.generate_kruskal(maze)
+        # solve_bfs 未注册在 SOLVERS 中，但签名与进度回调约定一致
+        for name, solve in [*SOLVERS.items(), ("solve_bfs", MazeSolver.solve_bfs)]:
+            reports = []
+            self.assertTrue(solve(maze, lambda done, total: reports.append(done)))
+            assert_valid_path(self, maze)
+            self.assertEqual(len(reports), maze.nodes_expanded // PROGRESS_INTERVAL, name)
+    
+    def test_raising_callback_aborts(self):
+        def stop(done, total):
+            raise JobCancelled()
+        for name, generate in GENERATORS.items():
+            with self.assertRaises(JobCancelled, msg=name):
+                generate(Maze(90, 70), progress=stop)
+        # 蛇形单通道迷宫，任何求解器都要扩展几乎全部格子
+        maze = Maze(90, 70)
+        for y in range(70):
+            for x in range(89):
+                maze.remove_wall(y, x, y, x + 1)
+            if y < 69:
+                x = 89 if y % 2 == 0 else 0
+                maze.remove_wall(y, x, y + 1, x)
+        for name, solve in SOLVERS.items():
+            with self.assertRaises(JobCancelled, msg=name):
+                solve(maze, progress=stop)
+    
+    def test_job_events(self):
+        events = queue.Queue()
+        job = Job("测试", events)
+        job.run(lambda job, width: Maze(width, 5), 7)
+        kind, source, maze = events.get_nowait()
+        self.assertEqual((kind, source, maze.width), ("done", job, 7))
+        
+        job = Job("测试", events)
+        job.cancel()
+        job.run(lambda job: GENERATORS["DFS-Iter"](Maze(90, 70), progress=job.report))
+        self.assertEqual(events.get_nowait()[0], "cancelled")
+        
+        job = Job("测试", events)
+        job.run(lambda job: Maze(3, 3, bytearray(2)))
+        kind, _, error = events.get_nowait()
+        self.assertEqual(kind, "error")
+        self.assertIsInstance(error, ValueError)
+        self.assertTrue(events.empty())
+
+
+class TestStepAPI(unittest.TestCase):
+    """逐步执行（动画）接口测试"""
+    
+    def test_generator_steps_replay_to_final_maze(self):
+        for name, steps in STEP_GENERATORS.items():
+            maze = Maze(23, 17)
+            replay = Maze(23, 17)
+            batches = list(steps(maze, batch_size=10))
+            self.assertTrue(all(1 <= len(batch) <= 10 for batch in batches), name)
+            for batch in batches:
+                for cell, neighbor in batch:
+                    replay.remove_wall(*divmod(cell, 23), *divmod(neighbor, 23))
+            replay.open_entrances()
             
-            for algo_name, algo_func in algorithms:
-                # 多次测试取平均值
-                gen_times = []
-                solve_times = []
-                path_lengths = []
-                
-                for _ in range(3):  # 每个算法运行3次取平均
-                    maze = Maze(width, height)
-                    
-                    # 生成迷宫
-                    start_time = time.time()
-                    algo_func(maze)
-                    gen_time = time.time() - start_time
-                    
-                    # 求解迷宫
-                    start_time = time.time()
-                    success = MazeSolver.solve_bfs(maze)
-                    solve_time = time.time() - start_time
-                    
-                    if success:
-                        gen_times.append(gen_time)
-                        solve_times.append(solve_time)
-                        path_lengths.append(len(maze.path) - 1)
-                
-                # 计算平均值
-                avg_gen = sum(gen_times) / len(gen_times) if gen_times else 0
-                avg_solve = sum(solve_times) / len(solve_times) if solve_times else 0
-                avg_path = sum(path_lengths) / len(path_lengths) if path_lengths else 0
-                
-                size_results.append({
-                    'algorithm': algo_name,
-                    'avg_generation_time': avg_gen,
-                    'avg_solution_time': avg_solve,
-                    'avg_path_length': avg_path
-                })
-                
-                print(f"\n{algo_name}算法:")
-                print(f"  平均生成时间: {avg_gen:.6f}秒")
-                print(f"  平均求解时间: {avg_solve:.6f}秒")
-                print(f"  平均路径长度: {avg_path:.1f}步")
-                print(f"  总时间: {(avg_gen + avg_solve):.6f}秒")
+            self.assertEqual(sum(len(batch) for batch in batches), 23 * 17 - 1, name)
+            self.assertEqual(bytes(replay.walls), bytes(maze.walls), name)
+            self.assertEqual(count_passages(maze), 23 * 17 - 1, name)
+    
+    def test_walls_change_between_batches(self):
+        maze = Maze(15, 15)
+        steps = MazeGenerator.generate_dfs_steps(maze, batch_size=5)
+        next(steps)
+        self.assertEqual(count_passages(maze), 5)
+        steps.close()
+    
+    def test_bfs_steps_match_flat_bfs(self):
+        rng = random.Random(11)
+        for batch_size in (1, 7, 64):
+            maze = Maze(31, 19)
+            MazeGenerator.generate_kruskal(maze)
+            add_loops(maze, rng)
+            maze.end = (rng.randrange(19), rng.randrange(31))
+            MazeSolver.solve_bfs_flat(maze)
+            expected_path, expected_expanded = maze.path, maze.nodes_expanded
             
-            results[(width, height)] = size_results
+            steps = STEP_SOLVERS["BFS"](maze, batch_size)
+            expanded = []
+            while True:
+                try:
+                    expanded.extend(next(steps))
+                except StopIteration as stop:
+                    self.assertTrue(stop.value)
+                    break
+            self.assertEqual(maze.path, expected_path)
+            self.assertEqual(len(expanded), expected_expanded)
+            self.assertEqual(len(set(expanded)), len(expanded))
+            self.assertEqual(expanded[-1], maze.end[0] * 31 + maze.end[1])
+    
+    def test_bfs_steps_unsolvable(self):
+        maze = Maze(6, 6)
+        steps = MazeSolver.solve_bfs_steps(maze, batch_size=4)
+        self.assertEqual(list(steps), [[0]])
+
+
+class TestMoreGenerators(unittest.TestCase):
+    """新增生成算法测试"""
+    
+    def assert_perfect(self, maze, name):
+        self.assertEqual(count_passages(maze), maze.width * maze.height - 1, name)
+        # MazeIndex 在有环或不连通时抛出 ValueError
+        MazeIndex(maze)
+        self.assertFalse(maze.walls[0] & 8, name)
+        self.assertFalse(maze.walls[-1] & 2, name)
+    
+    def test_all_generators_make_perfect_mazes(self):
+        for name, generate in GENERATORS.items():
+            for width, height in [(1, 1), (1, 9), (9, 1), (2, 2), (17, 11)]:
+                maze = Maze(width, height)
+                generate(maze)
+                self.assert_perfect(maze, f"{name} {width}x{height}")
+    
+    def test_seed_is_fourth_positional_argument(self):
+        # 所有生成算法的签名都是 (maze, progress, stats, seed)
+        for name, generate in GENERATORS.items():
+            positional, keyword = Maze(12, 9), Maze(12, 9)
+            generate(positional, None, None, 21)
+            generate(keyword, seed=21)
+            self.assertEqual(positional.seed, 21, name)
+            self.assertEqual(positional.walls, keyword.walls, name)
+    
+    def test_growing_tree_ratio_extremes(self):
+        for ratio in (0.0, 1.0):
+            maze = Maze(25, 25)
+            MazeGenerator.generate_growing_tree(maze, newest_ratio=ratio)
+            self.assert_perfect(maze, ratio)
+    
+    def test_row_generators_stream(self):
+        for rows in (MazeGenerator.generate_sidewinder_rows, MazeGenerator.generate_binary_tree_rows):
+            produced = list(rows(13, 7))
+            self.assertEqual([len(row) for row in produced], [13] * 7)
+            self.assert_perfect(Maze(13, 7, bytearray(b"".join(produced))), rows.__name__)
+    
+    def test_uniform_spanning_trees(self):
+        # 2x2 网格恰有 4 棵生成树，均匀算法应各约占 1/4
+        for generate in (MazeGenerator.generate_wilson, MazeGenerator.generate_aldous_broder):
+            rng = random.Random(17)
+            counts = {}
+            for _ in range(2000):
+                maze = Maze(2, 2)
+                generate(maze, seed=rng)
+                counts[bytes(maze.walls)] = counts.get(bytes(maze.walls), 0) + 1
+            self.assertEqual(len(counts), 4)
+            for count in counts.values():
+                self.assertTrue(400 < count < 600, counts)
+
+
+class TestSeededGeneration(unittest.TestCase):
+    """按种子复现生成结果"""
+    
+    def generate(self, name, seed, width=23, height=17):
+        maze = Maze(width, height)
+        GENERATORS[name](maze, seed=seed)
+        return maze
+    
+    def test_same_seed_same_maze(self):
+        for name in GENERATORS:
+            first = self.generate(name, 12345)
+            second = self.generate(name, 12345)
+            self.assertEqual(first.walls, second.walls, name)
+            self.assertEqual(first.seed, 12345, name)
+            self.assertNotEqual(first.walls, self.generate(name, 54321).walls, name)
+    
+    def test_global_random_state_untouched(self):
+        state = random.getstate()
+        for name in GENERATORS:
+            self.generate(name, 3)
+        self.assertEqual(random.getstate(), state)
+    
+    def test_unseeded_maze_records_seed(self):
+        for name in GENERATORS:
+            maze = self.generate(name, None)
+            self.assertIsInstance(maze.seed, int, name)
+            self.assertEqual(self.generate(name, maze.seed).walls, maze.walls, name)
+    
+    def test_rng_instances(self):
+        generators = [random.Random(9)]
+        if np is not None:
+            generators.append(np.random.default_rng(9))
+        for rng in generators:
+            maze = self.generate("Kruskal", rng)
+            self.assertIsInstance(maze.seed, int)
+            self.assertEqual(self.generate("Kruskal", maze.seed).walls, maze.walls)
+        with self.assertRaises(TypeError):
+            self.generate("Kruskal", "9")
+    
+    def test_seed_out_of_range(self):
+        # 所有算法与 .maze 文件头共用同一取值范围 [0, 2**64)
+        for seed in (-1, 2 ** 64):
+            for name in ("Kruskal", "Kruskal-NumPy", "Eller"):
+                with self.assertRaises(ValueError):
+                    self.generate(name, seed)
+            with self.assertRaises(ValueError):
+                batch.generate_one(5, 5, "Prim", seed)
+        maze = self.generate("Kruskal-NumPy", 2 ** 64 - 1)
+        self.assertEqual(maze_io.loads(maze_io.dumps(maze)).seed, 2 ** 64 - 1)
+    
+    def test_step_and_row_generators_match(self):
+        for name in STEP_GENERATORS:
+            maze = Maze(23, 17)
+            for _ in STEP_GENERATORS[name](maze, seed=77):
+                pass
+            self.assertEqual(maze.walls, self.generate(name, 77).walls, name)
+        for name, rows in (("Eller", MazeGenerator.generate_eller_rows),
+                           ("Sidewinder", MazeGenerator.generate_sidewinder_rows),
+                           ("Binary Tree", MazeGenerator.generate_binary_tree_rows)):
+            self.assertEqual(b"".join(rows(23, 17, 77)), bytes(self.generate(name, 77).walls), name)
+    
+    def test_concurrent_threads_deterministic(self):
+        from concurrent.futures import ThreadPoolExecutor
+        tasks = [(name, seed) for name in ("DFS-Iter", "Prim", "Wilson") for seed in range(6)]
+        expected = [bytes(batch.generate_one(20, 20, name, seed).walls) for name, seed in tasks]
+        with ThreadPoolExecutor(4) as executor:
+            actual = list(executor.map(
+                lambda task: bytes(batch.generate_one(20, 20, *task).walls), tasks))
+        self.assertEqual(actual, expected)
+
+
+class TestMazeFile(unittest.TestCase):
+    """二进制迷宫文件测试"""
+    
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "test.maze")
+    
+    def tearDown(self):
+        self.tmpdir.cleanup()
+    
+    def make_maze(self):
+        maze = Maze(23, 14)
+        MazeGenerator.generate_kruskal(maze)
+        maze.start = (3, 4)
+        maze.algorithm = "Kruskal"
+        maze.seed = 2 ** 40 + 7
+        return maze
+    
+    def assert_same_maze(self, loaded, maze):
+        self.assertEqual((loaded.width, loaded.height), (maze.width, maze.height))
+        self.assertEqual((loaded.start, loaded.end), (maze.start, maze.end))
+        self.assertEqual((loaded.algorithm, loaded.seed), (maze.algorithm, maze.seed))
+        self.assertEqual(bytes(loaded.walls), bytes(maze.walls))
+    
+    def test_round_trip(self):
+        maze = self.make_maze()
+        maze_io.save_maze(maze, self.path)
+        self.assertEqual(os.path.getsize(self.path), maze_io.HEADER_SIZE + 23 * 14)
+        for lazy in (True, False):
+            self.assert_same_maze(maze_io.load_maze(self.path, lazy=lazy), maze)
+        self.assert_same_maze(maze_io.loads(maze_io.dumps(maze)), maze)
+    
+    def test_lazy_maze_is_solvable_and_copy_on_write(self):
+        maze = self.make_maze()
+        maze_io.save_maze(maze, self.path)
+        loaded = maze_io.load_maze(self.path)
+        self.assertIsInstance(loaded.walls, memoryview)
+        self.assertTrue(MazeSolver.solve_bfs(loaded))
+        expected = loaded.path
+        self.assertTrue(MazeSolver.solve_bfs_flat(loaded))
+        self.assertEqual(loaded.path, expected)
         
-        # 比较算法性能
-        print(f"\n{'='*60}")
-        print("算法性能比较:")
-        print(f"{'='*60}")
-        print(f"{'迷宫尺寸':<12} {'算法':<10} {'生成时间(秒)':<15} {'求解时间(秒)':<15} {'总时间(秒)':<15}")
-        print("-" * 60)
+        loaded.walls[0] = ALL_WALLS
+        self.assert_same_maze(maze_io.load_maze(self.path), maze)
+    
+    def test_write_streamed_rows(self):
+        rows = MazeGenerator.generate_eller_rows(40, 25)
+        maze_io.write_rows(self.path, 40, 25, rows, algorithm="Eller")
+        loaded = maze_io.load_maze(self.path)
+        self.assertEqual(loaded.algorithm, "Eller")
+        self.assertIsNone(loaded.seed)
+        self.assertEqual(count_passages(loaded), 40 * 25 - 1)
+    
+    def test_rejects_invalid_files(self):
+        with open(self.path, "wb") as f:
+            f.write(b"JSON" + bytes(100))
+        with self.assertRaises(ValueError):
+            maze_io.load_maze(self.path)
+        
+        maze_io.save_maze(self.make_maze(), self.path)
+        with open(self.path, "r+b") as f:
+            f.truncate(maze_io.HEADER_SIZE + 10)
+        with self.assertRaises(ValueError):
+            maze_io.load_maze(self.path)
+
+
+class TestMazeCache(unittest.TestCase):
+    """按生成参数寻址的缓存测试"""
+    
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.generated = []
+        original = GENERATORS["Kruskal"]
+        def counting(maze, *args, **kwargs):
+            self.generated.append((maze.width, maze.height))
+            return original(maze, *args, **kwargs)
+        GENERATORS["Kruskal"] = counting
+        self.addCleanup(GENERATORS.__setitem__, "Kruskal", original)
+    
+    def tearDown(self):
+        self.tmpdir.cleanup()
+    
+    def test_repeat_requests_skip_generator(self):
+        maze_cache = cache.MazeCache()
+        first = maze_cache.get_maze(20, 15, "Kruskal", 7)
+        first.walls[0] = 0  # 修改副本不影响缓存
+        second = maze_cache.get_maze(20, 15, "Kruskal", 7)
+        self.assertEqual(len(self.generated), 1)
+        self.assertEqual(second.walls, batch.generate_one(20, 15, "Kruskal", 7).walls)
+        self.assertEqual(second.seed, 7)
+        stats = maze_cache.stats()
+        self.assertEqual((stats["maze_hits"], stats["maze_misses"]), (1, 1))
+        self.assertEqual(stats["maze_hit_rate"], 0.5)
+    
+    def test_unseeded_request_cached_under_recorded_seed(self):
+        maze_cache = cache.MazeCache()
+        maze = maze_cache.get_maze(10, 10, "Kruskal")
+        self.assertEqual(maze_cache.get_maze(10, 10, "Kruskal", maze.seed).walls, maze.walls)
+        self.assertEqual(len(self.generated), 1)
+    
+    def test_lru_bounded_by_bytes(self):
+        entry = 30 * 30 + cache.ENTRY_OVERHEAD
+        maze_cache = cache.MazeCache(max_bytes=2 * entry)
+        maze_cache.get_maze(30, 30, "Kruskal", 1)
+        maze_cache.get_maze(30, 30, "Kruskal", 2)
+        maze_cache.get_maze(30, 30, "Kruskal", 1)  # 1 变为最近使用
+        maze_cache.get_maze(30, 30, "Kruskal", 3)  # 淘汰 2
+        self.assertEqual(maze_cache.stats()["bytes"], 2 * entry)
+        self.assertEqual(maze_cache.stats()["evictions"], 1)
+        maze_cache.get_maze(30, 30, "Kruskal", 1)
+        self.assertEqual(len(self.generated), 3)
+        maze_cache.get_maze(30, 30, "Kruskal", 2)
+        self.assertEqual(len(self.generated), 4)
+        # 超过总容量的条目不进入内存层
+        maze_cache.get_maze(100, 100, "Kruskal", 1)
+        self.assertLessEqual(maze_cache.stats()["bytes"], 2 * entry)
+    
+    def test_disk_tier(self):
+        maze = cache.MazeCache(directory=self.tmpdir.name).get_maze(25, 12, "Kruskal", 99)
+        reopened = cache.MazeCache(directory=self.tmpdir.name)
+        loaded = reopened.get_maze(25, 12, "Kruskal", 99)
+        self.assertEqual(len(self.generated), 1)
+        self.assertEqual(loaded.walls, maze.walls)
+        self.assertEqual(reopened.stats()["disk_hits"], 1)
+        reopened.get_maze(25, 12, "Kruskal", 99)
+        self.assertEqual(reopened.stats()["maze_hits"], 1)
+    
+    def test_solution_per_endpoints(self):
+        maze_cache = cache.MazeCache()
+        solved = maze_cache.solve(20, 20, "Kruskal", 5)
+        expected = batch.generate_one(20, 20, "Kruskal", 5)
+        MazeSolver.solve_bfs(expected)
+        self.assertEqual(solved.path, expected.path)
+        self.assertEqual(maze_cache.solve(20, 20, "Kruskal", 5).path, expected.path)
+        
+        other = maze_cache.solve(20, 20, "Kruskal", 5, start=(3, 4), end=(15, 2))
+        self.assertEqual((other.path[0], other.path[-1]), ((3, 4), (15, 2)))
+        maze_cache.solve(20, 20, "Kruskal", 5, start=(3, 4), end=(15, 2))
+        stats = maze_cache.stats()
+        self.assertEqual((stats["solution_hits"], stats["solution_misses"]), (2, 2))
+        self.assertEqual(stats["generated"], 1)
+        with self.assertRaises(ValueError):
+            maze_cache.solve(20, 20, "Kruskal", 5, solver="nope")
+
+
+class TestCLI(unittest.TestCase):
+    """无界面命令行测试"""
+    
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+    
+    def tearDown(self):
+        self.tmpdir.cleanup()
+    
+    def run_cli(self, *argv):
+        output = StringIO()
+        with redirect_stdout(output):
+            code = cli.main(list(argv))
+        return code, output.getvalue()
+    
+    def test_generate_stream_and_solve(self):
+        path = os.path.join(self.tmpdir.name, "stream.maze")
+        self.assertEqual(self.run_cli("generate", "--size", "12x8", "--count", "3",
+                                      "--seed", "5", "-o", path)[0], 0)
+        with open(path, "rb") as f:
+            mazes = list(maze_io.read_mazes(f))
+        self.assertEqual([maze.seed for maze in mazes], [batch.derive_seed(5, i) for i in range(3)])
+        for maze in mazes:
+            self.assertEqual(maze.walls, batch.generate_one(12, 8, "Kruskal", maze.seed).walls)
+        
+        code, output = self.run_cli("solve", path, "--format", "json", "--path")
+        records = [json.loads(line) for line in output.splitlines()]
+        self.assertEqual(code, 0)
+        self.assertEqual(len(records), 3)
+        for maze, record in zip(mazes, records):
+            MazeSolver.solve_bfs(maze)
+            self.assertEqual([tuple(cell) for cell in record["path"]], maze.path)
+            self.assertEqual(record["length"], len(maze.path) - 1)
+    
+    def test_invalid_seed_is_usage_error(self):
+        for seed in ("-3", str(2 ** 64), "abc"):
+            with redirect_stderr(StringIO()) as errors, self.assertRaises(SystemExit) as raised:
+                cli.main(["generate", "--size", "10", "--seed", seed])
+            self.assertEqual(raised.exception.code, 2, seed)
+            self.assertIn("--seed", errors.getvalue())
+    
+    def test_negative_workers_is_usage_error(self):
+        for command in ("generate", "solve"):
+            with redirect_stderr(StringIO()) as errors, self.assertRaises(SystemExit) as raised:
+                cli.main([command, "--size", "10", "--count", "2", "--workers", "-1"])
+            self.assertEqual(raised.exception.code, 2, command)
+            self.assertIn("--workers", errors.getvalue())
+    
+    def test_single_seed_used_verbatim(self):
+        code, output = self.run_cli("solve", "--size", "9", "--algorithm", "Prim",
+                                    "--seed", "42", "--format", "json")
+        record = json.loads(output)
+        self.assertEqual((record["seed"], record["algorithm"], record["width"]), (42, "Prim", 9))
+    
+    def test_directory_output_and_text(self):
+        directory = os.path.join(self.tmpdir.name, "out") + os.sep
+        self.run_cli("generate", "--size", "6", "--count", "2", "-o", directory)
+        self.assertEqual(sorted(os.listdir(directory)), ["maze-0.maze", "maze-1.maze"])
+        _, text = self.run_cli("generate", "--size", "4x3", "--seed", "1", "--format", "text")
+        self.assertEqual(len(text.splitlines()), 1 + 2 * 3 + 1)
+
+
+class TestMazeAnalysis(unittest.TestCase):
+    """结构分析测试：与逐格扫描和暴力求直径的结果对比"""
+    
+    def brute_force(self, maze):
+        degrees = [[len(maze.get_neighbors(y, x, with_walls=True)) for x in range(maze.width)]
+                   for y in range(maze.height)]
+        return degrees, longest_path(maze)
+    
+    def test_matches_brute_force(self):
+        for name in ["Kruskal", "DFS-Iter", "Prim", "Wilson"]:
+            maze = Maze(17, 11)
+            GENERATORS[name](maze, seed=5)
+            result = analysis.analyze(maze)
+            degrees, longest = self.brute_force(maze)
+            flat = [degree for row in degrees for degree in row]
+            
+            self.assertEqual(result["degree_counts"], [flat.count(d) for d in range(5)], name)
+            self.assertEqual(result["dead_ends"], flat.count(1))
+            self.assertEqual(result["diameter"], longest, name)
+            (y1, x1), (y2, x2) = result["diameter_ends"]
+            self.assertEqual(MazeSolver.bfs_tree(maze, (y1, x1))[1][y2 * 17 + x2], longest)
+            self.assertTrue(MazeSolver.solve_bfs(maze))
+            self.assertEqual(result["solution_length"], len(maze.path) - 1)
+            self.assertEqual(result["max_distance"], max(result["distances"]))
+            # 完美迷宫中通道格子恰为度数为 2 的格子
+            self.assertAlmostEqual(result["corridor_fraction"], flat.count(2) / (17 * 11))
+    
+    def test_straight_corridor(self):
+        maze = Maze(10, 1)
+        GENERATORS["Kruskal"](maze, seed=1)
+        result = analysis.analyze(maze)
+        self.assertEqual(result["dead_ends"], 2)
+        self.assertEqual(result["junctions"], 0)
+        self.assertEqual(result["branching_factor"], 0.0)
+        self.assertEqual(result["diameter"], 9)
+        self.assertEqual((result["corridors"], result["corridor_max"]), (1, 8))
+        self.assertEqual(list(result["distances"]), list(range(10)))
+    
+    def test_pure_python_fallback(self):
+        maze = Maze(40, 30)
+        GENERATORS["Growing Tree"](maze, seed=3)
+        expected = analysis.analyze(maze)
+        original = analysis.load_numpy
+        analysis.load_numpy = lambda: None
+        try:
+            fallback = analysis.analyze(maze)
+        finally:
+            analysis.load_numpy = original
+        self.assertEqual(fallback, expected)
+        self.assertGreater(expected["corridors"], 1)
+    
+    def test_loops_and_unreachable_cells(self):
+        maze = Maze(12, 12)
+        GENERATORS["Kruskal"](maze, seed=4)
+        add_loops(maze, random.Random(0), count=20)
+        # 封死一个角落的格子，使其不可达
+        maze.walls[11 * 12] = ALL_WALLS
+        maze.walls[10 * 12] |= WALL_BOTTOM
+        maze.walls[11 * 12 + 1] |= WALL_LEFT
+        result = analysis.analyze(maze)
+        self.assertEqual(result["reachable"], 143)
+        self.assertEqual(result["distances"][11 * 12], -1)
+        self.assertEqual(sum(result["degree_counts"]), 143)
+        self.assertLessEqual(result["diameter"], self.brute_force(maze)[1])
+    
+    def test_cli_and_benchmark(self):
+        output = StringIO()
+        with redirect_stdout(output):
+            code = cli.main(["analyze", "--size", "20x15", "--seed", "2", "--format", "json"])
+        record = json.loads(output.getvalue())
+        maze = batch.generate_one(20, 15, "Kruskal", 2)
+        expected = analysis.analyze(maze)
+        del expected["distances"]
+        self.assertEqual(code, 0)
+        self.assertEqual({key: record[key] for key in expected}, expected)
+        self.assertIn(("analyze", benchmark.ANALYZE_CASE, 20, 20),
+                      benchmark.plan_cases([(20, 20)], phases=("analyze",)))
+        self.assertEqual(len(benchmark.run_case("analyze", benchmark.ANALYZE_CASE, 20, 20,
+                                                repeat=2, warmup=0)), 2)
+
+
+class TestDiameterEndpoints(unittest.TestCase):
+    """起终点放在最长路径两端"""
+    
+    @staticmethod
+    def border_openings(maze):
+        """外圈上被打通的墙：[(y, x, 墙体位)]"""
+        openings = []
+        for y in range(maze.height):
+            for x in range(maze.width):
+                outer = maze.outer_walls(y, x)
+                if outer & ~maze.walls[y * maze.width + x]:
+                    openings.append((y, x, outer & ~maze.walls[y * maze.width + x]))
+        return openings
+    
+    def test_corner_entrances_unchanged(self):
+        maze = Maze(7, 5)
+        maze.open_entrances()
+        self.assertEqual(self.border_openings(maze), [(0, 0, WALL_LEFT), (4, 6, WALL_RIGHT)])
+        maze.close_entrances()
+        self.assertEqual(self.border_openings(maze), [])
+    
+    def test_endpoints_span_diameter(self):
+        for name, seed in [("Kruskal", 1), ("DFS-Iter", 2), ("Sidewinder", 3), ("Prim", 4)]:
+            maze = Maze(19, 13)
+            GENERATORS[name](maze, seed=seed)
+            longest = longest_path(maze)
+            self.assertEqual(analysis.place_on_diameter(maze), longest, name)
+            self.assertLess(maze.start, maze.end)
+            self.assertEqual(maze.path, [])
+            self.assertTrue(MazeSolver.solve_bfs(maze))
+            self.assertEqual(len(maze.path) - 1, longest)
+            # 只有位于外圈的端点有开口，原来的对角开口已封闭
+            openings = self.border_openings(maze)
+            on_border = [point for point in (maze.start, maze.end) if maze.outer_walls(*point)]
+            self.assertEqual([(y, x) for y, x, _ in openings], on_border, name)
+            for _, _, wall in openings:
+                self.assertIn(wall, (WALL_TOP, WALL_RIGHT, WALL_BOTTOM, WALL_LEFT))
+    
+    def test_batch_cli_and_file_round_trip(self):
+        maze = batch.generate_one(30, 20, "Kruskal", 8, endpoints="diameter")
+        plain = batch.generate_one(30, 20, "Kruskal", 8)
+        self.assertEqual(analysis.diameter(plain)[0], analysis.diameter(maze)[0])
+        restored = maze_io.loads(maze_io.dumps(maze))
+        self.assertEqual((restored.start, restored.end), (maze.start, maze.end))
+        self.assertEqual(restored.walls, maze.walls)
+        with self.assertRaises(ValueError):
+            batch.generate_one(30, 20, "Kruskal", 8, endpoints="随便")
+        
+        output = StringIO()
+        with redirect_stdout(output):
+            code = cli.main(["solve", "--size", "30x20", "--seed", "8", "--endpoints", "diameter",
+                             "--format", "json"])
+        record = json.loads(output.getvalue())
+        self.assertEqual(code, 0)
+        self.assertEqual((tuple(record["start"]), tuple(record["end"])), (maze.start, maze.end))
+        self.assertEqual(record["length"], analysis.diameter(plain)[0])
+
+
+class TestMazeService(unittest.TestCase):
+    """HTTP服务测试：在本机回环地址上启动服务，后端使用单个工作进程"""
+    
+    def serve(self, scenario, **options):
+        async def main():
+            service_ = await service.MazeService(workers=1, **options).start()
+            try:
+                return await scenario(service_)
+            finally:
+                await service_.close()
+        return asyncio.run(main())
+    
+    @staticmethod
+    async def fetch(port, target):
+        connection = loadgen.HttpConnection("127.0.0.1", port)
+        try:
+            return await connection.request("GET", target)
+        finally:
+            await connection.close()
+    
+    def test_generate_streams_big_maze(self):
+        async def scenario(server):
+            return await asyncio.gather(
+                self.fetch(server.port, "/generate?width=300&height=250&seed=9&format=maze"),
+                self.fetch(server.port, "/generate?width=30&algorithm=Prim&seed=9"))
+        (status, headers, data), (json_status, _, body) = self.serve(scenario)
+        
+        self.assertEqual(status, 200)
+        self.assertEqual(headers.get("transfer-encoding"), "chunked")
+        maze = maze_io.loads(data)
+        self.assertEqual((maze.width, maze.height, maze.seed), (300, 250, 9))
+        self.assertEqual(maze.walls, batch.generate_one(300, 250, "Kruskal", 9).walls)
+        
+        self.assertEqual(json_status, 200)
+        record = json.loads(body)
+        self.assertEqual((record["algorithm"], record["seed"]), ("Prim", 9))
+        self.assertEqual(bytes.fromhex(record["walls"]), batch.generate_one(30, 30, "Prim", 9).walls)
+    
+    def test_solve_and_errors(self):
+        async def scenario(server):
+            connection = loadgen.HttpConnection("127.0.0.1", server.port)
+            try:
+                return [await connection.request("GET", target) for target in (
+                    "/solve?width=25&height=15&seed=3&solver=A*&end=14,0",
+                    "/solve?width=25&solver=DFS",
+                    "/solve?width=25&start=99,0",
+                    "/generate?width=0",
+                    "/nowhere",
+                    "/generate?width=5&seed=-1",
+                    f"/generate?width=5&seed={2 ** 64}",
+                )], server.stats()
+            finally:
+                await connection.close()
+        responses, stats = self.serve(scenario)
+        
+        status, _, body = responses[0]
+        record = json.loads(body)
+        maze = batch.generate_one(25, 15, "Kruskal", 3)
+        maze.end = (14, 0)
+        self.assertTrue(SOLVERS["A*"](maze))
+        self.assertEqual(status, 200)
+        self.assertEqual([tuple(cell) for cell in record["path"]], maze.path)
+        self.assertEqual(record["length"], len(maze.path) - 1)
+        self.assertEqual([status for status, _, _ in responses[1:]], [400, 400, 400, 404, 400, 400])
+        self.assertIn("error", json.loads(responses[1][2]))
+        self.assertEqual(stats["requests"], 7)
+    
+    def test_json_body_types(self):
+        bodies = [
+            {"width": 12, "height": 8, "seed": 2, "algorithm": "Prim", "start": [7, 0], "path": False},
+            {"width": 12, "algorithm": ["Kruskal"]},
+            {"width": 12, "solver": 5},
+            {"width": 12.7},
+            {"width": 12, "height": True},
+            {"width": 12, "seed": 3.5},
+            {"width": 12, "start": [0.5, 1]},
+            [12, 8],
+        ]
+        
+        async def scenario(server):
+            connection = loadgen.HttpConnection("127.0.0.1", server.port)
+            try:
+                return [await connection.request("POST", "/solve", json.dumps(body).encode())
+                        for body in bodies], server.stats()
+            finally:
+                await connection.close()
+        responses, stats = self.serve(scenario)
+        
+        status, _, body = responses[0]
+        record = json.loads(body)
+        self.assertEqual(status, 200)
+        self.assertEqual((record["algorithm"], record["seed"], record["start"]), ("Prim", 2, [7, 0]))
+        self.assertNotIn("path", record)
+        self.assertEqual([status for status, _, _ in responses[1:]], [400] * 7)
+        for _, _, body in responses[1:]:
+            self.assertIn("error", json.loads(body))
+        self.assertEqual(stats["errors"], 0)
+    
+    def test_malformed_content_length(self):
+        async def send_raw(port, length):
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            try:
+                writer.write(f"POST /solve HTTP/1.1\r\nContent-Length: {length}\r\n\r\n{{}}".encode())
+                await writer.drain()
+                status_line = await reader.readline()
+                rest = await reader.read()      # 出错后服务端关闭连接
+                return int(status_line.split()[1]), rest
+            finally:
+                writer.close()
+        
+        async def scenario(server):
+            responses = [await send_raw(server.port, length)
+                         for length in ("abc", "-5", "1e3", str(service.MAX_BODY + 1))]
+            return responses, await self.fetch(server.port, "/health")
+        responses, (health, _, _) = self.serve(scenario)
+        self.assertEqual([status for status, _ in responses], [400, 400, 400, 413])
+        for _, rest in responses:
+            self.assertIn("error".encode(), rest)
+        self.assertEqual(health, 200)
+    
+    def test_identical_requests_coalesce(self):
+        target = "/solve?width=300&seed=11&path=0"
+        
+        async def scenario(server):
+            responses = await asyncio.gather(*(self.fetch(server.port, target) for _ in range(5)))
+            return responses, server.stats()
+        responses, stats = self.serve(scenario)
+        
+        self.assertEqual({status for status, _, _ in responses}, {200})
+        self.assertEqual(len({body for _, _, body in responses}), 1)
+        self.assertEqual(stats["coalesced"], 4)
+        self.assertEqual(stats["in_flight"], 0)
+    
+    def test_full_queue_rejects(self):
+        async def scenario(server):
+            responses = await asyncio.gather(*(
+                self.fetch(server.port, f"/generate?width=200&seed={seed}&format=maze")
+                for seed in range(5)))
+            return responses, server.stats()
+        responses, stats = self.serve(scenario, max_pending=1)
+        
+        statuses = [status for status, _, _ in responses]
+        self.assertIn(200, statuses)
+        self.assertIn(503, statuses)
+        self.assertEqual(statuses.count(503), stats["rejected"])
+        for status, headers, _ in responses:
+            if status == 503:
+                self.assertEqual(headers.get("retry-after"), "1")
+    
+    def test_diameter_endpoints(self):
+        async def scenario(server):
+            return await asyncio.gather(
+                self.fetch(server.port, "/solve?width=40&height=30&seed=6&endpoints=diameter&path=0"),
+                self.fetch(server.port, "/solve?width=40&seed=6&endpoints=diameter&start=0,0"))
+        (status, _, body), (conflict, _, _) = self.serve(scenario)
+        maze = batch.generate_one(40, 30, "Kruskal", 6, endpoints="diameter")
+        record = json.loads(body)
+        self.assertEqual(status, 200)
+        self.assertEqual((tuple(record["start"]), tuple(record["end"])), (maze.start, maze.end))
+        self.assertEqual(record["length"], analysis.diameter(maze)[0])
+        self.assertEqual(conflict, 400)
+    
+    def test_diameter_placement_cached(self):
+        self.addCleanup(setattr, service, "_worker_cache", None)
+        service._worker_cache = None
+        expected = batch.generate_one(60, 40, "Kruskal", 4, endpoints="diameter")
+        with mock.patch.object(cache, "place_on_diameter", wraps=analysis.place_on_diameter) as placed:
+            first = service.generate_task(60, 40, "Kruskal", 4, "diameter")
+            second = service.generate_task(60, 40, "Kruskal", 4, "diameter")
+            solved = service.solve_task(60, 40, "Kruskal", 4, "BFS", None, None, "diameter")
+        self.assertEqual(placed.call_count, 1)
+        self.assertEqual(first, second)
+        self.assertEqual(first, maze_io.dumps(expected))
+        self.assertEqual(solved[:2], (expected.start, expected.end))
+        self.assertEqual(len(solved[3]) - 1, analysis.diameter(expected)[0])
+        # 对角起终点的请求不受影响
+        self.assertEqual(maze_io.loads(service.generate_task(60, 40, "Kruskal", 4)).start, (0, 0))
+    
+    def test_load_generator(self):
+        async def scenario(server):
+            targets = loadgen.make_targets("solve", 20, seeds=5, rng=random.Random(0))
+            return await loadgen.run_load("127.0.0.1", server.port, targets,
+                                          requests=40, concurrency=4)
+        result = self.serve(scenario)
+        
+        self.assertEqual(result["requests"], 40)
+        self.assertEqual(result["statuses"], {200: 40})
+        self.assertGreater(result["rps"], 0)
+        self.assertLessEqual(result["p50"], result["p90"])
+        self.assertLessEqual(result["p90"], result["p99"])
+        self.assertLessEqual(result["p99"], result["max"])
+        self.assertIn("p99", loadgen.format_load_report(result))
+
+
+class TestImportTime(unittest.TestCase):
+    """引擎与界面分离后的导入开销测试"""
+    
+    # 命令行入口冷启动导入耗时上限；本机实测约 30ms，留出充足余量
+    CLI_IMPORT_BUDGET_NS = 300_000_000
+    
+    def test_package_import_is_lazy(self):
+        _, modules = benchmark.measure_import("maze", repeat=1)
+        self.assertFalse({"maze.generators", "maze.solvers", "tkinter", "numpy"} & modules)
+    
+    def test_cli_import_fast_without_gui(self):
+        samples, modules = benchmark.measure_import("maze.cli", repeat=3)
+        self.assertFalse({"tkinter", "numpy", "concurrent.futures.process"} & modules)
+        self.assertLess(statistics.median(samples), self.CLI_IMPORT_BUDGET_NS)
+    
+    def test_main_compatibility_exports(self):
+        import maze
+        import main
+        self.assertIs(main.Maze, maze.Maze)
+        self.assertIs(main.GENERATORS, GENERATORS)
+        _, modules = benchmark.measure_import("main", repeat=1)
+        self.assertNotIn("tkinter", modules)
+
+
+class TestBatchGeneration(unittest.TestCase):
+    """多进程批量生成测试"""
+    
+    specs = [(12, 9, "DFS-Iter"), (7, 7, "Kruskal"), (10, 4, "Eller"), (5, 5, "DFS", 99)]
+    
+    def test_deterministic_across_workers_and_order(self):
+        inline = list(batch.generate_batch(self.specs, workers=0, base_seed=42))
+        self.assertEqual([index for index, _ in inline], [0, 1, 2, 3])
+        
+        pooled = list(batch.generate_batch(self.specs, workers=2, chunksize=1, base_seed=42))
+        self.assertEqual(pooled, inline)
+        
+        unordered = batch.generate_batch(self.specs, workers=2, ordered=False, base_seed=42)
+        self.assertEqual(sorted(unordered), inline)
+    
+    def test_results_are_serialized_mazes(self):
+        results = dict(batch.generate_batch(self.specs, workers=0, base_seed=5))
+        maze = maze_io.loads(results[3])
+        self.assertEqual((maze.width, maze.height, maze.algorithm, maze.seed), (5, 5, "DFS", 99))
+        self.assertEqual(count_passages(maze), 24)
+        self.assertEqual(maze_io.loads(results[0]).seed, batch.derive_seed(5, 0))
+    
+    def test_unknown_algorithm(self):
+        with self.assertRaises(ValueError):
+            list(batch.generate_batch([(5, 5, "Nope")], workers=0))
+
+
+class TestBenchmark(unittest.TestCase):
+    """基准测试工具测试"""
+    
+    def test_summarize(self):
+        stats = benchmark.summarize(list(range(1, 21)))
+        self.assertEqual(stats["n"], 20)
+        self.assertEqual(stats["median"], 10.5)
+        self.assertEqual(stats["p95"], 19)
+        self.assertEqual((stats["min"], stats["max"]), (1, 20))
+        self.assertAlmostEqual(stats["stddev"], 5.9160797, places=5)
+        self.assertEqual(benchmark.summarize([7])["stddev"], 0.0)
+    
+    def test_measure_discards_warmup_and_skips_setup(self):
+        calls = []
+        samples = benchmark.measure(calls.append, setup=lambda: "x", repeat=4, warmup=2, number=3,
+                                    before_sample=lambda i: calls.append(i))
+        self.assertEqual(len(samples), 4)
+        self.assertEqual(calls, [0, "x", "x", "x", 1, "x", "x", "x", 2, "x", "x", "x",
+                                 3, "x", "x", "x", 4, "x", "x", "x", 5, "x", "x", "x"])
+    
+    def test_plan_skips_deep_recursion(self):
+        cases = benchmark.plan_cases([(10, 10), (500, 500)], ["DFS", "Kruskal"], ["BFS"])
+        self.assertIn(("generate", "DFS", 10, 10), cases)
+        self.assertNotIn(("generate", "DFS", 500, 500), cases)
+        self.assertIn(("solve", "BFS", 500, 500), cases)
+        with self.assertRaises(ValueError):
+            benchmark.plan_cases([(10, 10)], ["不存在"])
+        # 慢的均匀生成树算法默认不测，点名时才测
+        default = {name for phase, name, _, _ in benchmark.plan_cases([(10, 10)]) if phase == "generate"}
+        self.assertEqual(default, set(GENERATORS) - set(benchmark.SLOW_GENERATORS))
+        self.assertIn(("generate", "Wilson", 10, 10), benchmark.plan_cases([(10, 10)], ["Wilson"]))
+        with self.assertRaises(ValueError):
+            benchmark.plan_cases([(10, 10)], phases=("alloc", "slove"))
+    
+    def test_cli_rejects_bad_arguments(self):
+        for argv in (["--phases", "alloc,slove"], ["--repeat", "0"], ["--warmup", "-1"],
+                     ["--seed", "-1"], ["--seed", str(2 ** 64)]):
+            with redirect_stderr(StringIO()), self.assertRaises(SystemExit) as raised:
+                benchmark.main(["--sizes", "5x5"] + argv)
+            self.assertEqual(raised.exception.code, 2, argv)
+    
+    def test_json_round_trip_and_compare(self):
+        result = benchmark.run_benchmark(sizes=[(12, 8)], generators=["Kruskal"], solvers=["BFS"],
+                                         repeat=2, warmup=0)
+        self.assertEqual([row["phase"] for row in result["results"]], ["alloc", "generate", "solve"])
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "baseline.json")
+            benchmark.save_json(result, path)
+            baseline = benchmark.load_json(path)
+        self.assertEqual(baseline["results"], result["results"])
         
-        for size, size_results in results.items():
-            for result in size_results:
-                total_time = result['avg_generation_time'] + result['avg_solution_time']
-                print(f"{f'{size[0]}x{size[1]}':<12} {result['algorithm']:<10} "
-                      f"{result['avg_generation_time']:<15.6f} "
-                      f"{result['avg_solution_time']:<15.6f} "
-                      f"{total_time:<15.6f}")
+        slower = json.loads(json.dumps(result))
+        slower["results"][1]["stats"]["median"] *= 2
+        faster = json.loads(json.dumps(result))
+        faster["results"][2]["stats"]["median"] /= 2
+        statuses = [row[4] for row in benchmark.compare(slower, baseline)]
+        self.assertEqual(statuses, ["ok", "regression", "ok"])
+        statuses = [row[4] for row in benchmark.compare(faster, baseline)]
+        self.assertEqual(statuses, ["ok", "ok", "improvement"])
+
+
+class TestInstrumentation(unittest.TestCase):
+    """性能分析计数器测试"""
+    
+    def test_counting_disjoint_set_matches_plain(self):
+        rng = random.Random(3)
+        xs = [rng.randrange(200) for _ in range(500)]
+        ys = [rng.randrange(200) for _ in range(500)]
+        plain = DisjointSet(200)
+        counting = CountingDisjointSet(200)
+        self.assertEqual(plain.union_many(xs, ys), counting.union_many(xs, ys))
+        self.assertEqual(list(plain.parent), list(counting.parent))
+        self.assertEqual(counting.union_calls, 500)
+        self.assertEqual(counting.finds, 1000)
+        self.assertEqual(counting.unions, 200 - counting.components)
+    
+    def test_stats_do_not_change_results(self):
+        for name, generate in GENERATORS.items():
+            mazes = []
+            for stats in (None, instrument.Stats()):
+                maze = Maze(30, 20)
+                generate(maze, stats=stats, seed=21)
+                mazes.append(bytes(maze.walls))
+            self.assertEqual(mazes[0], mazes[1], name)
+            self.assertEqual(stats["cells_visited"], 600, name)
+    
+    def test_bfs_queue_high_water(self):
+        maze = Maze(40, 30)
+        MazeGenerator.generate_kruskal(maze)
+        add_loops(maze, random.Random(8))
+        stats = instrument.Stats()
+        MazeSolver.solve_bfs_flat(maze, stats=stats)
+        
+        # 直接模拟队列求峰值
+        queue = deque([maze.start])
+        seen = {maze.start}
+        high_water = 1
+        while queue:
+            cell = queue.popleft()
+            if cell == maze.end:
+                break
+            for neighbor in maze.get_neighbors(*cell):
+                if neighbor not in seen:
+                    seen.add(neighbor)
+                    queue.append(neighbor)
+            high_water = max(high_water, len(queue))
+        self.assertEqual(stats["queue_high_water"], high_water)
+        self.assertEqual(stats["cells_visited"], len(seen))
+        self.assertEqual(stats["nodes_expanded"], maze.nodes_expanded)
+    
+    def test_dfs_stack_high_water_is_tree_depth(self):
+        maze = Maze(1, 25)
+        stats = instrument.Stats()
+        MazeGenerator.generate_dfs_iterative(maze, stats=stats)
+        self.assertEqual(stats["stack_high_water"], 25)
+    
+    def test_phases_memory_and_profile(self):
+        maze, stats = instrument.profile_run(40, 40, "Kruskal", "A*", trace_memory=True, profile=True)
+        self.assertTrue(maze.path)
+        phases = stats.as_dict()
+        self.assertEqual(list(phases), ["alloc", "generate", "solve"])
+        self.assertEqual(phases["generate"]["counters"]["unions"], 40 * 40 - 1)
+        self.assertGreater(phases["solve"]["counters"]["heap_pushes"], 0)
+        self.assertGreater(phases["generate"]["peak_memory"], 0)
+        self.assertIn("generate_kruskal", stats.report())
+
+
+class TestMazeIndex(unittest.TestCase):
+    """生成树路径索引测试"""
+    
+    def test_queries_match_bfs(self):
+        rng = random.Random(3)
+        for generator in (MazeGenerator.generate_dfs_iterative, MazeGenerator.generate_kruskal):
+            maze = Maze(25, 18)
+            generator(maze)
+            index = MazeIndex(maze)
+            for _ in range(30):
+                maze.start = (rng.randrange(18), rng.randrange(25))
+                maze.end = (rng.randrange(18), rng.randrange(25))
+                self.assertTrue(MazeSolver.solve_bfs_flat(maze))
+                self.assertEqual(index.path(maze.start, maze.end), maze.path)
+                self.assertEqual(index.distance(maze.start, maze.end), len(maze.path) - 1)
+    
+    def test_lca_and_solve(self):
+        maze = Maze(4, 1)
+        for x in range(3):
+            maze.remove_wall(0, x, 0, x + 1)
+        index = MazeIndex(maze, root=(0, 1))
+        self.assertEqual(index.lca((0, 0), (0, 3)), (0, 1))
+        self.assertEqual(index.distance((0, 3), (0, 3)), 0)
+        self.assertTrue(index.solve(maze))
+        self.assertEqual(maze.path, [(0, 0), (0, 1), (0, 2), (0, 3)])
+    
+    def test_rejects_non_perfect_maze(self):
+        maze = Maze(10, 10)
+        with self.assertRaises(ValueError):
+            MazeIndex(maze)
+        MazeGenerator.generate_dfs_iterative(maze)
+        add_loops(maze, random.Random(1))
+        with self.assertRaises(ValueError):
+            MazeIndex(maze)
+
+
+@unittest.skipIf(np is None, "需要NumPy")
+class TestKruskalNumpy(unittest.TestCase):
+    """向量化Kruskal生成器测试"""
+    
+    def test_generates_perfect_maze(self):
+        maze = Maze(31, 19)
+        MazeGenerator.generate_kruskal_numpy(maze)
+        self.assertEqual(count_passages(maze), 31 * 19 - 1)
+        self.assertTrue(MazeSolver.solve_bfs(maze))
+    
+    def test_matches_sequential_kruskal(self):
+        width, height = 17, 13
+        maze = Maze(width, height)
+        MazeGenerator.generate_kruskal_numpy(maze, seed=7)
+        
+        # 用同一随机排列逐边执行并查集，结果应完全一致
+        edges = [(y * width + x, y * width + x + 1, y, x, y, x + 1)
+                 for y in range(height) for x in range(width - 1)]
+        edges += [(y * width + x, (y + 1) * width + x, y, x, y + 1, x)
+                  for y in range(height - 1) for x in range(width)]
+        order = np.random.default_rng(7).permutation(len(edges))
+        expected = Maze(width, height)
+        dsu = DisjointSet(width * height)
+        for i in order:
+            cell1, cell2, y1, x1, y2, x2 = edges[i]
+            if dsu.union(cell1, cell2):
+                expected.remove_wall(y1, x1, y2, x2)
+        expected.open_entrances()
+        self.assertEqual(maze.walls, expected.walls)
+    
+    def test_degenerate_sizes(self):
+        for width, height in [(1, 1), (1, 9), (9, 1)]:
+            maze = Maze(width, height)
+            MazeGenerator.generate_kruskal_numpy(maze)
+            self.assertEqual(count_passages(maze), width * height - 1)
+    
+    def test_fallback_recorded_as_kruskal(self):
+        # 没有NumPy时退回的是另一种随机序列，记录的算法须能重新生成同一迷宫
+        from maze import generators
+        with mock.patch.object(generators, "load_numpy", return_value=None):
+            maze = batch.generate_one(20, 15, "Kruskal-NumPy", 3)
+            maze_cache = cache.MazeCache()
+            maze_cache.get_maze(20, 15, "Kruskal-NumPy", 3)
+            cached = maze_cache.get_maze(20, 15, "Kruskal-NumPy", 3)
+        self.assertEqual(maze.algorithm, "Kruskal")
+        self.assertEqual(maze.walls, batch.generate_one(20, 15, "Kruskal", 3).walls)
+        self.assertEqual(maze_io.loads(maze_io.dumps(maze)).algorithm, "Kruskal")
+        self.assertEqual((cached.algorithm, cached.walls), ("Kruskal", maze.walls))
+        self.assertEqual(maze_cache.stats()["maze_hits"], 1)
+
+
+class PerformanceTest:
+    """性能测试类"""
+    
+    @staticmethod
+    def run_comprehensive_performance_test(sizes=None, repeat=5):
+        """运行全面的性能测试，分配、生成、求解三个阶段分别计时"""
+        print("=" * 60)
+        print("迷宫生成与求解系统 - 性能测试报告")
+        print("=" * 60)
         
-        return results
+        result = benchmark.run_benchmark(sizes=sizes or benchmark.sweep(250), repeat=repeat)
+        print(benchmark.format_report(result))
+        return result
 
 
 def quick_test_random():
@@ -154,83 +1461,61 @@ def quick_test_custom(width, height):
     
     results = []
     
-    algorithms = [
-        ("DFS", MazeGenerator.generate_dfs),
-        ("Kruskal", MazeGenerator.generate_kruskal)
-    ]
-    
-    for algo_name, algo_func in algorithms:
+    for algo_name, algo_func in GENERATORS.items():
+        if algo_name == "DFS" and width * height > MAX_RECURSIVE_DFS_CELLS:
+            continue
         print(f"\n{'='*30}")
         print(f"{algo_name}算法测试:")
         print(f"{'='*30}")
         
-        # 运行3次取平均值
-        gen_times = []
-        solve_times = []
-        path_lengths = []
+        generation = benchmark.summarize(
+            benchmark.run_case("generate", algo_name, width, height, repeat=5))
         
-        for i in range(3):
-            print(f"\n第 {i+1} 次运行:")
-            maze = Maze(width, height)
-            
-            # 生成迷宫
-            start_time = time.time()
-            algo_func(maze)
-            gen_time = time.time() - start_time
-            
-            # 求解迷宫
-            start_time = time.time()
-            success = MazeSolver.solve_bfs(maze)
-            solve_time = time.time() - start_time
-            
-            if success:
-                gen_times.append(gen_time)
-                solve_times.append(solve_time)
-                path_lengths.append(len(maze.path) - 1)
-                
-                print(f"  生成时间: {gen_time:.4f}秒")
-                print(f"  求解时间: {solve_time:.4f}秒")
-                print(f"  路径长度: {len(maze.path)-1}步")
-            else:
-                print("  求解失败!")
+        maze = Maze(width, height)
+        algo_func(maze)
+        solution = benchmark.summarize(
+            benchmark.measure(lambda _: MazeSolver.solve_bfs_flat(maze), repeat=5))
+        if not maze.path:
+            print("  求解失败!")
+            continue
         
-        if gen_times and solve_times:
-            avg_gen = sum(gen_times) / len(gen_times)
-            avg_solve = sum(solve_times) / len(solve_times)
-            avg_path = sum(path_lengths) / len(path_lengths)
-            
-            results.append({
-                'algorithm': algo_name,
-                'avg_generation_time': avg_gen,
-                'avg_solution_time': avg_solve,
-                'avg_path_length': avg_path,
-                'total_time': avg_gen + avg_solve
-            })
-            
-            print(f"\n{algo_name}算法平均结果:")
-            print(f"  平均生成时间: {avg_gen:.4f}秒")
-            print(f"  平均求解时间: {avg_solve:.4f}秒")
-            print(f"  平均路径长度: {avg_path:.1f}步")
-            print(f"  平均总时间: {avg_gen + avg_solve:.4f}秒")
-    
-    # 比较两种算法
-    if len(results) == 2:
+        gen_time = generation["median"] / 1e9
+        solve_time = solution["median"] / 1e9
+        results.append({
+            'algorithm': algo_name,
+            'generation_time': gen_time,
+            'solution_time': solve_time,
+            'path_length': len(maze.path) - 1,
+            'total_time': gen_time + solve_time
+        })
+        
+        print(f"  生成时间: 中位数 {gen_time:.4f}秒, p95 {generation['p95'] / 1e9:.4f}秒, "
+              f"标准差 {generation['stddev'] / 1e9:.4f}秒")
+        print(f"  求解时间: 中位数 {solve_time:.4f}秒, p95 {solution['p95'] / 1e9:.4f}秒, "
+              f"标准差 {solution['stddev'] / 1e9:.4f}秒")
+        print(f"  路径长度: {len(maze.path) - 1}步")
+    
+    # 比较各算法
+    if len(results) >= 2:
         print(f"\n{'='*50}")
         print("算法性能比较:")
         print(f"{'='*50}")
         
-        faster_algo = results[0] if results[0]['total_time'] < results[1]['total_time'] else results[1]
-        slower_algo = results[1] if results[0]['total_time'] < results[1]['total_time'] else results[0]
+        faster_algo = min(results, key=lambda r: r['total_time'])
+        slower_algo = max(results, key=lambda r: r['total_time'])
         
         speedup = slower_algo['total_time'] / faster_algo['total_time'] if faster_algo['total_time'] > 0 else 0
         
-        print(f"较快的算法: {faster_algo['algorithm']}")
-        print(f"较慢的算法: {slower_algo['algorithm']}")
+        print(f"最快的算法: {faster_algo['algorithm']}")
+        print(f"最慢的算法: {slower_algo['algorithm']}")
         print(f"速度提升: {speedup:.2f}倍")
         
         # 路径长度比较
-        if results[0]['avg_path_length'] > 0 and results[1]['avg_path_length'] > 0:
-            path_ratio = results[0]['avg_path_length'] / results[1]['avg_path_length']
+        by_name = {r['algorithm']: r for r in results}
+        dfs_result = by_name.get('DFS')
+        kruskal_result = by_name.get('Kruskal')
+        if dfs_result and kruskal_result and dfs_result['path_length'] > 0 and kruskal_result['path_length'] > 0:
+            path_ratio = dfs_result['path_length'] / kruskal_result['path_length']
             print(f"路径长度比 (DFS/Kruskal): {path_ratio:.2f}")
     
     print(f"\n{'='*50}")
@@ -264,28 +1549,15 @@ def run_all_tests():
             performance_results = PerformanceTest.run_comprehensive_performance_test()
             print("\n性能测试完成!")
             
-            # 保存性能测试结果到文件
+            # 保存性能测试结果到文件，JSON 可作为之后对比的基线
             with open("performance_test_results.txt", "w") as f:
                 f.write("迷宫生成与求解系统 - 性能测试报告\n")
                 f.write("=" * 60 + "\n\n")
-                
-                for size, size_results in performance_results.items():
-                    f.write(f"迷宫尺寸: {size[0]} x {size[1]}\n")
-                    f.write("-" * 40 + "\n")
-                    
-                    for result in size_results:
-                        total_time = result['avg_generation_time'] + result['avg_solution_time']
-                        f.write(f"{result['algorithm']}算法:\n")
-                        f.write(f"  平均生成时间: {result['avg_generation_time']:.6f}秒\n")
-                        f.write(f"  平均求解时间: {result['avg_solution_time']:.6f}秒\n")
-                        f.write(f"  平均路径长度: {result['avg_path_length']:.1f}步\n")
-                        f.write(f"  总时间: {total_time:.6f}秒\n\n")
-                    
-                    f.write("\n")
-                
-                f.write("\n性能测试完成于: " + time.strftime("%Y-%m-%d %H:%M:%S") + "\n")
+                f.write(benchmark.format_report(performance_results))
+                f.write("\n\n性能测试完成于: " + time.strftime("%Y-%m-%d %H:%M:%S") + "\n")
+            benchmark.save_json(performance_results, "performance_test_results.json")
             
-            print("性能测试结果已保存到: performance_test_results.txt")
+            print("性能测试结果已保存到: performance_test_results.txt / .json")
             
         except Exception as e:
             print(f"性能测试出错: {e}")
@@ -307,38 +1579,27 @@ def stress_test():
         ("方形大迷宫", 30, 30)
     ]
     
+    # 超出递归深度限制的尺寸只测试显式栈版本
+    test_cases += [("迭代DFS大迷宫", 300, 300), ("迭代DFS宽迷宫", 1000, 200)]
+    
     for test_name, width, height in test_cases:
         print(f"\n测试: {test_name} ({width}x{height})")
         print("-" * 30)
         
+        generators = ["DFS", "Kruskal"] if width * height <= MAX_RECURSIVE_DFS_CELLS else ["DFS-Iter"]
         try:
-            maze = Maze(width, height)
-            
-            # 测试DFS
-            start = time.time()
-            MazeGenerator.generate_dfs(maze)
-            dfs_gen_time = time.time() - start
-            
-            start = time.time()
-            success1 = MazeSolver.solve_bfs(maze)
-            dfs_solve_time = time.time() - start
-            
-            # 测试Kruskal
-            maze2 = Maze(width, height)
-            start = time.time()
-            MazeGenerator.generate_kruskal(maze2)
-            kruskal_gen_time = time.time() - start
-            
-            start = time.time()
-            success2 = MazeSolver.solve_bfs(maze2)
-            kruskal_solve_time = time.time() - start
-            
-            if success1 and success2:
-                print(f"  DFS: 生成{dfs_gen_time:.3f}s, 求解{dfs_solve_time:.3f}s")
-                print(f"  Kruskal: 生成{kruskal_gen_time:.3f}s, 求解{kruskal_solve_time:.3f}s")
-            else:
-                print(f"  求解失败: DFS={success1}, Kruskal={success2}")
-                
+            for name in generators:
+                generation = benchmark.summarize(
+                    benchmark.run_case("generate", name, width, height, repeat=3))
+                maze = Maze(width, height)
+                GENERATORS[name](maze)
+                solution = benchmark.summarize(
+                    benchmark.measure(lambda _: MazeSolver.solve_bfs_flat(maze), repeat=3))
+                if maze.path:
+                    print(f"  {name}: 生成{generation['median'] / 1e9:.3f}s, "
+                          f"求解{solution['median'] / 1e9:.3f}s")
+                else:
+                    print(f"  求解失败: {name}")
         except Exception as e:
             print(f"  错误: {e}")
     
@@ -347,52 +1608,50 @@ def stress_test():
     print(f"{'='*50}")
 
 
-def benchmark_test():
-    """基准测试 - 运行多次随机测试"""
-    print("运行基准测试（10次随机测试）...")
+def benchmark_test(max_size=500, repeat=5, output=None, baseline=None):
+    """基准测试 - 按尺寸扫描，可保存结果并与基线对比，返回是否没有性能回退"""
+    print(f"运行基准测试（最大尺寸 {max_size}，每个用例 {repeat} 次）...")
     print("=" * 50)
     
-    all_results = []
+    result = benchmark.run_benchmark(
+        sizes=benchmark.sweep(max_size), repeat=repeat,
+        progress=lambda done, total: print(f"\r已完成 {done}/{total} 个用例", end=""))
+    print()
+    print(benchmark.format_report(result))
     
-    for i in range(10):
-        print(f"\n第 {i+1}/10 次随机测试:")
-        print("-" * 30)
-        
-        # 随机选择尺寸
-        width = random.randint(8, 25)
-        height = random.randint(8, 25)
-        
-        results = quick_test_custom(width, height)
-        all_results.extend(results)
+    if output:
+        benchmark.save_json(result, output)
+        print(f"结果已保存到: {output}")
     
-    # 汇总结果
-    if all_results:
-        print(f"\n{'='*50}")
-        print("基准测试汇总:")
-        print(f"{'='*50}")
-        
-        dfs_results = [r for r in all_results if r['algorithm'] == 'DFS']
-        kruskal_results = [r for r in all_results if r['algorithm'] == 'Kruskal']
-        
-        if dfs_results:
-            dfs_avg_gen = sum(r['avg_generation_time'] for r in dfs_results) / len(dfs_results)
-            dfs_avg_solve = sum(r['avg_solution_time'] for r in dfs_results) / len(dfs_results)
-            dfs_avg_total = sum(r['total_time'] for r in dfs_results) / len(dfs_results)
-            
-            print(f"DFS算法平均 (共{len(dfs_results)}次测试):")
-            print(f"  平均生成时间: {dfs_avg_gen:.4f}秒")
-            print(f"  平均求解时间: {dfs_avg_solve:.4f}秒")
-            print(f"  平均总时间: {dfs_avg_total:.4f}秒")
-        
-        if kruskal_results:
-            kruskal_avg_gen = sum(r['avg_generation_time'] for r in kruskal_results) / len(kruskal_results)
-            kruskal_avg_solve = sum(r['avg_solution_time'] for r in kruskal_results) / len(kruskal_results)
-            kruskal_avg_total = sum(r['total_time'] for r in kruskal_results) / len(kruskal_results)
-            
-            print(f"\nKruskal算法平均 (共{len(kruskal_results)}次测试):")
-            print(f"  平均生成时间: {kruskal_avg_gen:.4f}秒")
-            print(f"  平均求解时间: {kruskal_avg_solve:.4f}秒")
-            print(f"  平均总时间: {kruskal_avg_total:.4f}秒")
+    if baseline:
+        rows = benchmark.compare(result, benchmark.load_json(baseline))
+        print()
+        print(benchmark.format_comparison(rows))
+        regressions = [row for row in rows if row[4] == "regression"]
+        if regressions:
+            print(f"\n发现 {len(regressions)} 个性能回退")
+            return False
+    return True
+
+def batch_test():
+    """批量生成吞吐量测试 - 比较不同进程数"""
+    print("运行批量生成吞吐量测试...")
+    print("=" * 50)
+    
+    specs = [(60, 60, "Kruskal")] * 256
+    max_workers = os.cpu_count() or 1
+    worker_counts = sorted({1, 2, max_workers // 2 or 1, max_workers})
+    baseline = None
+    
+    print(f"{'进程数':<8} {'耗时(秒)':<12} {'迷宫/秒':<12} {'加速比':<8}")
+    print("-" * 50)
+    for workers in worker_counts:
+        start = time.time()
+        count = sum(1 for _ in batch.generate_batch(specs, workers=workers, base_seed=0))
+        elapsed = time.time() - start
+        if baseline is None:
+            baseline = elapsed
+        print(f"{workers:<8} {elapsed:<12.3f} {count / elapsed:<12.1f} {baseline / elapsed:<8.2f}")
 
 
 if __name__ == "__main__":
@@ -400,7 +1659,7 @@ if __name__ == "__main__":
     
     parser = argparse.ArgumentParser(description="迷宫生成与求解系统测试工具")
     parser.add_argument("--mode", 
-                       choices=["all", "quick", "performance", "custom", "random", "stress", "benchmark"], 
+                       choices=["all", "quick", "performance", "custom", "random", "stress", "benchmark", "batch"], 
                        default="random",  # 默认改为random
                        help="""测试模式: 
                             all(全部测试), 
@@ -409,10 +1668,15 @@ if __name__ == "__main__":
                             custom(自定义尺寸),
                             random(随机尺寸-默认),
                             stress(压力测试),
-                            benchmark(基准测试)""")
+                            benchmark(基准测试),
+                            batch(批量生成吞吐量)""")
     parser.add_argument("--width", type=int, default=10, help="迷宫宽度（custom模式使用）")
     parser.add_argument("--height", type=int, default=10, help="迷宫高度（custom模式使用）")
     parser.add_argument("--seed", type=int, help="随机种子，用于重现随机测试")
+    parser.add_argument("--max-size", type=int, default=500, help="基准测试的最大边长（benchmark模式使用）")
+    parser.add_argument("--repeat", type=int, default=5, help="每个基准用例的采样次数（benchmark模式使用）")
+    parser.add_argument("--output", help="把基准测试结果保存为JSON（benchmark模式使用）")
+    parser.add_argument("--baseline", help="与保存的JSON基线对比，有回退时退出码为1（benchmark模式使用）")
     
     args = parser.parse_args()
     
@@ -440,4 +1704,7 @@ if __name__ == "__main__":
     elif args.mode == "stress":
         stress_test()
     elif args.mode == "benchmark":
-        benchmark_test()
\ No newline at end of file
+        success = benchmark_test(args.max_size, args.repeat, args.output, args.baseline)
+        sys.exit(0 if success else 1)
+    elif args.mode == "batch":
+        batch_test()
\ No newline at end of file